@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+"""
+In this benchmark we compare per-request latency of urlopen and HTTPConnectionPool against LocalCodeforcesServer
+"""
+
+import argparse
+import statistics
+import time
+from urllib.request import urlopen
+
+from codeforces import CodeforcesAPI
+from codeforces import HTTPConnectionPool
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
+
+
+def measure(open_url, url, count):
+    latencies = []
+
+    for _ in range(count):
+        start = time.perf_counter()
+
+        with open_url(url) as response:
+            response.read()
+
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def measure_api(api, count):
+    latencies = []
+
+    for _ in range(count):
+        start = time.perf_counter()
+        list(api.user_rating('user1'))
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+
+    print('{:10}mean: {:8.1f}us  median: {:8.1f}us  p99: {:8.1f}us'.format(
+        name,
+        statistics.mean(latencies) * 1e6,
+        statistics.median(latencies) * 1e6,
+        latencies[int(len(latencies) * 0.99)] * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=2000, help='Number of requests')
+    args = parser.parse_args()
+
+    server = LocalCodeforcesServer(make_synthetic_data(contests=1, users=10, submissions_per_contest=10)).start()
+
+    url = server.base_url + 'user.rating?handle=user1'
+    pool = HTTPConnectionPool()
+
+    try:
+        report('urlopen', measure(urlopen, url, args.count))
+        report('pool', measure(pool.urlopen, url, args.count))
+
+        for name, pool_size in (('api', None), ('api+pool', 4)):
+            api = CodeforcesAPI(base_url=server.base_url, pool_size=pool_size, rate_limit=None)
+            report(name, measure_api(api, args.count))
+    finally:
+        pool.clear()
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
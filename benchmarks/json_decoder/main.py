@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+"""
+In this benchmark we compare JSON decoder backends on large user.ratedList and contest.status responses.
+
+Responses are generated by make_synthetic_data. Backends, which are not installed, are skipped.
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import time
+
+from codeforces.testing import make_synthetic_data
+from codeforces.utils import JsonDecoder
+
+
+def make_payloads(users, submissions):
+    data = make_synthetic_data(contests=1, users=users, submissions_per_contest=submissions)
+
+    return {
+        'user.ratedList': json.dumps({'status': 'OK', 'result': data['users']}).encode('utf-8'),
+        'contest.status': json.dumps({'status': 'OK', 'result': data['submissions']}).encode('utf-8')
+    }
+
+
+def measure(decoder, payload, repeat):
+    timings = []
+
+    # Garbage collection of the previous result should not be counted
+    gc.collect()
+    gc.disable()
+
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            decoder.loads(payload)
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=100000, help='Number of users in user.ratedList')
+    parser.add_argument('--submissions', type=int, default=100000, help='Number of submissions in contest.status')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs for every backend')
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.users, args.submissions)
+    backends = [backend for backend in JsonDecoder.BACKENDS if JsonDecoder.is_available(backend)]
+
+    for method, payload in payloads.items():
+        print('{} ({:.1f} MB):'.format(method, len(payload) / 1e6))
+
+        timings = {backend: measure(JsonDecoder(backend), payload, args.repeat) for backend in backends}
+
+        for backend in backends:
+            elapsed = timings[backend]
+
+            print('    {:8}{:8.1f} ms  {:8.1f} MB/s  x{:.1f} vs json'.format(
+                backend, elapsed * 1e3, len(payload) / elapsed / 1e6, timings['json'] / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+"""
+In this benchmark we build sets and dicts of Problem, Submission and User objects.
+
+Objects are hashed and compared by their natural keys: contest id and index of Problem, id of Submission
+and handle of User. They are compared with the previous implementation, which hashed a deep copy of all fields.
+Objects are created before timing, so only hashing and equality are measured.
+"""
+
+import argparse
+import copy
+import gc
+import time
+
+from codeforces import Problem
+from codeforces import Submission
+from codeforces import User
+
+
+def legacy_make_hash(o):
+    if isinstance(o, (set, tuple, list)):
+        return tuple([legacy_make_hash(e) for e in o])
+    elif not isinstance(o, dict):
+        return hash(o)
+
+    new_o = copy.deepcopy(o)
+    for k, v in new_o.items():
+        new_o[k] = legacy_make_hash(v)
+
+    return hash(tuple(frozenset(sorted(new_o.items()))))
+
+
+def legacy(cls):
+    """
+    Makes a subclass, which is hashed and compared by all fields like before natural keys were introduced
+    """
+    def __eq__(self, other):
+        return type(self) == type(other) and self._get_fields() == other._get_fields()
+
+    def __hash__(self):
+        return legacy_make_hash(self._get_fields())
+
+    return type('Legacy' + cls.__name__, (cls,), {'__slots__': (), '__eq__': __eq__, '__hash__': __hash__})
+
+
+def make_problem(i):
+    return {'contestId': 1 + i % 1000, 'index': 'ABCDE'[i // 1000 % 5], 'name': 'Problem', 'type': 'PROGRAMMING',
+            'points': 500.0, 'tags': ['implementation', 'math']}
+
+
+def make_submission(i):
+    return {'id': i, 'contestId': 1 + i % 1000, 'creationTimeSeconds': 1406480400 + i, 'relativeTimeSeconds': i,
+            'problem': make_problem(i), 'programmingLanguage': 'GNU C++11', 'verdict': 'OK', 'testset': 'TESTS',
+            'passedTestCount': 10, 'timeConsumedMillis': 15, 'memoryConsumedBytes': 1024,
+            'author': {'contestId': 1 + i % 1000, 'members': [{'handle': 'user{}'.format(i % 10000)}],
+                       'participantType': 'CONTESTANT', 'ghost': False}}
+
+
+def make_user(i):
+    return {'handle': 'user{}'.format(i), 'contribution': 0, 'rating': 1500, 'maxRating': 1500, 'rank': 'specialist',
+            'maxRank': 'specialist', 'lastOnlineTimeSeconds': 1406480400, 'registrationTimeSeconds': 1406480400,
+            'friendOfCount': 0}
+
+
+def measure(build, objects):
+    gc.collect()
+    gc.disable()
+
+    try:
+        start = time.perf_counter()
+        build(objects)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1000000, help='Number of objects of every class')
+    parser.add_argument('--legacy-count', type=int, default=100000,
+                        help='Number of objects for the previous implementation, which is much slower')
+    args = parser.parse_args()
+
+    cases = [
+        ('set of problems', Problem, make_problem, set),
+        ('dict of submissions', Submission, make_submission, lambda objects: {o: None for o in objects}),
+        ('dict of users', User, make_user, lambda objects: {o: None for o in objects})
+    ]
+
+    print('{:22}{:>16}{:>16}{:>10}'.format('', 'natural key', 'all fields', 'speedup'))
+
+    for name, cls, make, build in cases:
+        values = [make(i) for i in range(args.count)]
+        legacy_cls = legacy(cls)
+
+        natural = measure(build, [cls(v) for v in values]) / args.count
+        fields = measure(build, [legacy_cls(v) for v in values[:args.legacy_count]]) / args.legacy_count
+
+        print('{:22}{:>11.2f} us/o{:>11.2f} us/o{:>9.0f}x'.format(name, natural * 1e6, fields * 1e6, fields / natural))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""
+In this benchmark we scan a table of submissions and read some of their fields.
+
+Submissions are made by Submission.from_dict eagerly and lazily, with and without validation of field types.
+Lazy objects keep source dicts and load every field on the first access, so the scan is cheaper
+if only a few fields are read. Source dicts are generated by make_synthetic_data.
+"""
+
+import argparse
+import gc
+import statistics
+import time
+from functools import partial
+
+from codeforces import Submission
+from codeforces.testing import make_synthetic_data
+
+
+SCANS = [
+    ('verdict', lambda s: s.verdict),
+    ('verdict, problem, time', lambda s: (s.verdict, s.problem.index, s.relative_time)),
+    ('all fields', lambda s: (s.id, s.contest_id, s.creation_time, s.relative_time, s.problem.name,
+                              s.author.members, s.programming_language, s.verdict, s.testset,
+                              s.passed_test_count, s.time_consumed, s.memory_consumed))
+]
+
+
+def measure(load, read, values, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+
+        try:
+            start = time.perf_counter()
+
+            for submission in map(load, values):
+                read(submission)
+
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    return len(values) / statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000, help='Number of submissions')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of scans for every case')
+    args = parser.parse_args()
+
+    values = make_synthetic_data(contests=1, users=1000, submissions_per_contest=args.count)['submissions']
+    modes = [('eager', False, True), ('lazy', True, True), ('eager, trusted', False, False),
+             ('lazy, trusted', True, False)]
+
+    print('{:24}'.format('fields read') + ''.join('{:>18}'.format(name) for name, _, _ in modes))
+
+    for name, read in SCANS:
+        results = [measure(partial(Submission.from_dict, validate=validate, lazy=lazy), read, values, args.repeat)
+                   for _, lazy, validate in modes]
+
+        print('{:24}'.format(name) + ''.join('{:>12.0f} obj/s'.format(result) for result in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+"""
+In this benchmark we measure throughput of making json objects from decoded responses, i.e. list(map(Submission, data)).
+
+Objects are loaded by loaders generated from field schemas, with and without validation of field types.
+The baseline is the former loading, which calls a property setter for every field,
+see load_required_fields_from_dict and load_optional_fields_from_dict.
+Source dicts are generated by make_synthetic_data. Nested objects are lazy, so they are not made.
+"""
+
+import argparse
+import gc
+import statistics
+import time
+from functools import partial
+
+from codeforces import BaseJsonObject
+from codeforces import Contest
+from codeforces import Problem
+from codeforces import RanklistRow
+from codeforces import RatingChange
+from codeforces import Submission
+from codeforces import User
+from codeforces.testing import make_synthetic_data
+
+
+def load_by_setters(cls, values):
+    obj = cls()
+    obj.load_required_fields_from_dict(values)
+    obj.load_optional_fields_from_dict(values)
+
+    return obj
+
+
+def measure(load, values, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+
+        try:
+            start = time.perf_counter()
+            list(map(load, values))
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    return len(values) / statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000, help='Number of objects of every class')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs for every class')
+    args = parser.parse_args()
+
+    data = make_synthetic_data(contests=1, users=args.count, submissions_per_contest=args.count)
+    sources = [(Submission, data['submissions']), (User, data['users']), (RanklistRow, data['ranklistRows']),
+               (RatingChange, data['ratingChanges']), (Problem, data['problems'] * (args.count // 5)),
+               (Contest, data['contests'] * args.count)]
+
+    print('{:14}{:>18}{:>18}{:>18}'.format('', 'setters', 'validated', 'not validated'))
+
+    for cls, values in sources:
+        setters = measure(partial(load_by_setters, cls), values, args.repeat)
+
+        BaseJsonObject.validate = True
+        validated = measure(cls, values, args.repeat)
+
+        BaseJsonObject.validate = False
+        not_validated = measure(cls, values, args.repeat)
+
+        print('{:14}{:>12.0f} obj/s{:>12.0f} obj/s{:>12.0f} obj/s'.format(cls.__name__, setters, validated,
+                                                                          not_validated))
+
+    BaseJsonObject.validate = True
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+"""
+In this benchmark we measure memory taken by one decoded object of Submission, User, RanklistRow and RatingChange.
+
+Objects with __slots__ are compared with objects of the same classes rebuilt with per-object __dict__,
+which is the layout used before the classes were slotted. Source dicts are generated by make_synthetic_data
+and are not counted. Nested objects (problem and author of Submission, party of RanklistRow) are counted
+only with --resolve-lazy, and they are slotted in both cases.
+"""
+
+import argparse
+import gc
+import tracemalloc
+import types
+
+from codeforces import BaseJsonObject
+from codeforces import RanklistRow
+from codeforces import RatingChange
+from codeforces import Submission
+from codeforces import User
+from codeforces.testing import make_synthetic_data
+
+
+LAZY_PROPERTIES = {
+    Submission: ('problem', 'author'),
+    RanklistRow: ('party', 'problem_results')
+}
+
+
+def with_dict(cls):
+    """
+    Makes a copy of the class without __slots__, so that its objects keep fields in __dict__
+    """
+    slots = set(cls.__dict__.get('__slots__', ()))
+    namespace = {name: value for name, value in cls.__dict__.items()
+                 if name not in slots and name not in ('__slots__', '__dict__', '__weakref__', '_object_class')}
+
+    # Otherwise slots would be made from _fields of the copy
+    namespace['__slots__'] = ('__dict__',)
+
+    copy = type(cls.__name__, (BaseJsonObject,), namespace)
+
+    # Methods calling super() refer to the original class, so they are rebound to the copy
+    for name, value in namespace.items():
+        if isinstance(value, types.FunctionType) and '__class__' in value.__code__.co_freevars:
+            closure = tuple(make_cell(copy) if var == '__class__' else cell
+                            for var, cell in zip(value.__code__.co_freevars, value.__closure__))
+            setattr(copy, name, types.FunctionType(value.__code__, value.__globals__, name, value.__defaults__,
+                                                   closure))
+
+    LAZY_PROPERTIES[copy] = LAZY_PROPERTIES.get(cls, ())
+
+    return copy
+
+
+def make_cell(value):
+    return (lambda: value).__closure__[0]
+
+
+def measure(cls, values, resolve_lazy):
+    """
+    :return: Number of allocated bytes per object
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [cls(v) for v in values]
+
+        if resolve_lazy:
+            for o in objects:
+                for name in LAZY_PROPERTIES.get(cls, ()):
+                    getattr(o, name)
+
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / len(objects)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000, help='Number of objects of every class')
+    parser.add_argument('--resolve-lazy', action='store_true', help='Access lazy properties of every object')
+    args = parser.parse_args()
+
+    data = make_synthetic_data(contests=1, users=args.count, submissions_per_contest=args.count)
+    sources = [(Submission, data['submissions']), (User, data['users']),
+               (RanklistRow, data['ranklistRows']), (RatingChange, data['ratingChanges'])]
+
+    print('{:14}{:>12}{:>12}{:>10}'.format('class', '__dict__', '__slots__', 'saved'))
+
+    for cls, values in sources:
+        dict_size = measure(with_dict(cls), values, args.resolve_lazy)
+        slots_size = measure(cls, values, args.resolve_lazy)
+
+        print('{:14}{:>10.0f} B{:>10.0f} B{:>9.0f}%'.format(
+            cls.__name__, dict_size, slots_size, 100 * (1 - slots_size / dict_size)))
+
+
+if __name__ == '__main__':
+    main()
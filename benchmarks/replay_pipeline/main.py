@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+"""
+In this benchmark we run contest_status through the whole client pipeline, serving responses from a cassette.
+
+By default the cassette is filled with synthetic submissions. A cassette recorded by RecordingTransport
+could be given instead. Exits with non-zero code if throughput is lower than --min-throughput,
+so it could be used to detect regressions in CI.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from codeforces import CodeforcesAPI
+from codeforces import ReplayTransport
+
+
+def make_submission(submission_id, contest_id):
+    return {
+        'id': submission_id,
+        'contestId': contest_id,
+        'creationTimeSeconds': 1406480400 + submission_id,
+        'relativeTimeSeconds': submission_id % 7200,
+        'problem': {
+            'contestId': contest_id,
+            'index': 'ABCDE'[submission_id % 5],
+            'name': 'Problem',
+            'type': 'PROGRAMMING',
+            'points': 500.0,
+            'tags': ['implementation']
+        },
+        'author': {
+            'contestId': contest_id,
+            'members': [{'handle': 'user{}'.format(submission_id % 1000)}],
+            'participantType': 'CONTESTANT',
+            'ghost': False,
+            'startTimeSeconds': 1406480400
+        },
+        'programmingLanguage': 'GNU C++11',
+        'verdict': 'OK' if submission_id % 3 else 'WRONG_ANSWER',
+        'testset': 'TESTS',
+        'passedTestCount': submission_id % 50,
+        'timeConsumedMillis': submission_id % 1000,
+        'memoryConsumedBytes': 1024 * (submission_id % 1000)
+    }
+
+
+def write_synthetic_cassette(path, contest_id, count):
+    result = [make_submission(i, contest_id) for i in range(count, 0, -1)]
+    body = json.dumps({'status': 'OK', 'result': result})
+    url = 'http://codeforces.com/api/contest.status?contestId={}&from=1'.format(contest_id)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1,
+                   'interactions': [{'url': url, 'status': 200, 'reason': 'OK', 'headers': {}, 'body': body}]}, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cassette', help='Cassette with contest.status response')
+    parser.add_argument('--contest-id', type=int, default=566, help='Contest id')
+    parser.add_argument('--submissions', type=int, default=20000, help='Number of synthetic submissions')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of requests')
+    parser.add_argument('--latency', type=float, default=0.0, help='Simulated latency of every request in seconds')
+    parser.add_argument('--min-throughput', type=float, help='Minimal accepted number of submissions per second')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cassette = args.cassette
+
+        if cassette is None:
+            cassette = os.path.join(directory, 'cassette.json')
+            write_synthetic_cassette(cassette, args.contest_id, args.submissions)
+
+        api = CodeforcesAPI(rate_limit=None, transport=ReplayTransport(cassette, latency=args.latency))
+
+        count = 0
+        start = time.perf_counter()
+
+        for _ in range(args.repeat):
+            count += sum(1 for _ in api.contest_status(args.contest_id))
+
+        elapsed = time.perf_counter() - start
+
+    throughput = count / elapsed
+
+    print('requests:    {:10.1f}/s'.format(args.repeat / elapsed))
+    print('submissions: {:10.1f}/s'.format(throughput))
+
+    if args.min_throughput is not None and throughput < args.min_throughput:
+        print('Throughput is lower than {}'.format(args.min_throughput))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
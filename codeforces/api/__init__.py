@@ -1,2 +1,15 @@
 from ..api.json_objects import *
+from ..api.json_stream import *
+from ..api.transport import *
+from ..api.content_encoding import *
+from ..api.change_detector import *
+from ..api.connection_pool import *
+from ..api.retry_policy import *
+from ..api.single_flight import *
+from ..api.response_cache import *
+from ..api.disk_cache import *
+from ..api.async_connection_pool import *
 from ..api.codeforces_api import *
+from ..api.async_codeforces_api import *
+from ..api.standings_watcher import *
+from ..api.recent_status_tailer import *
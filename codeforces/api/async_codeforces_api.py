@@ -0,0 +1,357 @@
+"""
+This file provides asyncio api for retrieving data from codeforces.com
+"""
+
+import asyncio
+import time
+from functools import partial
+from urllib.error import HTTPError
+
+from .async_connection_pool import AsyncHTTPConnectionPool
+from .change_detector import ChangeDetector
+from .codeforces_api import BaseCodeforcesAPI
+from .codeforces_api import CodeforcesDataRetriever
+from .codeforces_api import CodeforcesLanguage
+from .content_encoding import ACCEPT_ENCODING
+from .content_encoding import decompress
+from .content_encoding import get_content_encoding
+from .retry_policy import RetryPolicy
+from .single_flight import AsyncSingleFlight
+
+
+__all__ = ['AsyncCodeforcesAPI']
+
+
+class AsyncCodeforcesDataRetriever(CodeforcesDataRetriever):
+    """
+    This class hides low-level operations with retrieving data from Codeforces site using asyncio
+    """
+
+    def __init__(self, lang=CodeforcesLanguage.en, key=None, secret=None, connection_pool=None,
+                 rate_limit=None, burst=1, retry_policy=None, response_cache=None, disk_cache=None, offline=False,
+                 base_url=None, coalesce_requests=False, json_decoder=None, compressed_transfer=False,
+                 change_detector=None):
+        """
+        :param lang: Language
+        :type lang: CodeforcesLanguage
+
+        :param key: Private API key. Ignored if secret is None
+        :type key: str
+
+        :param secret: Private API secret. Ignored if key is None
+        :type secret: str
+
+        :param connection_pool: Pool of keep-alive connections used for requests
+        :type connection_pool: AsyncHTTPConnectionPool
+
+        :param rate_limit: Maximum number of requests per second. If None, requests are not limited
+        :type rate_limit: float or None
+
+        :param burst: Maximum number of requests, which can be sent at once after a period of inactivity
+        :type burst: int
+
+        :param retry_policy: Policy for retrying failed requests. If None, failed requests are not retried
+        :type retry_policy: RetryPolicy or None
+
+        :param response_cache: Cache of decoded responses. If None, responses are not cached
+        :type response_cache: ResponseCache or None
+
+        :param disk_cache: Cache of raw responses stored on disk. If None, responses are not stored
+        :type disk_cache: DiskCache or None
+
+        :param offline: If true, responses are served only from the disk cache
+        :type offline: bool
+
+        :param base_url: Base of url, which overrides the one chosen by language
+        :type base_url: str or None
+
+        :param coalesce_requests: If true, concurrent identical requests share one response
+        :type coalesce_requests: bool
+
+        :param json_decoder: Decoder of responses. If None, the default decoder is used
+        :type json_decoder: JsonDecoder or None
+
+        :param compressed_transfer: If true, gzip or deflate compressed responses are requested
+        :type compressed_transfer: bool
+
+        :param change_detector: Detector of unchanged responses, which are not decoded again.
+                                If None, every response is decoded
+        :type change_detector: ChangeDetector or None
+        """
+        assert isinstance(connection_pool, AsyncHTTPConnectionPool)
+
+        super().__init__(lang, key, secret, rate_limit=rate_limit, burst=burst, retry_policy=retry_policy,
+                         response_cache=response_cache, disk_cache=disk_cache, offline=offline, base_url=base_url,
+                         coalesce_requests=coalesce_requests, json_decoder=json_decoder,
+                         compressed_transfer=compressed_transfer, change_detector=change_detector)
+
+        self._async_connection_pool = connection_pool
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+
+    async def get_data(self, method, **kwargs):
+        """
+        Retrieves data by given method with given parameters
+
+        :param method: Request method
+        :param kwargs: HTTP parameters
+        :return:
+        """
+        config = self._config
+        ttl = self._get_cache_ttl(method)
+        cache_key = self._get_cache_key(config, method, kwargs)
+
+        if ttl is not None:
+            found, data = self._response_cache.get(cache_key)
+
+            if found:
+                return data
+
+        retrieve = partial(self.__retrieve, config, method, kwargs, cache_key)
+
+        if self._single_flight is not None:
+            data, size = await self._single_flight.do(cache_key, retrieve)
+        else:
+            data, size = await retrieve()
+
+        if ttl is not None:
+            self._response_cache.put(cache_key, data, size, ttl)
+
+        return data
+
+    async def __retrieve(self, config, method, kwargs, cache_key):
+        """
+        Retrieves data by given method with given parameters, retrying failed requests according to the retry policy
+
+        :return: Data and size of the response in bytes
+        :rtype: (object, int)
+        """
+        stored = self._load_from_disk_cache(method, cache_key)
+
+        if stored is not None:
+            return stored
+
+        attempt = 1
+
+        while True:
+            token_bucket = self._get_token_bucket(config)
+
+            if token_bucket is not None:
+                delay = token_bucket.reserve()
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            previous = self._change_detector.get(cache_key) if self._change_detector is not None else None
+            started = time.monotonic()
+
+            try:
+                url = self._generate_url(config, method, **kwargs)
+                data, answer, received = await self.__get_data(url, cache_key, previous)
+                self._record_request(started, received, len(answer) if answer is not None else None)
+                break
+            except Exception as e:
+                self._record_request(started)
+
+                if not self._should_retry(e, attempt):
+                    raise
+
+            self._record_retry(method)
+            await asyncio.sleep(self._retry_policy.get_delay(attempt))
+            attempt += 1
+
+        if answer is None:
+            return data, previous.size
+
+        self._store_to_disk_cache(method, cache_key, answer)
+
+        return data, len(answer)
+
+    async def __get_data(self, url, cache_key, previous):
+        """
+        Returns data retrieved from given url, the decompressed response and number of received bytes.
+
+        If the server answered 304 Not Modified, data of the previous version is returned with None response
+        """
+        headers = ChangeDetector.get_conditional_headers(previous)
+
+        if self._compressed_transfer:
+            headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+        response = await self._async_connection_pool.request(url, headers or None)
+
+        if previous is not None and response.status == 304:
+            return self._change_detector.not_modified(previous), None, len(response.body)
+
+        answer = decompress(response.body, get_content_encoding(response.headers))
+
+        if response.status < 400:
+            return self.__decode(answer, cache_key, response.headers), answer, len(response.body)
+
+        http_e = HTTPError(url, response.status, response.reason, response.headers, None)
+
+        try:
+            return self.__decode(answer, cache_key, response.headers), answer, len(response.body)
+        except Exception as e:
+            raise e from http_e
+
+    def __decode(self, answer, cache_key, headers):
+        if self._change_detector is not None:
+            return self._change_detector.update(cache_key, headers, answer, self._check_json)
+
+        return self._check_json(answer)
+
+
+class AsyncCodeforcesAPI(BaseCodeforcesAPI):
+    """
+    This class provides asyncio api for retrieving data from codeforces.com
+
+    It has the same methods as CodeforcesAPI, but every method is a coroutine.
+    All requests are multiplexed over keep-alive connections of one AsyncHTTPConnectionPool,
+    which can be shared between several AsyncCodeforcesAPI objects.
+    """
+
+    def __init__(self, lang='en', key=None, secret=None, connection_pool=None, rate_limit=0.5, burst=1,
+                 retry_policy=RetryPolicy(), response_cache=None, disk_cache=None, offline=False, base_url=None,
+                 coalesce_requests=True, json_decoder=None, compressed_transfer=True, change_detector=None,
+                 validate=True, lazy_objects=False):
+        """
+        :param lang: Language
+        :type lang: str or CodeforcesLanguage
+
+        :param key: Private API key. Ignored if secret is None
+        :type key: str
+
+        :param secret: Private API secret. Ignored if key is None
+        :type secret: str
+
+        :param connection_pool: Pool of connections used for requests. If None, a new pool is created
+        :type connection_pool: AsyncHTTPConnectionPool or None
+
+        :param rate_limit: Maximum number of requests per second. By default, one request per two seconds is allowed.
+                           The limit is shared with CodeforcesAPI objects with the same API key within the process,
+                           and the strictest limit among them is used.
+                           If None, requests are not limited
+        :type rate_limit: float or None
+
+        :param burst: Maximum number of requests, which can be sent at once after a period of inactivity
+        :type burst: int
+
+        :param retry_policy: Policy for retrying failed requests. By default, requests failed with network errors,
+                             5xx status codes or "Call limit exceeded" are retried up to three times.
+                             If None, failed requests are not retried
+        :type retry_policy: RetryPolicy or None
+
+        :param response_cache: Cache of decoded responses, which can be shared with CodeforcesAPI objects.
+                               If None, responses are not cached
+        :type response_cache: ResponseCache or None
+
+        :param disk_cache: Cache of raw responses stored on disk, which is reused across processes and restarts.
+                           If None, responses are not stored
+        :type disk_cache: DiskCache or None
+
+        :param offline: If true, responses are served only from the disk cache,
+                        and ValueError is raised if the response is not stored. Requires disk_cache
+        :type offline: bool
+
+        :param base_url: Base of API url, e.g. 'http://127.0.0.1:8000/api/' for LocalCodeforcesServer.
+                         By default, it is chosen by language
+        :type base_url: str or None
+
+        :param coalesce_requests: If true, identical requests made concurrently from several tasks
+                                  share one network request and one decoded response
+        :type coalesce_requests: bool
+
+        :param json_decoder: Decoder of responses. If None, the default decoder is used,
+                             which prefers orjson or ujson if installed
+        :type json_decoder: JsonDecoder or None
+
+        :param compressed_transfer: If true, responses are requested with gzip or deflate compression.
+                                    Saved bytes are counted in statistics
+        :type compressed_transfer: bool
+
+        :param change_detector: Detector of unchanged responses, which are neither decoded nor made into objects again.
+                                Requests are made conditional if the server sent ETag or Last-Modified.
+                                If None, every response is decoded
+        :type change_detector: ChangeDetector or None
+
+        :param validate: If true, types of all fields of returned objects are checked.
+                         If false, data from the server is trusted. If float, only this share of objects is checked
+        :type validate: bool or float
+
+        :param lazy_objects: If true, every field of returned objects is converted on the first access
+        :type lazy_objects: bool
+        """
+        assert isinstance(connection_pool, AsyncHTTPConnectionPool) or connection_pool is None
+
+        self.validate = validate
+        self.lazy_objects = lazy_objects
+        self._change_detector = change_detector
+
+        self._owns_connection_pool = connection_pool is None
+        self._connection_pool = connection_pool if connection_pool is not None else AsyncHTTPConnectionPool()
+
+        self._data_retriever = AsyncCodeforcesDataRetriever(CodeforcesLanguage(lang), key, secret,
+                                                            self._connection_pool, rate_limit, burst, retry_policy,
+                                                            response_cache, disk_cache, offline, base_url,
+                                                            coalesce_requests, json_decoder, compressed_transfer,
+                                                            change_detector)
+
+    @property
+    def retry_counts(self):
+        """
+        :return: Total number of retries for every method, which needed at least one retry
+        :rtype: dict of [str, int]
+        """
+        return self._data_retriever.retry_counts
+
+    @property
+    def statistics(self):
+        """
+        :return: Statistics of requests
+        :rtype: RequestStatistics
+        """
+        return self._data_retriever.statistics
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes connections of the pool, unless the pool was given to the constructor
+        """
+        if self._owns_connection_pool:
+            await self._connection_pool.close()
+
+    async def _get_data(self, method, transform, **kwargs):
+        data = await self._data_retriever.get_data(method, **kwargs)
+
+        return self._transform(method, kwargs, data, transform)
+
+    def _get_url_length(self, method, **kwargs):
+        return self._data_retriever.get_url_length(method, **kwargs)
+
+    async def user_info(self, handles, max_url_length=2000):
+        """
+        Returns information about one or several users.
+
+        Duplicated handles are requested once. Handles are split into chunks, so that url of every request
+        is no longer than max_url_length, and chunks are requested concurrently within the rate limit.
+
+        :param handles: List of handles.
+        :type handles: list of str
+
+        :param max_url_length: Maximum length of request url.
+        :type max_url_length: int
+
+        :return: Returns an iterator of User objects in order of the first occurrence of their handles.
+        :rtype: iterator of User
+        """
+        unique_handles = self._get_unique_handles(handles)
+        chunks = self._split_handles(list(unique_handles.values()), max_url_length)
+        results = await asyncio.gather(*(self._data_retriever.get_data('user.info', handles=chunk)
+                                         for chunk in chunks))
+
+        return self._merge_users(unique_handles, chunks, results)
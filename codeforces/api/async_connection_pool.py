@@ -0,0 +1,261 @@
+"""
+This module provides pool of persistent HTTP connections for asyncio
+"""
+
+import asyncio
+from urllib.parse import urlsplit
+
+
+__all__ = ['AsyncHTTPConnectionPool', 'AsyncResponse']
+
+
+class AsyncResponse:
+    """
+    This class represents completely read HTTP response
+    """
+
+    def __init__(self, status, reason, headers, body):
+        """
+        :param status: Status code
+        :type status: int
+
+        :param reason: Reason phrase
+        :type reason: str
+
+        :param headers: Response headers. Names are lower-cased
+        :type headers: dict of [str, str]
+
+        :param body: Response body
+        :type body: bytes
+        """
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def __repr__(self):
+        return '<AsyncResponse: {} {}>'.format(self.status, self.reason)
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name.lower(), default)
+
+
+class _ServerClosedConnection(ConnectionError):
+    pass
+
+
+class AsyncHTTPConnectionPool:
+    """
+    This class multiplexes HTTP/1.1 requests over keep-alive connections on one event loop.
+
+    At most max_connections requests are sent at the same time, other requests wait for a free connection.
+    After the response is read the connection is kept for the next request to the same host,
+    unless the pool already keeps pool_size idle connections for this host.
+    """
+
+    _default_ports = {
+        'http': 80,
+        'https': 443
+    }
+
+    def __init__(self, pool_size=10, max_connections=100, timeout=None):
+        """
+        :param pool_size: Maximum number of idle connections kept for every host
+        :type pool_size: int
+
+        :param max_connections: Maximum number of simultaneously opened connections
+        :type max_connections: int
+
+        :param timeout: Timeout of the whole request in seconds. None means no timeout
+        :type timeout: float or None
+        """
+        assert isinstance(pool_size, int) and pool_size > 0, 'pool_size should be positive int, not {}'.format(pool_size)
+        assert isinstance(max_connections, int) and max_connections > 0, \
+            'max_connections should be positive int, not {}'.format(max_connections)
+        assert isinstance(timeout, (int, float)) or timeout is None
+
+        self._pool_size = pool_size
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._idle = {}
+        self._semaphore = None
+
+    @property
+    def pool_size(self):
+        """
+        :return: Maximum number of idle connections kept for every host
+        :rtype: int
+        """
+        return self._pool_size
+
+    @property
+    def max_connections(self):
+        """
+        :return: Maximum number of simultaneously opened connections
+        :rtype: int
+        """
+        return self._max_connections
+
+    async def request(self, url, headers=None):
+        """
+        Sends GET request to the given url using one of pooled connections.
+
+        Unlike urllib.request.urlopen, does not raise exception on error status.
+
+        :param url: Url
+        :type url: str
+
+        :param headers: Additional request headers
+        :type headers: dict of [str, str] or None
+
+        :return: Response
+        :rtype: AsyncResponse
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_connections)
+
+        async with self._semaphore:
+            if self._timeout is None:
+                return await self._request(url, headers)
+            else:
+                return await asyncio.wait_for(self._request(url, headers), self._timeout)
+
+    async def close(self):
+        """
+        Closes all idle connections
+        """
+        idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for _, writer in connections:
+                writer.close()
+
+    async def _request(self, url, headers):
+        parts = urlsplit(url)
+        host_key = (parts.scheme, parts.hostname, parts.port or self._default_ports.get(parts.scheme))
+        path = parts.path or '/'
+
+        if parts.query:
+            path += '?' + parts.query
+
+        request_headers = {'Host': parts.netloc, 'Connection': 'keep-alive'}
+        request_headers.update(headers or {})
+
+        request = 'GET {} HTTP/1.1\r\n'.format(path)
+        request += ''.join('{}: {}\r\n'.format(name, value) for name, value in request_headers.items())
+        request = (request + '\r\n').encode('latin-1')
+
+        connection = self._acquire(host_key)
+        reused = connection is not None
+
+        if connection is None:
+            connection = await self._open_connection(host_key)
+
+        try:
+            response, keep_alive = await self._send(connection, request)
+        except (_ServerClosedConnection, asyncio.IncompleteReadError, ConnectionError):
+            connection[1].close()
+
+            if not reused:
+                raise
+
+            # The server has closed the idle connection, so retry once with a fresh one
+            connection = await self._open_connection(host_key)
+
+            try:
+                response, keep_alive = await self._send(connection, request)
+            except BaseException:
+                connection[1].close()
+                raise
+        except BaseException:
+            connection[1].close()
+            raise
+
+        if keep_alive:
+            self._release(host_key, connection)
+        else:
+            connection[1].close()
+
+        return response
+
+    async def _open_connection(self, host_key):
+        scheme, host, port = host_key
+
+        if scheme not in self._default_ports:
+            raise ValueError('Unsupported url scheme', scheme)
+
+        return await asyncio.open_connection(host, port, ssl=(scheme == 'https') or None)
+
+    @staticmethod
+    async def _send(connection, request):
+        reader, writer = connection
+
+        writer.write(request)
+        await writer.drain()
+
+        status_line = await reader.readline()
+
+        if not status_line:
+            raise _ServerClosedConnection('Server closed the connection')
+
+        version, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+        headers = {}
+
+        while True:
+            line = await reader.readline()
+
+            if line in (b'\r\n', b'\n', b''):
+                break
+
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+        if int(status) in (204, 304) or 100 <= int(status) < 200:
+            # These responses never have a body
+            body = b''
+        elif headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+
+            while True:
+                size = int((await reader.readline()).split(b';', 1)[0], 16)
+
+                if size == 0:
+                    break
+
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        return AsyncResponse(int(status), reason, headers, body), keep_alive
+
+    def _acquire(self, host_key):
+        connections = self._idle.get(host_key)
+
+        while connections:
+            reader, writer = connections.pop()
+
+            if not reader.at_eof():
+                return reader, writer
+
+            writer.close()
+
+        return None
+
+    def _release(self, host_key, connection):
+        connections = self._idle.setdefault(host_key, [])
+
+        if len(connections) < self._pool_size:
+            connections.append(connection)
+        else:
+            connection[1].close()
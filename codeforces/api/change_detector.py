@@ -0,0 +1,235 @@
+"""
+This module provides detection of unchanged responses of polled API methods
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Iterator
+
+
+__all__ = ['ChangeDetector', 'ChangeStatistics']
+
+
+ChangeStatistics = namedtuple('ChangeStatistics', ['not_modified', 'unchanged', 'changed'])
+
+
+_ResponseVersion = namedtuple('_ResponseVersion', ['etag', 'last_modified', 'digest', 'data', 'size'])
+
+
+_TransformedResult = namedtuple('_TransformedResult', ['data', 'result'])
+
+
+class _Items(tuple):
+    """
+    Items of the iterator, which was returned by transform function
+    """
+
+
+def _materialize(result):
+    """
+    :return: Result, in which iterators are replaced by their items, so that it can be returned several times
+    """
+    if isinstance(result, dict):
+        return {key: _materialize(value) for key, value in result.items()}
+
+    if isinstance(result, Iterator):
+        return _Items(result)
+
+    return result
+
+
+def _restore(result):
+    """
+    :return: Copy of materialized result with fresh iterators over remembered items
+    """
+    if isinstance(result, dict):
+        return {key: _restore(value) for key, value in result.items()}
+
+    if isinstance(result, _Items):
+        return iter(result)
+
+    return result
+
+
+def _get_header(headers, name):
+    """
+    :return: Value of the header or None if it is not presented
+    :rtype: str or None
+    """
+    if not headers:
+        return None
+
+    value = headers.get(name, headers.get(name.lower()))
+
+    return value if isinstance(value, str) and value else None
+
+
+class ChangeDetector:
+    """
+    This class remembers the last decoded response of every request, so that an unchanged response
+    is not decoded again.
+
+    If the server sent ETag or Last-Modified, the next request is made conditional and
+    the server can answer 304 Not Modified without the body.
+    Otherwise, the response is compared with the previous one by SHA-1 hash of its body.
+    An unchanged response is returned as the very same object as the previous one,
+    so callers can detect changes by identity. Decoded responses are shared and should not be modified.
+
+    Objects made from an unchanged response are remembered too, so they are not made again.
+    Such objects are shared between results of API methods as well.
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        :param max_entries: Maximum number of remembered responses. The least recently used ones are forgotten
+        :type max_entries: int
+        """
+        assert isinstance(max_entries, int) and max_entries > 0, \
+            'max_entries should be positive int, not {}'.format(max_entries)
+
+        self._max_entries = max_entries
+        self._versions = OrderedDict()
+        self._results = OrderedDict()
+        self._not_modified = 0
+        self._unchanged = 0
+        self._changed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def statistics(self):
+        """
+        :return: Number of responses, which were not modified according to the server, unchanged by hash, and changed
+        :rtype: ChangeStatistics
+        """
+        with self._lock:
+            return ChangeStatistics(self._not_modified, self._unchanged, self._changed)
+
+    def get(self, key):
+        """
+        :param key: Key of the request
+        :type key: tuple
+
+        :return: Last version of the response or None if it is not remembered
+        """
+        with self._lock:
+            version = self._versions.get(key)
+
+            if version is not None:
+                self._versions.move_to_end(key)
+
+            return version
+
+    @staticmethod
+    def get_conditional_headers(version):
+        """
+        :param version: Last version of the response returned by get
+        :return: Headers, which make the request conditional
+        :rtype: dict of [str, str]
+        """
+        headers = {}
+
+        if version is not None:
+            if version.etag is not None:
+                headers['If-None-Match'] = version.etag
+
+            if version.last_modified is not None:
+                headers['If-Modified-Since'] = version.last_modified
+
+        return headers
+
+    def not_modified(self, version):
+        """
+        Counts the response, which the server reported as not modified
+
+        :param version: Last version of the response returned by get
+        :return: Decoded data of the version
+        """
+        with self._lock:
+            self._not_modified += 1
+
+        return version.data
+
+    def update(self, key, headers, answer, decode):
+        """
+        Returns decoded data of the received response, decoding it only if it differs from the last version
+
+        :param key: Key of the request
+        :type key: tuple
+
+        :param headers: Response headers
+        :type headers: http.client.HTTPMessage or dict of [str, str] or None
+
+        :param answer: Decompressed response body
+        :type answer: bytes
+
+        :param decode: Function, which decodes the body. If it raises, the response is not remembered
+        :type decode: callable
+
+        :return: Decoded data
+        """
+        digest = hashlib.sha1(answer).digest()
+        previous = self.get(key)
+
+        if previous is not None and previous.digest == digest:
+            data = previous.data
+            changed = False
+        else:
+            data = decode(answer)
+            changed = True
+
+        version = _ResponseVersion(_get_header(headers, 'ETag'), _get_header(headers, 'Last-Modified'),
+                                   digest, data, len(answer))
+
+        with self._lock:
+            self._versions[key] = version
+            self._versions.move_to_end(key)
+
+            while len(self._versions) > self._max_entries:
+                self._versions.popitem(last=False)
+
+            if changed:
+                self._changed += 1
+            else:
+                self._unchanged += 1
+
+        return data
+
+    def transform(self, key, data, transform):
+        """
+        Makes result of API method from decoded data, reusing the result made from the very same data
+
+        :param key: Key of the method call, which identifies the transform function
+        :type key: tuple
+
+        :param data: Decoded data
+        :param transform: Function, which makes the method result from data
+        :type transform: callable
+
+        :return: Method result. Iterators of the result are made anew every time over remembered items
+        """
+        with self._lock:
+            previous = self._results.get(key)
+
+            if previous is not None and previous.data is data:
+                self._results.move_to_end(key)
+                return _restore(previous.result)
+
+        result = _materialize(transform(data))
+
+        with self._lock:
+            self._results[key] = _TransformedResult(data, result)
+            self._results.move_to_end(key)
+
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+
+        return _restore(result)
+
+    def clear(self):
+        """
+        Forgets all responses
+        """
+        with self._lock:
+            self._versions.clear()
+            self._results.clear()
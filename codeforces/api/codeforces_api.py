@@ -3,15 +3,23 @@ This file provides api for retrieving data from codeforces.com
 """
 
 import hashlib
-import json
+import itertools
 import operator
 import random
+import threading
 import time
-from collections import OrderedDict
+import weakref
+from collections import OrderedDict, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from enum import Enum
+from functools import partial
 from urllib.error import HTTPError
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 
+from .change_detector import ChangeDetector
+from .connection_pool import HTTPConnectionPool
+from .content_encoding import ACCEPT_ENCODING, DecompressingReader, get_content_encoding
+from .disk_cache import DiskCache
 from .json_objects import Contest
 from .json_objects import Hack
 from .json_objects import Problem
@@ -20,9 +28,41 @@ from .json_objects import RanklistRow
 from .json_objects import RatingChange
 from .json_objects import Submission
 from .json_objects import User
+from .json_stream import iter_json_array
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+from .single_flight import SingleFlight
+from .transport import Transport
+from codeforces.utils import JsonDecoder
+from codeforces.utils import TokenBucket
+from codeforces.utils import get_default_json_decoder
 
 
-__all__ = ['CodeforcesAPI', 'CodeforcesLanguage']
+__all__ = ['BaseCodeforcesAPI', 'BulkProgress', 'CodeforcesAPI', 'CodeforcesLanguage', 'RequestStatistics']
+
+
+class BulkProgress(namedtuple('BulkProgress', ['completed', 'total', 'cached', 'elapsed'])):
+    """
+    Progress of bulk retrieving: number of completed and total items, number of items taken from cache
+    and elapsed time in seconds
+    """
+
+    __slots__ = ()
+
+    @property
+    def throughput(self):
+        """
+        :return: Number of retrieved (not cached) items per second
+        :rtype: float
+        """
+        return (self.completed - self.cached) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+RequestStatistics = namedtuple('RequestStatistics',
+                               ['requests', 'retries', 'failures', 'bytes_received', 'elapsed', 'bytes_saved'])
+
+
+_RequestConfig = namedtuple('_RequestConfig', ['language', 'base', 'key', 'secret'])
 
 
 class CodeforcesLanguage(Enum):
@@ -33,8 +73,15 @@ class CodeforcesLanguage(Enum):
 class CodeforcesDataRetriever:
     """
     This class hides low-level operations with retrieving data from Codeforces site
+
+    The retriever can be used from several threads at once. Language, key and secret are kept in an immutable
+    snapshot, which is replaced as a whole when they are changed, and every request uses the snapshot
+    taken at its start. Statistics of requests are counted separately for every thread.
     """
-    def __init__(self, lang=CodeforcesLanguage.en, key=None, secret=None):
+    def __init__(self, lang=CodeforcesLanguage.en, key=None, secret=None, transport=None,
+                 rate_limit=None, burst=1, retry_policy=None, response_cache=None, disk_cache=None, offline=False,
+                 base_url=None, coalesce_requests=False, json_decoder=None, compressed_transfer=False,
+                 change_detector=None):
         """
         :param lang: Language
         :type lang: CodeforcesLanguage
@@ -44,20 +91,88 @@ class CodeforcesDataRetriever:
 
         :param secret: Private API secret. Ignored if key is None
         :type secret: str
-        """
-        self._key = None
-        self._secret = None
 
-        if key is not None and secret is not None:
-            self.key = key
-            self.secret = secret
+        :param transport: Transport, which sends requests. If None, every request is sent by urlopen
+        :type transport: Transport or None
+
+        :param rate_limit: Maximum number of requests per second. Requests with the same API key
+                           (or all anonymous requests) share one token bucket within the process.
+                           If None, requests are not limited
+        :type rate_limit: float or None
+
+        :param burst: Maximum number of requests, which can be sent at once after a period of inactivity
+        :type burst: int
+
+        :param retry_policy: Policy for retrying failed requests. If None, failed requests are not retried
+        :type retry_policy: RetryPolicy or None
+
+        :param response_cache: Cache of decoded responses. If None, responses are not cached
+        :type response_cache: ResponseCache or None
+
+        :param disk_cache: Cache of raw responses stored on disk. If None, responses are not stored
+        :type disk_cache: DiskCache or None
+
+        :param offline: If true, responses are served only from the disk cache
+        :type offline: bool
+
+        :param base_url: Base of url, which overrides the one chosen by language
+        :type base_url: str or None
+
+        :param coalesce_requests: If true, concurrent identical requests share one response
+        :type coalesce_requests: bool
+
+        :param json_decoder: Decoder of responses. If None, the default decoder is used
+        :type json_decoder: JsonDecoder or None
+
+        :param compressed_transfer: If true, gzip or deflate compressed responses are requested
+        :type compressed_transfer: bool
+
+        :param change_detector: Detector of unchanged responses, which are not decoded again.
+                                If None, every response is decoded
+        :type change_detector: ChangeDetector or None
+        """
+        assert isinstance(transport, Transport) or transport is None
+        assert isinstance(rate_limit, (int, float)) or rate_limit is None
+        assert isinstance(retry_policy, RetryPolicy) or retry_policy is None
+        assert isinstance(response_cache, ResponseCache) or response_cache is None
+        assert isinstance(disk_cache, DiskCache) or disk_cache is None
+        assert isinstance(offline, bool)
+        assert not offline or disk_cache is not None, 'offline mode requires disk_cache'
+        assert isinstance(base_url, str) or base_url is None
+        assert isinstance(coalesce_requests, bool)
+        assert isinstance(json_decoder, JsonDecoder) or json_decoder is None
+        assert isinstance(compressed_transfer, bool)
+        assert isinstance(change_detector, ChangeDetector) or change_detector is None
+
+        self._transport = transport
+        self._json_decoder = json_decoder if json_decoder is not None else get_default_json_decoder()
+        self._compressed_transfer = compressed_transfer
+        self._change_detector = change_detector
+        self._rate_limit = rate_limit
+        self._burst = burst
+        self._retry_policy = retry_policy
+        self._retry_counts = {}
+        self._retry_counts_lock = threading.Lock()
+        self._response_cache = response_cache
+        self._disk_cache = disk_cache
+        self._offline = offline
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._thread_statistics = threading.local()
+        self._all_statistics = []
+        self._finished_statistics = [0, 0, 0, 0, 0.0, 0]
+        self._statistics_lock = threading.Lock()
 
         self._base_from_language = {
             CodeforcesLanguage.en: 'http://codeforces.com/api/',
             CodeforcesLanguage.ru: 'http://codeforces.ru/api/'
         }
 
-        self._language = lang
+        self._base_url = base_url
+        self._config_lock = threading.Lock()
+        self._config = self._make_config(CodeforcesLanguage(lang), None, None)
+
+        if key is not None and secret is not None:
+            self.set_credentials(key, secret)
 
     def get_data(self, method, **kwargs):
         """
@@ -67,25 +182,359 @@ class CodeforcesDataRetriever:
         :param kwargs: HTTP parameters
         :return:
         """
-        return self.__get_data(self.__generate_url(method, **kwargs))
+        config = self._config
+        ttl = self._get_cache_ttl(method)
+        cache_key = self._get_cache_key(config, method, kwargs)
+
+        if ttl is not None:
+            found, data = self._response_cache.get(cache_key)
+
+            if found:
+                return data
+
+        retrieve = partial(self.__retrieve, config, method, kwargs, cache_key)
+
+        if self._single_flight is not None:
+            data, size = self._single_flight.do(cache_key, retrieve)
+        else:
+            data, size = retrieve()
+
+        if ttl is not None:
+            self._response_cache.put(cache_key, data, size, ttl)
+
+        return data
+
+    def __retrieve(self, config, method, kwargs, cache_key):
+        """
+        Retrieves data by given method with given parameters from the disk cache or from the site,
+        retrying failed requests according to the retry policy
+
+        :return: Data and size of the response in bytes
+        :rtype: (object, int)
+        """
+        stored = self._load_from_disk_cache(method, cache_key)
+
+        if stored is not None:
+            return stored
+
+        attempt = 1
+
+        while True:
+            token_bucket = self._get_token_bucket(config)
+
+            if token_bucket is not None:
+                token_bucket.acquire()
+
+            previous = self._change_detector.get(cache_key) if self._change_detector is not None else None
+            started = time.monotonic()
+
+            try:
+                # Url is generated for every attempt, so that each one is signed with fresh time and apiSig
+                url = self._generate_url(config, method, **kwargs)
+                data, answer, received = self.__get_data(url, cache_key, previous)
+                self._record_request(started, received, len(answer) if answer is not None else None)
+                break
+            except Exception as e:
+                self._record_request(started)
+
+                if not self._should_retry(e, attempt):
+                    raise
+
+            self._record_retry(method)
+            time.sleep(self._retry_policy.get_delay(attempt))
+            attempt += 1
+
+        if answer is None:
+            return data, previous.size
+
+        self._store_to_disk_cache(method, cache_key, answer)
+
+        return data, len(answer)
+
+    def iter_data(self, method, path=('result',), **kwargs):
+        """
+        Retrieves data by given method with given parameters and yields elements of the array at the given path
+        one by one, parsing the response while it is received.
+
+        Caches are not used. Failed requests are retried only until the response is received.
+
+        :param method: Request method
+        :param path: Keys of nested objects, which lead to the array, e.g. ('result', 'rows')
+        :param kwargs: HTTP parameters
+        :return: Generator of decoded elements
+        """
+        config = self._config
+        attempt = 1
+
+        while True:
+            token_bucket = self._get_token_bucket(config)
+
+            if token_bucket is not None:
+                token_bucket.acquire()
+
+            started = time.monotonic()
+
+            try:
+                response = self.__open(self._generate_url(config, method, **kwargs))
+                break
+            except Exception as e:
+                self._record_request(started)
+
+                if not self._should_retry(e, attempt):
+                    raise
+
+            self._record_retry(method)
+            time.sleep(self._retry_policy.get_delay(attempt))
+            attempt += 1
+
+        stream = DecompressingReader(response, get_content_encoding(response.headers))
+
+        with response:
+            try:
+                yield from iter_json_array(stream, path)
+            finally:
+                self._record_request(started, stream.compressed_size, stream.size)
+
+    def _load_from_disk_cache(self, method, cache_key):
+        """
+        :return: Data and size of the stored response or None if the response is not stored
+        :rtype: (object, int) or None
+        :exception ValueError: raised in offline mode when the response is not stored
+        """
+        if self._disk_cache is not None and self._disk_cache.is_cached(method):
+            answer = self._disk_cache.get(cache_key, ignore_ttl=self._offline, method=method)
+
+            if answer is not None:
+                return self._check_json(answer), len(answer)
+
+        if self._offline:
+            raise ValueError('Response is not cached', method)
+
+        return None
+
+    def _store_to_disk_cache(self, method, cache_key, answer):
+        if self._disk_cache is not None and self._disk_cache.is_cached(method):
+            self._disk_cache.put(cache_key, answer)
+
+    @property
+    def retry_counts(self):
+        """
+        :return: Total number of retries for every method, which needed at least one retry
+        :rtype: dict of [str, int]
+        """
+        with self._retry_counts_lock:
+            return dict(self._retry_counts)
+
+    def _should_retry(self, error, attempt):
+        """
+        :return: True if the request failed with given error at given attempt should be retried
+        :rtype: bool
+        """
+        return (self._retry_policy is not None and
+                attempt < self._retry_policy.max_attempts and
+                self._retry_policy.is_retryable(error))
+
+    def _record_retry(self, method):
+        with self._retry_counts_lock:
+            self._retry_counts[method] = self._retry_counts.get(method, 0) + 1
+
+        self._get_thread_counters()[1] += 1
+
+    def _record_request(self, started, size=None, decompressed_size=None):
+        """
+        Counts the request, which was started at the given time, in statistics of the current thread
+
+        :param size: Size of the received response in bytes or None if the request failed
+        :type size: int or None
+
+        :param decompressed_size: Size of the response after decompression. If None, the response was not compressed
+        :type decompressed_size: int or None
+        """
+        counters = self._get_thread_counters()
+        counters[0] += 1
+
+        if size is None:
+            counters[2] += 1
+        else:
+            counters[3] += size
+
+            if decompressed_size is not None:
+                counters[5] += decompressed_size - size
+
+        counters[4] += time.monotonic() - started
+
+    def _get_thread_counters(self):
+        """
+        Returns counters of the current thread. Only the owning thread changes them, so no lock is needed
+        """
+        counters = getattr(self._thread_statistics, 'counters', None)
+
+        if counters is None:
+            counters = self._thread_statistics.counters = [0, 0, 0, 0, 0.0, 0]
+
+            with self._statistics_lock:
+                self._fold_finished_threads()
+                self._all_statistics.append((weakref.ref(threading.current_thread()), counters))
+
+        return counters
+
+    def _fold_finished_threads(self):
+        """
+        Adds counters of finished threads to the total ones and forgets them, so that they are not kept forever.
+        Should be called with the statistics lock held
+        """
+        running = []
+
+        for thread_ref, counters in self._all_statistics:
+            thread = thread_ref()
+
+            if thread is not None and thread.is_alive():
+                running.append((thread_ref, counters))
+            else:
+                self._finished_statistics = [total + value for total, value in zip(self._finished_statistics,
+                                                                                    counters)]
+
+        self._all_statistics = running
+
+    @property
+    def thread_statistics(self):
+        """
+        :return: Statistics of requests made by the current thread
+        :rtype: RequestStatistics
+        """
+        return RequestStatistics(*self._get_thread_counters())
+
+    @property
+    def statistics(self):
+        """
+        :return: Statistics of requests made by all threads
+        :rtype: RequestStatistics
+        """
+        with self._statistics_lock:
+            self._fold_finished_threads()
+            all_counters = [list(counters) for _, counters in self._all_statistics]
+            all_counters.append(self._finished_statistics)
+
+        return RequestStatistics(*(sum(values) for values in zip([0, 0, 0, 0, 0.0, 0], *all_counters)))
+
+    def _get_cache_ttl(self, method):
+        """
+        :return: Time to live of cached responses of the given method or None if the method is not cached
+        :rtype: float or None
+        """
+        if self._response_cache is None:
+            return None
+
+        return self._response_cache.get_ttl(method)
+
+    def _get_cache_key(self, config, method, kwargs):
+        """
+        Makes key of the request, which does not depend on order of parameters, time and signature
+
+        :rtype: tuple
+        """
+        params = sorted(map(self.__key_value_to_http_parameter, self.__get_valid_args(**kwargs).items()))
+
+        return (config.base, config.key, method) + tuple(params)
+
+    def _get_token_bucket(self, config):
+        """
+        :return: Token bucket shared by requests with the current API key or None if requests are not limited
+        :rtype: TokenBucket or None
+        """
+        if self._rate_limit is None:
+            return None
+
+        return TokenBucket.shared(config.key, self._rate_limit, self._burst)
+
+    def __get_data(self, url, cache_key, previous):
+        """
+        Returns data retrieved from given url, the decompressed response and number of received bytes.
+
+        If the server answered 304 Not Modified, data of the previous version is returned with None response
+        """
+        headers = ChangeDetector.get_conditional_headers(previous)
+
+        try:
+            with self.__urlopen(url, headers) as req:
+                return self.__read_response(req, cache_key, previous)
+        except HTTPError as http_e:
+            try:
+                return self.__read_response(http_e, cache_key, previous)
+            except Exception as e:
+                raise e from http_e
+            finally:
+                http_e.close()
+
+    def __read_response(self, response, cache_key, previous):
+        """
+        Reads and decodes the response, unless it is the same as the previous version
+        """
+        reader = DecompressingReader(response, get_content_encoding(response.headers))
+        answer = reader.read()
+
+        if previous is not None and self._get_status(response) == 304:
+            return self._change_detector.not_modified(previous), None, reader.compressed_size
+
+        if self._change_detector is not None:
+            data = self._change_detector.update(cache_key, response.headers, answer, self._check_json)
+        else:
+            data = self._check_json(answer)
+
+        return data, answer, reader.compressed_size
+
+    @staticmethod
+    def _get_status(response):
+        """
+        :return: Status code of the response or HTTPError, or None if it is unknown
+        :rtype: int or None
+        """
+        status = getattr(response, 'status', None)
+
+        if not isinstance(status, int):
+            status = getattr(response, 'code', None)
 
-    def __get_data(self, url):
+        return status if isinstance(status, int) else None
+
+    def __open(self, url):
         """
-        Returns data retrieved from given url
+        Opens given url, raising ValueError with the comment if the request failed
         """
         try:
-            with urlopen(url) as req:
-                return self.__check_json(req.read().decode('utf-8'))
+            return self.__urlopen(url)
         except HTTPError as http_e:
             try:
-                return self.__check_json(http_e.read().decode('utf-8'))
+                self._check_json(DecompressingReader(http_e, get_content_encoding(http_e.headers)).read())
             except Exception as e:
                 raise e from http_e
+            finally:
+                http_e.close()
+
+            raise
+
+    def __urlopen(self, url, headers=None):
+        """
+        Opens given url with additional headers using the transport if it is presented,
+        asking for compressed response if it is enabled
+        """
+        headers = dict(headers or {})
+
+        if self._compressed_transfer:
+            headers['Accept-Encoding'] = ACCEPT_ENCODING
 
-    def __generate_url(self, method, **kwargs):
+        if self._transport is not None:
+            return self._transport.urlopen(url, headers or None)
+        elif headers:
+            return urlopen(Request(url, headers=headers))
+        else:
+            return urlopen(url)
+
+    def _generate_url(self, config, method, **kwargs):
         """
         Generates request url with given method and named parameters
 
+        :param config: Snapshot of language, key and secret
+        :type config: _RequestConfig
         :param method: Name of the method
         :type method: str
         :param kwargs: HTTP parameters
@@ -93,22 +542,36 @@ class CodeforcesDataRetriever:
         :return: Url
         :rtype: str
         """
-        url = self.base + method
+        url = config.base + method
 
-        if self.key is not None and self.secret is not None:
-            kwargs['apiKey'] = self.key
+        if config.key is not None and config.secret is not None:
+            kwargs['apiKey'] = config.key
             kwargs['time'] = int(time.time())
 
         if kwargs:
             args = self.__get_valid_args(**kwargs)
             url += '?' + '&'.join(map(self.__key_value_to_http_parameter, args.items()))
 
-            if self.key is not None and self.secret is not None:
-                url += '&apiSig=' + self.__generate_api_sig(method, args)
+            if config.key is not None and config.secret is not None:
+                url += '&apiSig=' + self.__generate_api_sig(method, args, config.secret)
 
         return url
 
-    def __generate_api_sig(self, method, params):
+    def get_url_length(self, method, **kwargs):
+        """
+        Returns length of the request url with given method and named parameters,
+        including apiKey, time and apiSig parameters if requests are signed
+
+        :param method: Name of the method
+        :type method: str
+        :param kwargs: HTTP parameters
+        :type kwargs: dict of [str, object]
+        :return: Length of the url
+        :rtype: int
+        """
+        return len(self._generate_url(self._config, method, **kwargs))
+
+    def __generate_api_sig(self, method, params, secret):
         """
         apiSig — signature to ensure that you know both key and secret.
 
@@ -129,7 +592,7 @@ class CodeforcesDataRetriever:
 
         s += '&'.join(map(self.__key_value_to_http_parameter, ordered_params.items()))
 
-        s += '#' + self.secret
+        s += '#' + secret
 
         return rand + hashlib.sha512(s.encode()).hexdigest()
 
@@ -154,12 +617,14 @@ class CodeforcesDataRetriever:
 
         return '{0}={1}'.format(key, value)
 
-    @staticmethod
-    def __check_json(answer):
+    def _check_json(self, answer):
         """
         Check if answer is correct according to http://codeforces.com/api/help
+
+        :param answer: Raw response
+        :type answer: bytes
         """
-        values = json.loads(answer)
+        values = self._json_decoder.loads(answer)
 
         try:
             if values['status'] == 'OK':
@@ -172,10 +637,10 @@ class CodeforcesDataRetriever:
     @property
     def base(self):
         """
-        :return: Base of url according to language
+        :return: Base of url according to language, unless it is overridden by base_url
         :rtype: str
         """
-        return self._base_from_language[self.language]
+        return self._config.base
 
     @property
     def language(self):
@@ -183,7 +648,7 @@ class CodeforcesDataRetriever:
         :returns: Language. By default is en
         :rtype: CodeforcesLanguage
         """
-        return self._language
+        return self._config.language
 
     @language.setter
     def language(self, value):
@@ -192,7 +657,9 @@ class CodeforcesDataRetriever:
         :type value: CodeforcesLanguage or str
         """
         assert isinstance(value, (CodeforcesLanguage, str))
-        self._language = CodeforcesLanguage(value)
+
+        with self._config_lock:
+            self._config = self._make_config(CodeforcesLanguage(value), self._config.key, self._config.secret)
 
     @property
     def key(self):
@@ -202,7 +669,7 @@ class CodeforcesDataRetriever:
         :returns: Key or None if not presented
         :rtype: str
         """
-        return self._key
+        return self._config.key
 
     @key.setter
     def key(self, value):
@@ -213,7 +680,9 @@ class CodeforcesDataRetriever:
         :type value: str
         """
         assert isinstance(value, str) or value is None
-        self._key = value
+
+        with self._config_lock:
+            self._config = self._config._replace(key=value)
 
     @property
     def secret(self):
@@ -223,7 +692,7 @@ class CodeforcesDataRetriever:
         :returns: Secret or None if not presented
         :rtype: str
         """
-        return self._secret
+        return self._config.secret
 
     @secret.setter
     def secret(self, value):
@@ -234,123 +703,350 @@ class CodeforcesDataRetriever:
         :type value: str
         """
         assert isinstance(value, str) or value is None
-        self._secret = value
 
+        with self._config_lock:
+            self._config = self._config._replace(secret=value)
 
-class CodeforcesAPI:
-    """
-    This class provides api for retrieving data from codeforces.com
-    """
-
-    def __init__(self, lang='en', key=None, secret=None):
+    def set_credentials(self, key, secret):
         """
-        :param lang: Language
-        :type lang: str or CodeforcesLanguage
+        Changes key and secret at once, so that no request is signed with the new key and the old secret
 
-        :param key: Private API key. Ignored if secret is None
+        :param key: Key or None
         :type key: str
 
-        :param secret: Private API secret. Ignored if key is None
+        :param secret: Secret or None
         :type secret: str
         """
-        self._data_retriever = CodeforcesDataRetriever(CodeforcesLanguage(lang), key, secret)
+        assert isinstance(key, str) or key is None
+        assert isinstance(secret, str) or secret is None
 
-    def contest_hacks(self, contest_id):
-        """
-        Returns list of hacks in the specified contests.
+        with self._config_lock:
+            self._config = self._config._replace(key=key, secret=secret)
 
-        Full information about hacks is available only after some time after the contest end.
-        During the contest user can see only own hacks.
+    def _make_config(self, language, key, secret):
+        base = self._base_url if self._base_url is not None else self._base_from_language[language]
 
-        :param contest_id: Id of the contest.
-                           It is not the round number. It can be seen in contest URL. For example: /contest/374/status
-        :type contest_id: int
-        :return: Returns an iterator of Hack objects.
-        :rtype: iterator of Hack
-        """
-        assert isinstance(contest_id, int)
+        return _RequestConfig(language, base, key, secret)
 
-        data = self._data_retriever.get_data('contest.hacks', contestId=contest_id)
 
-        return map(Hack, data)
+class BaseCodeforcesAPI:
+    """
+    This class describes methods of Codeforces API.
 
-    def contest_list(self, gym=False):
+    Subclasses define how the data is retrieved by overriding _get_data method.
+
+    Objects are made from retrieved data according to the validate and lazy_objects options, see CodeforcesAPI
+    """
+
+    _validate = True
+
+    _lazy_objects = False
+
+    _change_detector = None
+
+    USER_INFO_MAX_HANDLES = 10000
+
+    @property
+    def validate(self):
         """
-        Returns information about all available contests.
+        :return: True if types of all fields are checked, False if retrieved data is trusted,
+                 or share of objects, which are checked
+        :rtype: bool or float
+        """
+        return self._validate
 
-        :param gym: If true — than gym contests are returned. Otherwise, regular contests are returned.
-        :type gym: bool
-        :return: Returns an iterator of Contest objects. If this method is called not anonymously,
-                 then all available contests for a calling user will be returned too,
-                 including mashups and private gyms.
-        :rtype: iterator of Contest
+    @validate.setter
+    def validate(self, value):
         """
-        data = self._data_retriever.get_data('contest.list', gym=gym)
+        :param value: True if types of all fields are checked, False if retrieved data is trusted,
+                      or share of objects, which are checked
+        :type value: bool or float
+        """
+        assert isinstance(value, bool) or isinstance(value, float) and 0 < value < 1, \
+            'validate should be bool or float between 0 and 1, not {}'.format(value)
 
-        return map(Contest, data)
+        self._validate = value
 
-    def contest_rating_changes(self, contest_id):
+    @property
+    def lazy_objects(self):
         """
-        Returns rating changes after the contest.
+        :return: True if fields of returned objects are loaded on the first access
+        :rtype: bool
+        """
+        return self._lazy_objects
 
-        :param contest_id: Id of the contest. It is not the round number. It can be seen in contest URL.
-        :return: Returns an iterator of RatingChange objects.
-        :rtype: iterator of RatingChange
+    @lazy_objects.setter
+    def lazy_objects(self, value):
         """
-        data = self._data_retriever.get_data('contest.ratingChanges', contestId=contest_id)
+        :param value: True if fields of returned objects should be loaded on the first access
+        :type value: bool
+        """
+        assert isinstance(value, bool), 'lazy_objects should be of type bool, not {}'.format(type(value))
 
-        return map(RatingChange, data)
+        self._lazy_objects = value
 
-    def contest_standings(self, contest_id, from_=1, count=None, handles=None, show_unofficial=False):
+    def get_loader(self, cls):
         """
-        Returns the description of the contest and the requested part of the standings.
+        Makes a function, which loads objects of the class from retrieved data
+        according to the validate and lazy_objects options.
 
-        :param contest_id: Id of the contest. It is not the round number. It can be seen in contest URL.
-                           For example: /contest/374/status
-        :type contest_id: int
+        In sampling mode the first object and then every 1/validate-th object are checked,
+        so that the first object of every response is checked
 
-        :param from_: 1-based index of the standings row to start the ranklist.
-        :type from_: int
+        :param cls: Class of objects
+        :type cls: type
 
-        :param count: Number of standing rows to return.
-        :type count: int
+        :return: Function, which makes an object from dict
+        :rtype: callable
+        """
+        validate = self._validate
+        lazy = self._lazy_objects
 
-        :param handles: List of handles. No more than 10000 handles is accepted.
-        :type handles: list of str
+        if isinstance(validate, bool):
+            return partial(cls.from_dict, validate=validate, lazy=lazy)
 
-        :param show_unofficial: If true than all participants (virtual, out of competition) are shown.
-                                Otherwise, only official contestants are shown.
-        :type show_unofficial: bool
+        period = max(1, round(1 / validate))
+        counter = itertools.count()
 
-        :return: Returns object with three fields: "contest", "problems" and "rows".
-                 Field "contest" contains a Contest object.
-                 Field "problems" contains an iterator of Problem objects.
-                 Field "rows" contains an iteator of RanklistRow objects.
-        :rtype: {'contest': Contest,
-                 'problems': iterator of Problem,
-                 'rows': iterator of RanklistRow}
+        return lambda values: cls.from_dict(values, next(counter) % period == 0, lazy)
+
+    def _get_data(self, method, transform, **kwargs):
         """
-        assert isinstance(contest_id, int), 'contest_id should be of type int, not {}'.format(type(contest_id))
-        assert isinstance(from_, int), 'from_ should be of type int, not {}'.format(type(from_))
-        assert isinstance(count, int) or count is None, 'count should be of type int, not {}'.format(type(count))
-        assert isinstance(handles, list) or handles is None, \
-            'handles should be of type list of str, not {}'.format(type(handles))
-        assert handles is None or len(handles) <= 10000, 'No more than 10000 handles is accepted'
-        assert isinstance(show_unofficial, bool), \
-            'show_unofficial should be of type bool, not {}'.format(type(show_unofficial))
+        Retrieves data by given method with given parameters and transforms it into the method result
 
-        data = self._data_retriever.get_data('contest.standings',
-                                             contestId=contest_id,
-                                             count=count,
-                                             handles=handles,
-                                             showUnofficial=show_unofficial,
-                                             **{'from': from_})
+        :param method: Request method
+        :type method: str
 
-        return {'contest': Contest(data['contest']),
-                'problems': map(Problem, data['problems']),
-                'rows': map(RanklistRow, data['rows'])}
+        :param transform: Function, which makes the method result from retrieved data,
+                          or None if retrieved data is the result
+        :type transform: callable or None
 
-    def contest_status(self, contest_id, handle=None, from_=1, count=None):
+        :param kwargs: HTTP parameters
+        """
+        raise NotImplementedError
+
+    def _get_url_length(self, method, **kwargs):
+        """
+        Returns length of the request url with given method and parameters, including parameters of signed requests
+
+        :param method: Request method
+        :type method: str
+
+        :param kwargs: HTTP parameters
+
+        :return: Length of the url
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _get_unique_handles(handles):
+        """
+        :return: Handles by their lower case in order of the first occurrence
+        :rtype: OrderedDict of [str, str]
+        """
+        assert isinstance(handles, list)
+
+        unique_handles = OrderedDict()
+
+        for handle in handles:
+            assert isinstance(handle, str), 'Handle should have str type, not {}'.format(type(handle))
+            unique_handles.setdefault(handle.lower(), handle)
+
+        return unique_handles
+
+    def _split_handles(self, handles, max_url_length):
+        """
+        Splits handles into chunks, so that every chunk fits into url of user.info request
+        """
+        # Url without handles has the same apiKey, time and apiSig parameters as the signed requests
+        available = max_url_length - self._get_url_length('user.info', handles=[''])
+
+        assert available > 0, 'max_url_length is too small: {}'.format(max_url_length)
+
+        chunks = []
+        chunk = []
+        length = 0
+
+        for handle in handles:
+            if chunk and (length + len(handle) + 1 > available or len(chunk) == self.USER_INFO_MAX_HANDLES):
+                chunks.append(chunk)
+                chunk = []
+                length = 0
+
+            chunk.append(handle)
+            length += len(handle) + 1
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    def _merge_users(self, unique_handles, chunks, results):
+        """
+        Makes users of every chunk in order of the first occurrence of their handles
+
+        :param unique_handles: Requested handles by their lower case
+        :type unique_handles: OrderedDict of [str, str]
+
+        :param chunks: Requested chunks of handles
+        :type chunks: list of list of str
+
+        :param results: Retrieved users of every chunk
+        :type results: list of list of dict
+
+        :rtype: iterator of User
+        """
+        users = {}
+
+        for chunk, result in zip(chunks, results):
+            # Handles are sent sorted, and users are returned in the same order, even if some handle was renamed
+            for handle, user in zip(sorted(chunk), result):
+                users[handle.lower()] = user
+
+        return map(self.get_loader(User), (users[handle] for handle in unique_handles))
+
+    def _transform(self, method, kwargs, data, transform):
+        """
+        Makes the method result from retrieved data. With ChangeDetector the result made from unchanged data is reused
+
+        :param method: Request method
+        :type method: str
+
+        :param kwargs: HTTP parameters
+        :type kwargs: dict
+
+        :param data: Retrieved data
+        :param transform: Function, which makes the method result from retrieved data, or None
+        :type transform: callable or None
+        """
+        if transform is None:
+            return data
+
+        if self._change_detector is None:
+            return transform(data)
+
+        params = tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                              for name, value in kwargs.items()))
+        key = (method, self._validate, self._lazy_objects) + params
+
+        return self._change_detector.transform(key, data, transform)
+
+    def _make_standings(self, data):
+        return {'contest': self.get_loader(Contest)(data['contest']),
+                'problems': map(self.get_loader(Problem), data['problems']),
+                'rows': map(self.get_loader(RanklistRow), data['rows'])}
+
+    def _make_problemset(self, data):
+        return {'problems': map(self.get_loader(Problem), data['problems']),
+                'problemStatistics': map(self.get_loader(ProblemStatistics), data['problemStatistics'])}
+
+    def contest_hacks(self, contest_id):
+        """
+        Returns list of hacks in the specified contests.
+
+        Full information about hacks is available only after some time after the contest end.
+        During the contest user can see only own hacks.
+
+        :param contest_id: Id of the contest.
+                           It is not the round number. It can be seen in contest URL. For example: /contest/374/status
+        :type contest_id: int
+        :return: Returns an iterator of Hack objects.
+        :rtype: iterator of Hack
+        """
+        assert isinstance(contest_id, int)
+
+        return self._get_data('contest.hacks', partial(map, self.get_loader(Hack)), contestId=contest_id)
+
+    def contest_list(self, gym=False):
+        """
+        Returns information about all available contests.
+
+        :param gym: If true — than gym contests are returned. Otherwise, regular contests are returned.
+        :type gym: bool
+        :return: Returns an iterator of Contest objects. If this method is called not anonymously,
+                 then all available contests for a calling user will be returned too,
+                 including mashups and private gyms.
+        :rtype: iterator of Contest
+        """
+        return self._get_data('contest.list', partial(map, self.get_loader(Contest)), gym=gym)
+
+    def contest_rating_changes(self, contest_id):
+        """
+        Returns rating changes after the contest.
+
+        :param contest_id: Id of the contest. It is not the round number. It can be seen in contest URL.
+        :return: Returns an iterator of RatingChange objects.
+        :rtype: iterator of RatingChange
+        """
+        return self._get_data('contest.ratingChanges', partial(map, self.get_loader(RatingChange)),
+                              contestId=contest_id)
+
+    def contest_standings(self, contest_id, from_=1, count=None, handles=None, show_unofficial=False):
+        """
+        Returns the description of the contest and the requested part of the standings.
+
+        :param contest_id: Id of the contest. It is not the round number. It can be seen in contest URL.
+                           For example: /contest/374/status
+        :type contest_id: int
+
+        :param from_: 1-based index of the standings row to start the ranklist.
+        :type from_: int
+
+        :param count: Number of standing rows to return.
+        :type count: int
+
+        :param handles: List of handles. No more than 10000 handles is accepted.
+        :type handles: list of str
+
+        :param show_unofficial: If true than all participants (virtual, out of competition) are shown.
+                                Otherwise, only official contestants are shown.
+        :type show_unofficial: bool
+
+        :return: Returns object with three fields: "contest", "problems" and "rows".
+                 Field "contest" contains a Contest object.
+                 Field "problems" contains an iterator of Problem objects.
+                 Field "rows" contains an iteator of RanklistRow objects.
+        :rtype: {'contest': Contest,
+                 'problems': iterator of Problem,
+                 'rows': iterator of RanklistRow}
+        """
+        return self._get_data('contest.standings', self._make_standings,
+                              **self._get_standings_params(contest_id, from_, count, handles, show_unofficial))
+
+    def contest_standings_data(self, contest_id, from_=1, count=None, handles=None, show_unofficial=False):
+        """
+        Returns the standings as retrieved from the site, without making objects.
+
+        Parameters are the same as in contest_standings. With ChangeDetector the very same object is returned
+        while the standings are unchanged. The data is shared and should not be modified.
+
+        :return: Returns decoded JSON object with three fields: "contest", "problems" and "rows".
+                 Objects can be made from it by loaders returned by get_loader.
+        :rtype: dict
+        """
+        return self._get_data('contest.standings', None,
+                              **self._get_standings_params(contest_id, from_, count, handles, show_unofficial))
+
+    @staticmethod
+    def _get_standings_params(contest_id, from_, count, handles, show_unofficial):
+        """
+        :return: HTTP parameters of contest.standings method
+        :rtype: dict
+        """
+        assert isinstance(contest_id, int), 'contest_id should be of type int, not {}'.format(type(contest_id))
+        assert isinstance(from_, int), 'from_ should be of type int, not {}'.format(type(from_))
+        assert isinstance(count, int) or count is None, 'count should be of type int, not {}'.format(type(count))
+        assert isinstance(handles, list) or handles is None, \
+            'handles should be of type list of str, not {}'.format(type(handles))
+        assert handles is None or len(handles) <= 10000, 'No more than 10000 handles is accepted'
+        assert isinstance(show_unofficial, bool), \
+            'show_unofficial should be of type bool, not {}'.format(type(show_unofficial))
+
+        return {'contestId': contest_id, 'count': count, 'handles': handles, 'showUnofficial': show_unofficial,
+                'from': from_}
+
+    def contest_status(self, contest_id, handle=None, from_=1, count=None):
         """
         Returns submissions for specified contest.
 
@@ -377,13 +1073,12 @@ class CodeforcesAPI:
         assert isinstance(from_, int)
         assert isinstance(count, int) or count is None
 
-        data = self._data_retriever.get_data('contest.status',
-                                             contestId=contest_id,
-                                             handle=handle,
-                                             count=count,
-                                             **{'from': from_})
-
-        return map(Submission, data)
+        return self._get_data('contest.status',
+                              partial(map, self.get_loader(Submission)),
+                              contestId=contest_id,
+                              handle=handle,
+                              count=count,
+                              **{'from': from_})
 
     def problemset_problems(self, tags=None):
         """
@@ -395,10 +1090,7 @@ class CodeforcesAPI:
         :rtype: {'problems': list of Problem,
                  'problemStatistics': list of ProblemStatistics}
         """
-        data = self._data_retriever.get_data('problemset.problems', tags=tags)
-
-        return {'problems': map(Problem, data['problems']),
-                'problemStatistics': map(ProblemStatistics, data['problemStatistics'])}
+        return self._get_data('problemset.problems', self._make_problemset, tags=tags)
 
     def problemset_recent_status(self, count):
         """
@@ -413,9 +1105,7 @@ class CodeforcesAPI:
         assert isinstance(count, int)
         assert 0 < count <= 1000
 
-        data = self._data_retriever.get_data('problemset.recentStatus', count=count)
-
-        return map(Submission, data)
+        return self._get_data('problemset.recentStatus', partial(map, self.get_loader(Submission)), count=count)
 
     def user_info(self, handles):
         """
@@ -428,9 +1118,7 @@ class CodeforcesAPI:
         """
         assert isinstance(handles, list)
 
-        data = self._data_retriever.get_data('user.info', handles=handles)
-
-        return map(User, data)
+        return self._get_data('user.info', partial(map, self.get_loader(User)), handles=handles)
 
     def user_rated_list(self, active_only=False):
         """
@@ -444,9 +1132,7 @@ class CodeforcesAPI:
         """
         assert isinstance(active_only, bool)
 
-        data = self._data_retriever.get_data('user.ratedList', activeOnly=active_only)
-
-        return map(User, data)
+        return self._get_data('user.ratedList', partial(map, self.get_loader(User)), activeOnly=active_only)
 
     def user_rating(self, handle):
         """
@@ -460,9 +1146,7 @@ class CodeforcesAPI:
         """
         assert isinstance(handle, str), 'Handle should have str type, not {}'.format(type(handle))
 
-        data = self._data_retriever.get_data('user.rating', handle=handle)
-
-        return map(RatingChange, data)
+        return self._get_data('user.rating', partial(map, self.get_loader(RatingChange)), handle=handle)
 
     def user_status(self, handle, from_=1, count=None):
         """
@@ -481,6 +1165,562 @@ class CodeforcesAPI:
         assert isinstance(from_, int)
         assert isinstance(count, int) or count is None
 
-        data = self._data_retriever.get_data('user.status', handle=handle, count=count, **{'from': from_})
+        return self._get_data('user.status', partial(map, self.get_loader(Submission)),
+                              handle=handle, count=count, **{'from': from_})
+
+
+class CodeforcesAPI(BaseCodeforcesAPI):
+    """
+    This class provides api for retrieving data from codeforces.com
+
+    One object can be shared by several threads, e.g. workers of ThreadPoolExecutor.
+    """
+
+    def __init__(self, lang='en', key=None, secret=None, pool_size=None, rate_limit=0.5, burst=1,
+                 retry_policy=RetryPolicy(), response_cache=None, disk_cache=None, offline=False, transport=None,
+                 base_url=None, coalesce_requests=True, json_decoder=None, compressed_transfer=True,
+                 change_detector=None, validate=True, lazy_objects=False):
+        """
+        :param lang: Language
+        :type lang: str or CodeforcesLanguage
+
+        :param key: Private API key. Ignored if secret is None
+        :type key: str
+
+        :param secret: Private API secret. Ignored if key is None
+        :type secret: str
+
+        :param pool_size: If presented, requests reuse keep-alive connections,
+                          and at most pool_size idle connections are kept for every host.
+                          Otherwise, every request opens a new connection
+        :type pool_size: int or None
+
+        :param rate_limit: Maximum number of requests per second. By default, one request per two seconds is allowed.
+                           The limit is shared by all CodeforcesAPI objects with the same API key within the process,
+                           and the strictest limit among them is used.
+                           If None, requests are not limited
+        :type rate_limit: float or None
+
+        :param burst: Maximum number of requests, which can be sent at once after a period of inactivity
+        :type burst: int
+
+        :param retry_policy: Policy for retrying failed requests. By default, requests failed with network errors,
+                             5xx status codes or "Call limit exceeded" are retried up to three times.
+                             If None, failed requests are not retried
+        :type retry_policy: RetryPolicy or None
+
+        :param response_cache: Cache of decoded responses, which can be shared between several CodeforcesAPI objects.
+                               If None, responses are not cached
+        :type response_cache: ResponseCache or None
+
+        :param disk_cache: Cache of raw responses stored on disk, which is reused across processes and restarts.
+                           If None, responses are not stored
+        :type disk_cache: DiskCache or None
+
+        :param offline: If true, responses are served only from the disk cache,
+                        and ValueError is raised if the response is not stored. Requires disk_cache
+        :type offline: bool
+
+        :param transport: Transport, which sends requests, e.g. HTTPConnectionPool or ReplayTransport.
+                          Can not be used together with pool_size
+        :type transport: Transport or None
+
+        :param base_url: Base of API url, e.g. 'http://127.0.0.1:8000/api/' for LocalCodeforcesServer.
+                         By default, it is chosen by language
+        :type base_url: str or None
+
+        :param coalesce_requests: If true, identical requests made concurrently from several threads
+                                  share one network request and one decoded response
+        :type coalesce_requests: bool
+
+        :param json_decoder: Decoder of responses, e.g. JsonDecoder('json') to force the standard library.
+                             If None, the default decoder is used, which prefers orjson or ujson if installed
+        :type json_decoder: JsonDecoder or None
+
+        :param compressed_transfer: If true, responses are requested with gzip or deflate compression
+                                    and decompressed while they are read. Saved bytes are counted in statistics
+        :type compressed_transfer: bool
+
+        :param change_detector: Detector of unchanged responses, e.g. for polling contest_standings during a round.
+                                Requests are made conditional if the server sent ETag or Last-Modified,
+                                and neither decoded nor made into objects again.
+                                If None, every response is decoded
+        :type change_detector: ChangeDetector or None
+
+        :param validate: If true, types of all fields of returned objects are checked like property setters do.
+                         If false, data from the server is trusted, and objects are made faster without checks.
+                         If float, only this share of objects is checked, e.g. 0.01 checks the first object
+                         of every response and then every 100th one, so that changes of the API are still caught
+        :type validate: bool or float
+
+        :param lazy_objects: If true, returned objects keep decoded data, and every field is converted
+                             (and checked according to validate) on the first access.
+                             It is much faster if only a few fields of every object are read
+        :type lazy_objects: bool
+        """
+        assert transport is None or pool_size is None, 'transport and pool_size can not be used together'
+
+        self.validate = validate
+        self.lazy_objects = lazy_objects
+        self._change_detector = change_detector
+
+        if pool_size is not None:
+            transport = HTTPConnectionPool(pool_size)
+
+        self._data_retriever = CodeforcesDataRetriever(CodeforcesLanguage(lang), key, secret, transport,
+                                                       rate_limit, burst, retry_policy, response_cache,
+                                                       disk_cache, offline, base_url, coalesce_requests,
+                                                       json_decoder, compressed_transfer, change_detector)
+
+    @property
+    def retry_counts(self):
+        """
+        :return: Total number of retries for every method, which needed at least one retry
+        :rtype: dict of [str, int]
+        """
+        return self._data_retriever.retry_counts
+
+    @property
+    def statistics(self):
+        """
+        :return: Statistics of requests made by all threads
+        :rtype: RequestStatistics
+        """
+        return self._data_retriever.statistics
+
+    @property
+    def thread_statistics(self):
+        """
+        :return: Statistics of requests made by the current thread
+        :rtype: RequestStatistics
+        """
+        return self._data_retriever.thread_statistics
+
+    def set_credentials(self, key, secret):
+        """
+        Changes API key and secret. Requests, which are already in progress, keep using the old ones
+
+        :param key: Private API key
+        :type key: str or None
+
+        :param secret: Private API secret
+        :type secret: str or None
+        """
+        self._data_retriever.set_credentials(key, secret)
+
+    def _get_data(self, method, transform, **kwargs):
+        return self._transform(method, kwargs, self._data_retriever.get_data(method, **kwargs), transform)
+
+    def _get_url_length(self, method, **kwargs):
+        return self._data_retriever.get_url_length(method, **kwargs)
+
+    def user_info(self, handles, max_url_length=2000, max_workers=4):
+        """
+        Returns information about one or several users.
+
+        Duplicated handles are requested once. Handles are split into chunks, so that url of every request
+        is no longer than max_url_length, and chunks are requested concurrently within the rate limit.
+
+        :param handles: List of handles.
+        :type handles: list of str
+
+        :param max_url_length: Maximum length of request url.
+        :type max_url_length: int
+
+        :param max_workers: Maximum number of concurrent requests.
+        :type max_workers: int
+
+        :return: Returns an iterator of User objects in order of the first occurrence of their handles.
+        :rtype: iterator of User
+        """
+        assert isinstance(max_workers, int) and max_workers > 0, \
+            'max_workers should be positive int, not {}'.format(max_workers)
+
+        unique_handles = self._get_unique_handles(handles)
+        chunks = self._split_handles(list(unique_handles.values()), max_url_length)
+
+        def get_users(chunk):
+            return self._data_retriever.get_data('user.info', handles=chunk)
+
+        if len(chunks) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                results = list(executor.map(get_users, chunks))
+        else:
+            results = list(map(get_users, chunks))
+
+        return self._merge_users(unique_handles, chunks, results)
+
+    def bulk_user_rating(self, handles, max_workers=4, cache=None, progress=None, errors=None):
+        """
+        Returns rating histories of several users.
+
+        Histories are retrieved concurrently by at most max_workers threads within the rate limit
+        and yielded as soon as they are retrieved, so their order differs from the order of handles.
+
+        :param handles: Codeforces user handles. Duplicates are retrieved once, handles are compared case-insensitively.
+        :type handles: iterable of str
+
+        :param max_workers: Maximum number of concurrent requests.
+        :type max_workers: int
+
+        :param cache: Mapping of handles to their rating histories, e.g. dict or shelve.
+                      Cached handles are not requested, and retrieved histories are stored into it.
+        :type cache: dict of [str, list of RatingChange] or None
+
+        :param progress: Function, which is called with BulkProgress after every handle.
+        :type progress: callable or None
+
+        :param errors: Function, which is called with handle and exception, if its history is not retrieved.
+                       Such handles are skipped and the other histories are still yielded.
+                       If None, the exception is raised from the generator.
+        :type errors: callable or None
+
+        :return: Returns a generator of pairs of handle and list of RatingChange objects.
+        :rtype: iterator of (str, list of RatingChange)
+        """
+        assert isinstance(max_workers, int) and max_workers > 0, \
+            'max_workers should be positive int, not {}'.format(max_workers)
+
+        unique_handles = OrderedDict()
+
+        for handle in handles:
+            unique_handles.setdefault(handle.lower(), handle)
+
+        handles = list(unique_handles.values())
+        start = time.monotonic()
+        completed = 0
+        cached = 0
+
+        def report():
+            if progress is not None:
+                progress(BulkProgress(completed, len(handles), cached, time.monotonic() - start))
+
+        load = self.get_loader(RatingChange)
+
+        def get_rating(handle):
+            try:
+                return handle, list(map(load, self._data_retriever.get_data('user.rating', handle=handle))), None
+            except Exception as e:
+                return handle, None, e
+
+        not_cached = []
+
+        for handle in handles:
+            if cache is not None and handle in cache:
+                completed += 1
+                cached += 1
+                report()
+                yield handle, cache[handle]
+            else:
+                not_cached.append(handle)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = set()
+        remaining = iter(not_cached)
+
+        try:
+            while True:
+                # Keep the queue short, so that handles are not requested after the generator is closed
+                for handle in remaining:
+                    pending.add(executor.submit(get_rating, handle))
+
+                    if len(pending) >= 2 * max_workers:
+                        break
+
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    handle, rating_changes, error = future.result()
+
+                    if error is not None and errors is None:
+                        raise error
+
+                    completed += 1
+
+                    if error is not None:
+                        errors(handle, error)
+                        report()
+                        continue
+
+                    if cache is not None:
+                        cache[handle] = rating_changes
+
+                    report()
+                    yield handle, rating_changes
+        finally:
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    def stream_contest_standings(self, contest_id, from_=1, count=None, handles=None, show_unofficial=False):
+        """
+        Returns rows of the standings for specified contest, parsing them while the response is received.
+
+        Only one row is held in memory at once. Responses are not cached.
+
+        :param contest_id: Id of the contest.
+        :type contest_id: int
+
+        :param from_: 1-based index of the standings row to start the ranklist.
+        :type from_: int
+
+        :param count: Number of standing rows to return.
+        :type count: int
+
+        :param handles: List of handles. No more than 10000 handles is accepted.
+        :type handles: list of str
+
+        :param show_unofficial: If true than all participants (virtual, out of competition) are shown.
+                                Otherwise, only official contestants are shown.
+        :type show_unofficial: bool
+
+        :return: Returns a generator of RanklistRow objects.
+        :rtype: iterator of RanklistRow
+        """
+        assert isinstance(contest_id, int)
+        assert isinstance(from_, int)
+        assert isinstance(count, int) or count is None
+        assert isinstance(handles, list) or handles is None
+        assert isinstance(show_unofficial, bool)
+
+        rows = self._data_retriever.iter_data('contest.standings', ('result', 'rows'), contestId=contest_id,
+                                              count=count, handles=handles, showUnofficial=show_unofficial,
+                                              **{'from': from_})
+
+        return map(self.get_loader(RanklistRow), rows)
+
+    def stream_contest_status(self, contest_id, handle=None, from_=1, count=None):
+        """
+        Returns submissions for specified contest, parsing them while the response is received.
+
+        Only one submission is held in memory at once. Responses are not cached.
+
+        :param contest_id: Id of the contest.
+        :type contest_id: int
+
+        :param handle: Codeforces user handle.
+        :type handle: str
+
+        :param from_: 1-based index of the first submission to return.
+        :type from_: int
+
+        :param count: Number of returned submissions.
+        :type count: int
+
+        :return: Returns a generator of Submission objects, sorted in decreasing order of submission id.
+        :rtype: iterator of Submission
+        """
+        assert isinstance(contest_id, int)
+        assert isinstance(handle, str) or handle is None
+        assert isinstance(from_, int)
+        assert isinstance(count, int) or count is None
+
+        submissions = self._data_retriever.iter_data('contest.status', contestId=contest_id, handle=handle,
+                                                     count=count, **{'from': from_})
+
+        return map(self.get_loader(Submission), submissions)
+
+    def stream_user_status(self, handle, from_=1, count=None):
+        """
+        Returns submissions of specified user, parsing them while the response is received.
+
+        Only one submission is held in memory at once. Responses are not cached.
+
+        :param handle: Codeforces user handle.
+        :type handle: str
+
+        :param from_: 1-based index of the first submission to return
+        :type from_: int
+
+        :param count: Number of returned submissions.
+        :type count: int or None
+
+        :return: Returns a generator of Submission objects, sorted in decreasing order of submission id.
+        :rtype: iterator of Submission
+        """
+        assert isinstance(handle, str)
+        assert isinstance(from_, int)
+        assert isinstance(count, int) or count is None
+
+        submissions = self._data_retriever.iter_data('user.status', handle=handle, count=count, **{'from': from_})
+
+        return map(self.get_loader(Submission), submissions)
+
+    def stream_user_rated_list(self, active_only=False):
+        """
+        Returns the list of all rated users, parsing them while the response is received.
+
+        Only one user is held in memory at once. Responses are not cached.
+
+        :param active_only: If true then only users, who participated in rated contest during the last month are
+                            returned. Otherwise, all users with at least one rated contest are returned.
+        :type active_only: bool
+
+        :return: Returns a generator of User objects, sorted in decreasing order of rating.
+        :rtype: iterator of User
+        """
+        assert isinstance(active_only, bool)
+
+        return map(self.get_loader(User), self._data_retriever.iter_data('user.ratedList', activeOnly=active_only))
+
+    def iter_contest_status(self, contest_id, handle=None, page_size=1000, prefetch=True):
+        """
+        Returns submissions for specified contest, retrieving them page by page.
+
+        Only the current page (and the next one, if prefetch is enabled) is held in memory.
+
+        :param contest_id: Id of the contest.
+        :type contest_id: int
+
+        :param handle: Codeforces user handle.
+        :type handle: str
+
+        :param page_size: Number of submissions retrieved by one request.
+        :type page_size: int
+
+        :param prefetch: If true, the next page is retrieved in background while the current one is processed.
+        :type prefetch: bool
+
+        :return: Returns a generator of Submission objects, sorted in decreasing order of submission id.
+        :rtype: iterator of Submission
+        """
+        assert isinstance(contest_id, int)
+        assert isinstance(handle, str) or handle is None
+
+        return self._iter_submission_pages('contest.status', page_size, prefetch, contestId=contest_id, handle=handle)
+
+    def iter_user_status(self, handle, page_size=1000, prefetch=True):
+        """
+        Returns submissions of specified user, retrieving them page by page.
+
+        Only the current page (and the next one, if prefetch is enabled) is held in memory.
+
+        :param handle: Codeforces user handle.
+        :type handle: str
+
+        :param page_size: Number of submissions retrieved by one request.
+        :type page_size: int
+
+        :param prefetch: If true, the next page is retrieved in background while the current one is processed.
+        :type prefetch: bool
+
+        :return: Returns a generator of Submission objects, sorted in decreasing order of submission id.
+        :rtype: iterator of Submission
+        """
+        assert isinstance(handle, str)
+
+        return self._iter_submission_pages('user.status', page_size, prefetch, handle=handle)
+
+    def contest_status_since(self, contest_id, since_id, handle=None, page_size=100):
+        """
+        Returns submissions for specified contest, which are newer than the given one.
+
+        Pages are retrieved only until a submission with id not greater than since_id is met.
+
+        :param contest_id: Id of the contest.
+        :type contest_id: int
+
+        :param since_id: Id of the latest known submission. If None, all submissions are returned.
+        :type since_id: int or None
+
+        :param handle: Codeforces user handle.
+        :type handle: str
+
+        :param page_size: Number of submissions retrieved by one request.
+        :type page_size: int
+
+        :return: Returns a list of new Submission objects, sorted in decreasing order of submission id.
+        :rtype: list of Submission
+        """
+        submissions = self.iter_contest_status(contest_id, handle, page_size, prefetch=False)
+
+        return self._take_newer(submissions, since_id)
+
+    def user_status_since(self, handle, since_id, page_size=100):
+        """
+        Returns submissions of specified user, which are newer than the given one.
+
+        Pages are retrieved only until a submission with id not greater than since_id is met.
+
+        :param handle: Codeforces user handle.
+        :type handle: str
+
+        :param since_id: Id of the latest known submission. If None, all submissions are returned.
+        :type since_id: int or None
+
+        :param page_size: Number of submissions retrieved by one request.
+        :type page_size: int
+
+        :return: Returns a list of new Submission objects, sorted in decreasing order of submission id.
+        :rtype: list of Submission
+        """
+        submissions = self.iter_user_status(handle, page_size, prefetch=False)
+
+        return self._take_newer(submissions, since_id)
+
+    @staticmethod
+    def _take_newer(submissions, since_id):
+        assert isinstance(since_id, int) or since_id is None
+
+        result = []
+
+        try:
+            for submission in submissions:
+                if since_id is not None and submission.id <= since_id:
+                    break
+
+                result.append(submission)
+        finally:
+            submissions.close()
+
+        return result
+
+    def _iter_submission_pages(self, method, page_size, prefetch, **kwargs):
+        """
+        Yields submissions of consecutive pages of the given method.
+
+        New submissions shift the pages while they are retrieved, so submissions with id not less than
+        the last yielded one are skipped.
+        """
+        assert isinstance(page_size, int) and page_size > 0, \
+            'page_size should be positive int, not {}'.format(page_size)
+        assert isinstance(prefetch, bool)
+
+        def get_page(from_):
+            return self._data_retriever.get_data(method, count=page_size, **dict(kwargs, **{'from': from_}))
+
+        load = self.get_loader(Submission)
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        next_page = None
+        last_id = None
+        from_ = 1
+
+        try:
+            page = get_page(from_)
+
+            while page:
+                from_ += page_size
+
+                if executor is not None and len(page) == page_size:
+                    next_page = executor.submit(get_page, from_)
+
+                for data in page:
+                    if last_id is None or data['id'] < last_id:
+                        last_id = data['id']
+                        yield load(data)
+
+                if len(page) < page_size:
+                    break
+
+                page = next_page.result() if next_page is not None else get_page(from_)
+                next_page = None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
-        return map(Submission, data)
+            if executor is not None:
+                executor.shutdown(wait=False)
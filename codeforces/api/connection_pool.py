@@ -0,0 +1,207 @@
+"""
+This module provides pool of persistent HTTP connections
+"""
+
+import http.client
+import threading
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+from .transport import Transport
+
+
+__all__ = ['HTTPConnectionPool']
+
+
+class HTTPConnectionPool(Transport):
+    """
+    This class keeps HTTP/1.1 keep-alive connections and reuses them between requests to the same host.
+
+    Every request takes an idle connection for the requested host or opens a new one if there are no idle connections.
+    After the response is read the connection is returned back to the pool,
+    unless the pool already keeps pool_size idle connections for this host.
+    The pool can be used from several threads at once: a connection is used by one request at a time.
+    """
+
+    _connection_classes = {
+        'http': http.client.HTTPConnection,
+        'https': http.client.HTTPSConnection
+    }
+
+    def __init__(self, pool_size=4, timeout=None):
+        """
+        :param pool_size: Maximum number of idle connections kept for every host
+        :type pool_size: int
+
+        :param timeout: Socket timeout in seconds. None means the global default timeout
+        :type timeout: float or None
+        """
+        assert isinstance(pool_size, int) and pool_size > 0, 'pool_size should be positive int, not {}'.format(pool_size)
+        assert isinstance(timeout, (int, float)) or timeout is None
+
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pool_size(self):
+        """
+        :return: Maximum number of idle connections kept for every host
+        :rtype: int
+        """
+        return self._pool_size
+
+    def urlopen(self, url, headers=None):
+        """
+        Sends GET request to the given url using one of pooled connections.
+
+        Like urllib.request.urlopen, raises HTTPError if server responded with error status.
+
+        :param url: Url
+        :type url: str
+
+        :param headers: Additional request headers
+        :type headers: dict of [str, str] or None
+
+        :return: File-like response object. The response should be closed (or used as a context manager)
+                 to return the connection back to the pool
+        :rtype: PooledResponse
+        """
+        parts = urlsplit(url)
+        host_key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+
+        if parts.query:
+            path += '?' + parts.query
+
+        request_headers = {'Connection': 'keep-alive'}
+        request_headers.update(headers or {})
+
+        connection, reused = self._acquire(host_key)
+
+        try:
+            response = self._send(connection, path, request_headers)
+        except (http.client.HTTPException, OSError):
+            connection.close()
+
+            if not reused:
+                raise
+
+            # The server has closed the idle connection, so retry once with a fresh one
+            connection, reused = self._new_connection(host_key), False
+
+            try:
+                response = self._send(connection, path, request_headers)
+            except Exception:
+                connection.close()
+                raise
+        except Exception:
+            connection.close()
+            raise
+
+        pooled_response = PooledResponse(self, host_key, connection, response)
+
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, pooled_response)
+
+        return pooled_response
+
+    def clear(self):
+        """
+        Closes all idle connections
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    @staticmethod
+    def _send(connection, path, headers):
+        connection.request('GET', path, headers=headers)
+        return connection.getresponse()
+
+    def _acquire(self, host_key):
+        with self._lock:
+            connections = self._idle.get(host_key)
+
+            if connections:
+                return connections.pop(), True
+
+        return self._new_connection(host_key), False
+
+    def _new_connection(self, host_key):
+        scheme, netloc = host_key
+
+        try:
+            connection_class = self._connection_classes[scheme]
+        except KeyError:
+            raise ValueError('Unsupported url scheme', scheme)
+
+        if self._timeout is None:
+            return connection_class(netloc)
+        else:
+            return connection_class(netloc, timeout=self._timeout)
+
+    def _release(self, host_key, connection):
+        with self._lock:
+            connections = self._idle.setdefault(host_key, [])
+
+            if len(connections) < self._pool_size:
+                connections.append(connection)
+                return
+
+        connection.close()
+
+
+class PooledResponse:
+    """
+    File-like wrapper of http.client.HTTPResponse, which returns the connection to the pool on close
+    """
+
+    def __init__(self, pool, host_key, connection, response):
+        self._pool = pool
+        self._host_key = host_key
+        self._connection = connection
+        self._response = response
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def status(self):
+        return self._response.status
+
+    @property
+    def reason(self):
+        return self._response.reason
+
+    @property
+    def headers(self):
+        return self._response.headers
+
+    def getheader(self, name, default=None):
+        return self._response.getheader(name, default)
+
+    def read(self, amt=None):
+        return self._response.read(amt)
+
+    def close(self):
+        """
+        Returns the connection to the pool if the response was read completely. Otherwise, closes the connection
+        """
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool._release(self._host_key, connection)
+        else:
+            self._response.close()
+            connection.close()
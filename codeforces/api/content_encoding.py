@@ -0,0 +1,165 @@
+"""
+This module provides decompression of HTTP responses sent with gzip or deflate content encoding
+"""
+
+import zlib
+
+
+__all__ = ['ACCEPT_ENCODING', 'DecompressingReader', 'decompress', 'get_content_encoding']
+
+
+ACCEPT_ENCODING = 'gzip, deflate'
+
+
+def get_content_encoding(headers):
+    """
+    :param headers: Response headers
+    :type headers: http.client.HTTPMessage or dict of [str, str] or None
+
+    :return: Lower-cased content encoding of the response or None if the response is not encoded
+    :rtype: str or None
+    """
+    if not headers:
+        return None
+
+    value = headers.get('Content-Encoding', headers.get('content-encoding'))
+
+    if isinstance(value, str) and value.strip():
+        return value.strip().lower()
+
+    return None
+
+
+def _make_decompressor(encoding):
+    """
+    :return: Decompressor for the given encoding or None if the encoding is not supported
+    """
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    if encoding == 'deflate':
+        return _DeflateDecompressor()
+
+    return None
+
+
+class _DeflateDecompressor:
+    """
+    Decompressor of deflate encoding. Some servers send raw deflate stream instead of zlib one,
+    so the format is detected by the first bytes
+    """
+
+    def __init__(self):
+        self._decompressor = None
+
+    @property
+    def unconsumed_tail(self):
+        return self._decompressor.unconsumed_tail if self._decompressor is not None else b''
+
+    def decompress(self, data, max_length=0):
+        if self._decompressor is None:
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS)
+
+            try:
+                return self._decompressor.decompress(data, max_length)
+            except zlib.error:
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+
+        return self._decompressor.decompress(data, max_length)
+
+    def flush(self):
+        return self._decompressor.flush() if self._decompressor is not None else b''
+
+
+class DecompressingReader:
+    """
+    File-like wrapper, which decompresses the stream while it is read.
+
+    The stream is read by chunks, so the whole compressed response is never held in memory.
+    Streams with unsupported or missing encoding are passed through.
+    """
+
+    def __init__(self, stream, encoding, chunk_size=64 * 1024):
+        """
+        :param stream: Binary file-like object
+        :param encoding: Content encoding of the stream
+        :type encoding: str or None
+        :param chunk_size: Number of compressed bytes read at once
+        :type chunk_size: int
+        """
+        self._stream = stream
+        self._decompressor = _make_decompressor(encoding)
+        self._chunk_size = chunk_size
+        self._pending = b''
+        self._eof = False
+        self.compressed_size = 0
+        self.size = 0
+
+    def read(self, amt=None):
+        """
+        :param amt: Maximum number of decompressed bytes to return. If None or negative, the rest is returned
+        :type amt: int or None
+
+        :return: Decompressed bytes. Empty bytes mean the end of the stream
+        :rtype: bytes
+        """
+        if self._decompressor is None:
+            data = self._stream.read() if amt is None or amt < 0 else self._stream.read(amt)
+            self.compressed_size += len(data)
+            self.size += len(data)
+            return data
+
+        if amt is None or amt < 0:
+            parts = [self._pending]
+            self._pending = b''
+
+            while not self._eof:
+                parts.append(self._decompress_chunk(0))
+
+            data = b''.join(parts)
+        else:
+            while not self._pending and not self._eof:
+                self._pending = self._decompress_chunk(amt)
+
+            data, self._pending = self._pending[:amt], self._pending[amt:]
+
+        self.size += len(data)
+
+        return data
+
+    def _decompress_chunk(self, max_length):
+        tail = self._decompressor.unconsumed_tail
+
+        if tail:
+            return self._decompressor.decompress(tail, max_length)
+
+        chunk = self._stream.read(self._chunk_size)
+
+        if not chunk:
+            self._eof = True
+            return self._decompressor.flush()
+
+        self.compressed_size += len(chunk)
+
+        return self._decompressor.decompress(chunk, max_length)
+
+
+def decompress(data, encoding):
+    """
+    Decompresses the whole response body
+
+    :param data: Response body
+    :type data: bytes
+
+    :param encoding: Content encoding of the body
+    :type encoding: str or None
+
+    :return: Decompressed body. Bodies with unsupported or missing encoding are returned as is
+    :rtype: bytes
+    """
+    decompressor = _make_decompressor(encoding)
+
+    if decompressor is None:
+        return data
+
+    return decompressor.decompress(data) + decompressor.flush()
@@ -0,0 +1,246 @@
+"""
+This module provides on-disk cache of raw API responses
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+__all__ = ['DiskCache']
+
+
+class DiskCache:
+    """
+    This class stores compressed raw responses in a directory, so that they can be reused by other processes.
+
+    Every response is stored in a separate file, named by SHA-256 hash of the request key.
+    Responses older than the time to live of their method are considered expired. Responses of excluded methods,
+    by default the ones, which change during contests, are not stored. When total size of stored files
+    exceeds max_size bytes, the oldest files are removed.
+    """
+
+    DEFAULT_EXCLUDED_METHODS = frozenset([
+        'contest.standings',
+        'contest.status',
+        'problemset.recentStatus',
+        'user.status'
+    ])
+
+    _extensions = {
+        'gzip': '.json.gz',
+        'zstd': '.json.zst'
+    }
+
+    def __init__(self, directory, ttl=24 * 3600, max_size=1024 * 1024 * 1024, compression='gzip', ttls=None,
+                 excluded_methods=None):
+        """
+        :param directory: Cache directory. It is created if it does not exist
+        :type directory: str
+
+        :param ttl: Time to live of responses in seconds for methods, which are not presented in ttls.
+                    If None, responses never expire
+        :type ttl: float or None
+
+        :param max_size: Maximum total size of stored files in bytes
+        :type max_size: int
+
+        :param compression: Compression of stored responses: 'gzip' or 'zstd'. zstd requires zstandard package
+        :type compression: str
+
+        :param ttls: Time to live in seconds for every method. None means that responses of the method never expire
+        :type ttls: dict of [str, float or None] or None
+
+        :param excluded_methods: Methods, which responses are not stored. By default, DEFAULT_EXCLUDED_METHODS is used
+        :type excluded_methods: set of str or None
+        """
+        assert isinstance(directory, str)
+        assert isinstance(ttl, (int, float)) or ttl is None
+        assert isinstance(ttls, dict) or ttls is None
+        assert isinstance(excluded_methods, (set, frozenset)) or excluded_methods is None
+        assert isinstance(max_size, int) and max_size > 0, 'max_size should be positive int, not {}'.format(max_size)
+
+        if compression not in self._extensions:
+            raise ValueError('Unknown compression', compression)
+
+        if compression == 'zstd' and zstandard is None:
+            raise ValueError('zstd compression requires zstandard package')
+
+        self._directory = directory
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._excluded_methods = frozenset(self.DEFAULT_EXCLUDED_METHODS if excluded_methods is None
+                                           else excluded_methods)
+        self._max_size = max_size
+        self._compression = compression
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._size = sum(size for _, _, size in self._list_files())
+
+    @property
+    def directory(self):
+        """
+        :return: Cache directory
+        :rtype: str
+        """
+        return self._directory
+
+    def is_cached(self, method):
+        """
+        :param method: Request method
+        :type method: str
+
+        :return: True if responses of the method are stored
+        :rtype: bool
+        """
+        return method not in self._excluded_methods
+
+    def get_ttl(self, method):
+        """
+        :param method: Request method
+        :type method: str
+
+        :return: Time to live in seconds for the given method or None if its responses never expire
+        :rtype: float or None
+        """
+        return self._ttls.get(method, self._ttl)
+
+    def get(self, key, ignore_ttl=False, method=None):
+        """
+        :param key: Key of the request
+        :type key: tuple
+
+        :param ignore_ttl: If true, expired responses are returned too, e.g. in offline mode
+        :type ignore_ttl: bool
+
+        :param method: Request method, which time to live is used. If None, the default one is used
+        :type method: str or None
+
+        :return: Raw response or None if it is not stored or expired
+        :rtype: bytes or None
+        """
+        digest = self._digest(key)
+        ttl = self.get_ttl(method) if method is not None else self._ttl
+
+        for compression, extension in self._extensions.items():
+            if compression == 'zstd' and zstandard is None:
+                continue
+
+            path = os.path.join(self._directory, digest + extension)
+
+            try:
+                modified = os.path.getmtime(path)
+
+                # A file with other compression can be fresher, e.g. after the compression was changed
+                if not ignore_ttl and ttl is not None and modified + ttl < time.time():
+                    continue
+
+                with open(path, 'rb') as f:
+                    return self._decompress(compression, f.read())
+            except FileNotFoundError:
+                continue
+
+        return None
+
+    def put(self, key, answer):
+        """
+        Stores the raw response
+
+        :param key: Key of the request
+        :type key: tuple
+
+        :param answer: Raw response
+        :type answer: bytes
+        """
+        data = self._compress(answer)
+        path = os.path.join(self._directory, self._digest(key) + self._extensions[self._compression])
+
+        fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        with self._lock:
+            self._size += len(data) - old_size
+
+            if self._size > self._max_size:
+                self._evict()
+
+    def clear(self):
+        """
+        Removes all stored responses
+        """
+        with self._lock:
+            for path, _, _ in self._list_files():
+                self._remove(path)
+
+            self._size = 0
+
+    def _evict(self):
+        files = sorted(self._list_files(), key=lambda f: f[1])
+        self._size = sum(size for _, _, size in files)
+
+        for path, _, size in files:
+            if self._size <= self._max_size:
+                break
+
+            if self._remove(path):
+                self._size -= size
+
+    def _list_files(self):
+        files = []
+
+        for name in os.listdir(self._directory):
+            if name.endswith(tuple(self._extensions.values())):
+                path = os.path.join(self._directory, name)
+
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+
+                files.append((path, stat.st_mtime, stat.st_size))
+
+        return files
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _digest(key):
+        return hashlib.sha256('\n'.join(map(str, key)).encode('utf-8')).hexdigest()
+
+    def _compress(self, data):
+        if self._compression == 'zstd':
+            return zstandard.ZstdCompressor().compress(data)
+        else:
+            return gzip.compress(data)
+
+    @staticmethod
+    def _decompress(compression, data):
+        if compression == 'zstd':
+            return zstandard.ZstdDecompressor().decompress(data)
+        else:
+            return gzip.decompress(data)
@@ -2,51 +2,553 @@
 This module contains class for representing base json object
 """
 
-import json
-import copy
+from enum import Enum
+from functools import partial
 
+from codeforces.utils import TRUSTED
+from codeforces.utils import get_default_json_decoder
+from codeforces.utils import lazy_property
 
-__all__ = ['BaseJsonObject']
 
+__all__ = ['BaseJsonObject', 'JsonField', 'list_of']
 
-class BaseJsonObject:
+
+class JsonField:
+    """
+    Describes how a field of JSON object is loaded into an attribute of BaseJsonObject
+    """
+
+    __slots__ = ('key', 'attribute', 'converter', 'types', 'required', 'lazy', 'default')
+
+    def __init__(self, key, attribute, converter=None, types=None, required=True, lazy=False, default=None):
+        """
+        :param key: Key of the field in JSON object
+        :type key: str
+
+        :param attribute: Name of the property. The value is stored in '_<attribute>' slot
+        :type attribute: str
+
+        :param converter: Function, which makes the attribute value from not None field value.
+                          Enum or BaseJsonObject subclass can be given. str means that the value is not converted.
+                          If None, the value is not converted
+        :type converter: callable or None
+
+        :param types: Types of not None field value, which are accepted if the loading is validated.
+                      By default, they are chosen by the converter: int, float and bool accept str too,
+                      Enum accepts str, BaseJsonObject accepts str and dict. If None, the value is not checked
+        :type types: type or tuple of type or None
+
+        :param required: If true, ValueError is raised when the field is missing.
+                         Otherwise, the attribute is None
+        :type required: bool
+
+        :param lazy: If true, the value is stored as is and converted by the lazy_property setter
+                     on the first access. Objects made by BaseJsonObject subclass or list_of converter
+                     are made lazy if the object itself is lazy
+        :type lazy: bool
+
+        :param default: Value of the attribute if the optional field is missing or null
+        """
+        self.key = key
+        self.attribute = attribute
+        self.converter = converter
+        self.types = types if types is not None else self._get_default_types(converter)
+        self.required = required
+        self.lazy = lazy
+        self.default = default
+
+    def __repr__(self):
+        return '<JsonField: {} -> {}>'.format(self.key, self.attribute)
+
+    @staticmethod
+    def _get_default_types(converter):
+        if converter in (int, float, bool):
+            return converter, str
+        elif converter is str:
+            return str
+        elif isinstance(converter, type) and issubclass(converter, Enum):
+            return converter, str
+        elif isinstance(converter, type) and issubclass(converter, BaseJsonObject):
+            return converter, str, dict
+
+        return getattr(converter, 'types', None)
+
+
+def list_of(cls):
+    """
+    :param cls: Class of list items
+    :type cls: type
+
+    :return: Converter of list, which makes objects of the given class from items
+    :rtype: callable
+    """
+    def convert(values):
+        return [value if isinstance(value, cls) else cls(value) for value in values]
+
+    def convert_unchecked(values):
+        return [value if isinstance(value, cls) else cls.from_dict(value, False) for value in values]
+
+    convert.types = list
+    convert.unchecked = convert_unchecked
+    convert.item_class = cls
+
+    return convert
+
+
+class _JsonObjectMeta(type):
+    """
+    Metaclass, which makes __slots__ and generates loaders and lazy classes from _fields schema of the class
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get('_fields')
+
+        if fields is not None and '__slots__' not in namespace:
+            slots = ['_' + field.attribute for field in fields]
+            slots.extend('_lazy_' + field.attribute for field in fields if field.lazy)
+            namespace['__slots__'] = tuple(slots)
+
+        cls = super().__new__(mcs, name, bases, namespace)
+
+        # Lazy classes set it to the class they are made from
+        if '_object_class' not in namespace:
+            cls._object_class = cls
+
+        if not any(isinstance(base, _JsonObjectMeta) for base in bases):
+            cls._default_load_hooks = (cls.load_required_fields_from_dict, cls.load_optional_fields_from_dict)
+
+        if fields is not None:
+            _generate_loaders(cls, fields)
+
+        if (cls.load_required_fields_from_dict, cls.load_optional_fields_from_dict) != cls._default_load_hooks:
+            # Overridden hooks are called like before, so generated loaders and lazy classes are not used
+            cls._load_validated = cls._load_not_validated = _load_by_hooks
+            cls._lazy_validated_class = cls._lazy_not_validated_class = None
+
+        return cls
+
+
+def _generate_loaders(cls, fields):
+    """
+    Generates _clear, _load_validated and _load_not_validated methods of the class
+    and its lazy classes: _lazy_validated_class and _lazy_not_validated_class.
+
+    Loaders assign slots directly, without calling property setters, so that the object
+    is loaded by a single function call
+    """
+    namespace = {}
+    clear = ['def _clear(self):']
+    loaders = {True: ['def _load_validated(self, values):'], False: ['def _load_not_validated(self, values):']}
+    field_loaders = {True: [], False: []}
+
+    for i, field in enumerate(sorted(fields, key=lambda f: not f.required)):
+        clear.append('    self._{} = None'.format(field.attribute))
+        trusted = False
+
+        if field.lazy:
+            clear.append('    self._lazy_{} = None'.format(field.attribute))
+            trusted = _set_unchecked_converter(cls, field)
+
+        for validate, lines in loaders.items():
+            body = _generate_field_loader(namespace, i, field, validate, trusted)
+            lines.extend(body)
+
+            # Objects of lazy fields are made lazy too, instead of being stored for the property setter
+            if field.lazy and _get_nested_class(field.converter) is not None:
+                body = _generate_nested_loader(namespace, i, field, validate)
+
+            field_loaders[validate].append((field, body))
+
+    for lines in (clear, loaders[True], loaders[False]):
+        if len(lines) == 1:
+            lines.append('    pass')
+
+    source = '\n'.join(clear + loaders[True] + loaders[False]) + '\n'
+    exec(compile(source, '<{} loaders>'.format(cls.__name__), 'exec'), namespace)
+
+    cls._clear = namespace['_clear']
+    cls._load_validated = namespace['_load_validated']
+    cls._load_not_validated = namespace['_load_not_validated']
+    cls._lazy_validated_class = _generate_lazy_class(cls, field_loaders[True], dict(namespace), True)
+    cls._lazy_not_validated_class = _generate_lazy_class(cls, field_loaders[False], dict(namespace), False)
+
+
+def _generate_lazy_class(cls, field_loaders, namespace, validate):
+    """
+    Generates subclass, which objects keep the dict of values in _raw_values slot and load every field
+    on the first access of its property. Bits of _loaded slot tell, which fields are loaded.
+
+    Properties of the class are replaced by ones, which load the field and then call the original property.
+    Methods, which read slots directly, load all fields first
+
+    :param field_loaders: Fields and lines of code, which load them
+    :type field_loaders: list of (JsonField, list of str)
+    """
+    lines = []
+    all_loaded = (1 << len(field_loaders)) - 1
+
+    for i, (field, body) in enumerate(field_loaders):
+        prop = getattr(cls, field.attribute)
+        namespace['_get{}'.format(i)] = prop.fget if type(prop) is property else prop.__get__
+        namespace['_set{}'.format(i)] = prop.fset if type(prop) is property else prop.__set__
+
+        lines.append('def _load_field{}(self, values):'.format(i))
+        lines.extend(body)
+
+        # The loader is inlined, because the getter is called once for every object in scans
+        lines.append('def _lazy_get{}(self):'.format(i))
+        lines.append('    if not self._loaded & {}:'.format(1 << i))
+        lines.append('        values = self._raw_values')
+        lines.append('        try:')
+        lines.extend('        ' + line for line in body)
+        lines.append('        except KeyError as e:')
+        lines.append("            raise ValueError('Missed required field', e.args[0])")
+        lines.append('        self._loaded |= {}'.format(1 << i))
+        lines.append('    return _get{}(self)'.format(i))
+
+        lines.append('def _lazy_set{}(self, value):'.format(i))
+        lines.append('    _set{}(self, value)'.format(i))
+        lines.append('    self._loaded |= {}'.format(1 << i))
+
+    lines.append('def _load_all(self):')
+    lines.append('    loaded = self._loaded')
+    lines.append('    if loaded != {}:'.format(all_loaded))
+    lines.append('        values = self._raw_values')
+    lines.append('        try:')
+    lines.append('            pass')
+
+    for i in range(len(field_loaders)):
+        lines.append('            if not loaded & {}:'.format(1 << i))
+        lines.append('                _load_field{}(self, values)'.format(i))
+
+    lines.append('        except KeyError as e:')
+    lines.append("            raise ValueError('Missed required field', e.args[0])")
+    lines.append('        self._loaded = {}'.format(all_loaded))
+
+    name = '_lazy_validated_class' if validate else '_lazy_not_validated_class'
+    exec(compile('\n'.join(lines) + '\n', '<{} {}>'.format(cls.__name__, name), 'exec'), namespace)
+
+    load_all = namespace['_load_all']
+
+    def _get_key(self):
+        load_all(self)
+        return cls._get_key(self)
+
+    def _get_fields(self):
+        load_all(self)
+        return cls._get_fields(self)
+
+    def _load_from_dict(self, values, validate):
+        cls._load_from_dict(self, values, validate)
+        self._loaded = all_loaded
+
+    attributes = {
+        '__slots__': ('_raw_values', '_loaded'),
+        '__module__': cls.__module__,
+        '__qualname__': '{}.{}'.format(cls.__qualname__, name),
+        '__doc__': cls.__doc__,
+        '_object_class': cls,
+        '_load_all': load_all,
+        '_get_key': _get_key,
+        '_get_fields': _get_fields,
+        '_load_from_dict': _load_from_dict
+    }
+
+    for i, (field, _) in enumerate(field_loaders):
+        attributes[field.attribute] = property(namespace['_lazy_get{}'.format(i)], namespace['_lazy_set{}'.format(i)],
+                                               doc=getattr(cls, field.attribute).__doc__)
+
+    return type(cls)(cls.__name__, (cls,), attributes)
+
+
+def _set_unchecked_converter(cls, field):
+    """
+    Sets the converter of trusted values to the lazy property of the field, if it makes nested objects
+
+    :return: True if trusted values of the field can be converted without checks
+    :rtype: bool
+    """
+    nested_class = _get_nested_class(field.converter)
+    prop = cls.__dict__.get(field.attribute)
+
+    if nested_class is None or not isinstance(prop, lazy_property):
+        return False
+
+    prop.unchecked = (field.converter.unchecked if nested_class is not field.converter
+                      else partial(_load_unchecked, nested_class))
+
+    return True
+
+
+def _generate_field_loader(namespace, i, field, validate, trusted=False):
+    """
+    :param trusted: If true, the lazy field is converted without checks, unless the loading is validated
+    :type trusted: bool
+
+    :return: Lines of code, which load the field from values dict into slots of self
+    :rtype: list of str
+    """
+    get = "values[{!r}]".format(field.key) if field.required else "values.get({!r})".format(field.key)
+
+    if field.lazy:
+        if validate or not trusted:
+            return ['    self._lazy_{} = {}'.format(field.attribute, get),
+                    '    self._{} = None'.format(field.attribute)]
+
+        # The property setter checks types, so TRUSTED tells the lazy property to convert the value without checks
+        namespace['_TRUSTED'] = TRUSTED
+
+        return ['    v = {}'.format(get),
+                '    self._lazy_{} = v'.format(field.attribute),
+                '    self._{} = _TRUSTED if v is not None else None'.format(field.attribute)]
+
+    namespace['_t{}'.format(i)] = field.types
+    namespace['_c{}'.format(i)] = field.converter
+    namespace['_m{}'.format(i)] = '{} should be of type {}, not {{}}'.format(field.key, field.types)
+
+    check = []
+
+    if validate and field.types is not None:
+        check.append('assert isinstance(v, _t{0}), _m{0}.format(type(v))'.format(i))
+
+    if isinstance(field.converter, type) and issubclass(field.converter, Enum):
+        # Looking up the member by value is much faster than calling the Enum
+        namespace['_e{}'.format(i)] = {member.value: member for member in field.converter}
+        check.append('v = _e{0}.get(v) or _c{0}(v)'.format(i))
+    elif isinstance(field.converter, type) and issubclass(field.converter, BaseJsonObject):
+        if validate:
+            check.append('v = v if isinstance(v, _c{0}) else _c{0}(v)'.format(i))
+        else:
+            check.append('v = v if isinstance(v, _c{0}) else _c{0}.from_dict(v, False)'.format(i))
+    elif not validate and hasattr(field.converter, 'unchecked'):
+        namespace['_u{}'.format(i)] = field.converter.unchecked
+        check.append('v = _u{}(v)'.format(i))
+    elif field.converter not in (None, str):
+        check.append('v = _c{}(v)'.format(i))
+
+    lines = ['    v = {}'.format(get)]
+
+    if not field.required and (check or field.default is not None):
+        lines.append('    if v is not None:')
+        lines.extend('        ' + line for line in check or ['pass'])
+
+        if field.default is not None:
+            namespace['_d{}'.format(i)] = field.default
+            lines.append('    else:')
+            lines.append('        v = _d{}'.format(i))
+    else:
+        lines.extend('    ' + line for line in check)
+
+    lines.append('    self._{} = v'.format(field.attribute))
+
+    return lines
+
+
+def _generate_nested_loader(namespace, i, field, validate):
+    """
+    :return: Lines of code, which load the lazy field of lazy object from values dict.
+             Nested objects are made lazy by from_dict without calling the property setter
+    :rtype: list of str
+    """
+    get = "values[{!r}]".format(field.key) if field.required else "values.get({!r})".format(field.key)
+    nested_class = _get_nested_class(field.converter)
+
+    namespace['_n{}'.format(i)] = nested_class
+    load = 'x if isinstance(x, _n{0}) else _n{0}.from_dict(x, {1}, True)'.format(i, validate)
+    check = []
+
+    if nested_class is field.converter:
+        namespace['_nt{}'.format(i)] = nested_class, dict
+
+        if validate:
+            check.append('assert isinstance(v, _nt{0}), _m{0}.format(type(v))'.format(i))
+
+        check.append('x = v')
+        check.append('v = ' + load)
+    else:
+        if validate:
+            check.append('assert isinstance(v, list), _m{0}.format(type(v))'.format(i))
+
+        check.append('v = [{} for x in v]'.format(load))
+
+    namespace['_m{}'.format(i)] = '{} should be of type {}, not {{}}'.format(field.key, field.types)
+    lines = ['    v = {}'.format(get)]
+
+    if field.required:
+        lines.extend('    ' + line for line in check)
+    else:
+        lines.append('    if v is not None:')
+        lines.extend('        ' + line for line in check)
+
+    lines.append('    self._{} = v'.format(field.attribute))
+    lines.append('    self._lazy_{} = None'.format(field.attribute))
+
+    return lines
+
+
+def _load_by_hooks(self, values):
+    self._clear()
+    self.load_required_fields_from_dict(values)
+    self.load_optional_fields_from_dict(values)
+
+
+def _load_unchecked(cls, value):
+    return value if isinstance(value, cls) else cls.from_dict(value, False)
+
+
+def _get_nested_class(converter):
+    """
+    :return: BaseJsonObject subclass, which objects are made by the converter itself or by list_of converter,
+             or None
+    :rtype: type or None
+    """
+    if isinstance(converter, type) and issubclass(converter, BaseJsonObject):
+        return converter
+
+    return getattr(converter, 'item_class', None)
+
+
+class BaseJsonObject(metaclass=_JsonObjectMeta):
     """
     Every Codeforces Json object should extend this class
+
+    Subclasses describe their fields by _fields schema, which is a tuple of JsonField.
+    Fields are stored in __slots__ made from the schema, so objects have no __dict__,
+    and objects are loaded by functions generated from the schema when the class is created.
+
+    If validate is true, types of field values are checked like property setters do.
+    Otherwise, values are only converted, which is faster. Objects of nested fields, e.g. members of Party,
+    are loaded the same way. Objects of lazy fields are made on the first access
+    according to the validate attribute at the time of loading.
+
+    Subclasses with natural key, e.g. id of Submission or handle of User, override _get_key.
+    Such objects are equal if their keys are equal, and their hash is the hash of the key.
+    Other objects are compared and hashed by all fields.
+
+    If cache_hash is true, the hash is computed once and stored in the object,
+    so objects should not be changed after they are put into a set or a dict.
+
+    Objects made by from_dict with lazy=True are objects of a lazy subclass. They keep a reference to the dict,
+    and every field is loaded on the first access of its property, so reading one field of many objects
+    does not convert the others. Missing required fields of such objects raise ValueError on the access
     """
 
-    def __init__(self, data):
+    __slots__ = ('_cached_hash',)
+
+    _fields = ()
+
+    cache_hash = False
+
+    validate = True
+
+    def __init__(self, data=None):
         """
         :param data: Data in JSON format
-        :type data: str or dict
+        :type data: str or bytes or dict
         """
-        assert isinstance(data, (str, dict)) or data is None
+        if isinstance(data, dict):
+            self.load_from_dict(data)
+        else:
+            assert isinstance(data, (str, bytes)) or data is None
+
+            self._clear()
 
-        if data is not None:
-            if isinstance(data, str):
+            if data is not None:
                 self.load_from_json(data)
-            else:
-                self.load_from_dict(data)
 
     def __eq__(self, other):
-        if type(self) == type(other):
-            return self.__dict__ == other.__dict__
+        if isinstance(other, BaseJsonObject) and self._object_class is other._object_class:
+            key = self._get_key()
+
+            if key is not None:
+                return key == other._get_key()
+
+            return self._get_fields() == other._get_fields()
         else:
             return False
 
     def __hash__(self):
-        return make_hash(self.__dict__)
+        if self.cache_hash:
+            try:
+                return self._cached_hash
+            except AttributeError:
+                pass
+
+        key = self._get_key()
+        value = hash(key) if key is not None else make_hash(self._get_fields())
+
+        if self.cache_hash:
+            self._cached_hash = value
+
+        return value
+
+    def _get_key(self):
+        """
+        :return: Natural key of the object or None if the object has no natural key or the key is not initialized
+        """
+        return None
+
+    def _get_fields(self):
+        """
+        :return: Values of all initialized fields by their names
+        :rtype: dict of [str, object]
+        """
+        # Lazy fields are converted first, so that their values do not depend on whether they were read
+        for field in self._fields:
+            if field.lazy:
+                hasattr(self, field.attribute)
+
+        return {name: getattr(self, name) for name in _get_slot_names(self._object_class) if hasattr(self, name)}
 
     def load_from_json(self, s):
         """
-        Loads data from given string in JSON format
+        Loads data from given string in JSON format using the default JSON decoder
 
         :param s: Data in JSON format
-        :type s: str
+        :type s: str or bytes
         """
-        values = json.loads(s)
+        values = get_default_json_decoder().loads(s)
 
         self.load_from_dict(values)
 
+    @classmethod
+    def from_dict(cls, values, validate=None, lazy=False):
+        """
+        Makes an object from given dictionary
+
+        :param values: Dictionary with values, e.g. decoded response of Codeforces API
+        :type values: dict
+
+        :param validate: If true, types of field values are checked. If false, the values are trusted.
+                         If None, the validate attribute of the class is used
+        :type validate: bool or None
+
+        :param lazy: If true, the object keeps the dictionary, and every field is loaded on the first access.
+                     The dictionary should not be changed after that. Objects of classes, which override
+                     load_required_fields_from_dict or load_optional_fields_from_dict, are not lazy
+        :type lazy: bool
+
+        :return: Loaded object
+        :exception ValueError: raised when given dictionary does not contain required field
+        """
+        if validate is None:
+            validate = cls.validate
+
+        lazy_class = None
+
+        if lazy:
+            lazy_class = cls._lazy_validated_class if validate else cls._lazy_not_validated_class
+
+        if lazy_class is not None:
+            obj = lazy_class.__new__(lazy_class)
+            obj._raw_values = values
+            obj._loaded = 0
+        else:
+            obj = cls.__new__(cls)
+            obj._load_from_dict(values, validate)
+
+        return obj
+
     def load_from_dict(self, values):
         """
         Loads data from given dictionary
@@ -55,38 +557,68 @@ class BaseJsonObject:
         :type values: dict
         :exception ValueError: raised when given dictionary does not contain required field
         """
+        self._load_from_dict(values, self.validate)
+
+    def _load_from_dict(self, values, validate):
         try:
-            self.load_required_fields_from_dict(values)
+            if validate:
+                self._load_validated(values)
+            else:
+                self._load_not_validated(values)
         except KeyError as e:
             raise ValueError('Missed required field', e.args[0])
 
-        self.load_optional_fields_from_dict(values)
-
     def load_required_fields_from_dict(self, values):
         """
-        Loads required fields from given dictionary.
+        Loads required fields from given dictionary by property setters, so types are always checked.
 
-        This method SHOULD NOT care if value was not given
-
-        Note: given dictionary may contain extra fields. just ignore them
+        If a subclass overrides this method or its pair, objects of the subclass are loaded by calling both of them
+        like before. Otherwise, load_from_dict loads all fields by generated loaders, which is several times faster
 
         :param values: Dictionary with values
         :type values: dict
+        :exception KeyError: raised when given dictionary does not contain required field
         """
         assert isinstance(values, dict)
 
+        for field in self._fields:
+            if field.required:
+                setattr(self, field.attribute, values[field.key])
+
     def load_optional_fields_from_dict(self, values):
         """
-        Loads optional fields from given dictionary.
+        Loads optional fields from given dictionary by property setters, so types are always checked.
 
-        Note: given dictionary may not contain needed value. It is recommended to use dict.get method
-        The given dictionary may also contain extra fields. Just ignore them
+        If a subclass overrides this method or its pair, objects of the subclass are loaded by calling both of them
+        like before. Otherwise, load_from_dict loads all fields by generated loaders, which is several times faster
 
         :param values: Dictionary with optional values
         :type values: dict
         """
         assert isinstance(values, dict)
 
+        for field in self._fields:
+            if not field.required:
+                value = values.get(field.key)
+                setattr(self, field.attribute, value if value is not None else field.default)
+
+
+_slot_names = {}
+
+
+def _get_slot_names(cls):
+    """
+    :return: Names of slots defined by the class and its bases, except BaseJsonObject and '_lazy_<name>' slots
+    :rtype: tuple of str
+    """
+    try:
+        return _slot_names[cls]
+    except KeyError:
+        names = tuple(name for klass in cls.__mro__ if klass is not BaseJsonObject
+                      for name in klass.__dict__.get('__slots__', ()) if not name.startswith('_lazy_'))
+        _slot_names[cls] = names
+        return names
+
 
 # http://stackoverflow.com/a/8714242/1532460
 def make_hash(o):
@@ -97,12 +629,8 @@ def make_hash(o):
     """
 
     if isinstance(o, (set, tuple, list)):
-        return tuple([make_hash(e) for e in o])
+        return hash(tuple([make_hash(e) for e in o]))
     elif not isinstance(o, dict):
         return hash(o)
 
-    new_o = copy.deepcopy(o)
-    for k, v in new_o.items():
-        new_o[k] = make_hash(v)
-
-    return hash(tuple(frozenset(sorted(new_o.items()))))
\ No newline at end of file
+    return hash(frozenset((k, make_hash(v)) for k, v in o.items()))
\ No newline at end of file
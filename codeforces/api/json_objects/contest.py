@@ -5,7 +5,7 @@ For further information visit http://codeforces.com/api/help/objects#Contest
 """
 
 from enum import Enum
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 
 
 __all__ = ['Contest', 'ContestType', 'ContestPhase']
@@ -32,54 +32,31 @@ class Contest(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#Contest
     """
 
-    def __init__(self, data=None):
-        self._id = None
-        self._name = None
-        self._type = None
-        self._phase = None
-        self._frozen = None
-        self._duration = None
-        self._start_time = None
-        self._relative_time = None
-        self._prepared_by = None
-        self._website_url = None
-        self._description = None
-        self._difficulty = None
-        self._kind = None
-        self._icpc_region = None
-        self._country = None
-        self._city = None
-        self._season = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('id', 'id', int),
+        JsonField('name', 'name', str),
+        JsonField('type', 'type', ContestType),
+        JsonField('phase', 'phase', ContestPhase),
+        JsonField('frozen', 'frozen', bool),
+        JsonField('durationSeconds', 'duration', int),
+        JsonField('startTimeSeconds', 'start_time', int, required=False),
+        JsonField('relativeTimeSeconds', 'relative_time', int, required=False),
+        JsonField('preparedBy', 'prepared_by', str, required=False),
+        JsonField('websiteUrl', 'website_url', str, required=False),
+        JsonField('description', 'description', str, required=False),
+        JsonField('difficulty', 'difficulty', int, required=False),
+        JsonField('kind', 'kind', str, required=False),
+        JsonField('icpcRegion', 'icpc_region', str, required=False),
+        JsonField('country', 'country', str, required=False),
+        JsonField('city', 'city', str, required=False),
+        JsonField('season', 'season', str, required=False)
+    )
 
     def __repr__(self):
         return '<Contest: {}>'.format(self.id)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.id = values['id']
-        self.name = values['name']
-        self.type = values['type']
-        self.phase = values['phase']
-        self.frozen = values['frozen']
-        self.duration = values['durationSeconds']
-
-    def load_optional_fields_from_dict(self, values):
-        super().load_optional_fields_from_dict(values)
-
-        self.start_time = values.get('startTimeSeconds')
-        self.relative_time = values.get('relativeTimeSeconds')
-        self.prepared_by = values.get('preparedBy')
-        self.website_url = values.get('websiteUrl')
-        self.description = values.get('description')
-        self.difficulty = values.get('difficulty')
-        self.kind = values.get('kind')
-        self.icpc_region = values.get('icpcRegion')
-        self.country = values.get('country')
-        self.city = values.get('city')
-        self.season = values.get('season')
+    def _get_key(self):
+        return self._id
 
     @property
     def id(self):
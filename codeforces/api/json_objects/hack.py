@@ -6,7 +6,7 @@ For further information visit http://codeforces.com/api/help/objects#Hack
 
 from enum import Enum
 
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 from . import Party
 from . import Problem
 from . import JudgeProtocol
@@ -34,36 +34,22 @@ class Hack(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#Hack
     """
 
-    def __init__(self, data=None):
-        self._id = None
-        self._creation_time = None
-        self._hacker = None
-        self._defender = None
-        self._verdict = None
-        self._problem = None
-        self._test = None
-        self._judge_protocol = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('id', 'id', int),
+        JsonField('creationTimeSeconds', 'creation_time', int),
+        JsonField('hacker', 'hacker', Party, lazy=True),
+        JsonField('defender', 'defender', Party, lazy=True),
+        JsonField('verdict', 'verdict', HackVerdictType, required=False),
+        JsonField('problem', 'problem', Problem, lazy=True),
+        JsonField('test', 'test', str, required=False),
+        JsonField('judgeProtocol', 'judge_protocol', JudgeProtocol, required=False, lazy=True)
+    )
 
     def __repr__(self):
         return '<Hack: {}>'.format(self.id)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.id = values['id']
-        self.creation_time = values['creationTimeSeconds']
-        self.hacker = values['hacker']
-        self.defender = values['defender']
-        self.problem = values['problem']
-
-    def load_optional_fields_from_dict(self, values):
-        super().load_optional_fields_from_dict(values)
-
-        self.verdict = values.get('verdict')
-        self.test = values.get('test')
-        self.judge_protocol = values.get('judgeProtocol')
+    def _get_key(self):
+        return self._id
 
     @property
     def id(self):
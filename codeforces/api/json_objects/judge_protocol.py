@@ -4,7 +4,7 @@ This module contains classes for representing JudgeProtocol object
 For further information visit http://codeforces.com/api/help/objects#Hack
 """
 
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 
 
 __all__ = ['JudgeProtocol']
@@ -17,23 +17,15 @@ class JudgeProtocol(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#Hack
     """
 
-    def __init__(self, data=None):
-        self._manual = None
-        self._protocol = None
-        self._verdict = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('manual', 'manual', bool),
+        JsonField('protocol', 'protocol', str),
+        JsonField('verdict', 'verdict', str)
+    )
 
     def __repr__(self):
         return '<JudgeProtocol: {}>'.format(self.verdict)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.manual = values['manual']
-        self.protocol = values['protocol']
-        self.verdict = values['verdict']
-
     @property
     def manual(self):
         """
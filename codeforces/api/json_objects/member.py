@@ -4,7 +4,7 @@ This module contains classes for representing Member object
 For further information visit http://codeforces.com/api/help/objects#Member
 """
 
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 
 
 __all__ = ['Member']
@@ -17,18 +17,15 @@ class Member(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#Member
     """
 
-    def __init__(self, data=None):
-        self._handle = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('handle', 'handle', str),
+    )
 
     def __repr__(self):
         return '<Member: {}>'.format(self.handle)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.handle = values['handle']
+    def _get_key(self):
+        return self._handle
 
     @property
     def handle(self):
@@ -6,7 +6,7 @@ For further information visit http://codeforces.com/api/help/objects#Party
 
 from enum import Enum
 
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField, list_of
 from . import Member
 
 
@@ -32,36 +32,26 @@ class Party(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#Party
     """
 
-    def __init__(self, data=None):
-        self._contest_id = None
-        self._members = None
-        self._participant_type = None
-        self._team_id = None
-        self._team_name = None
-        self._ghost = None
-        self._room = None
-        self.start_time = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('contestId', 'contest_id', int),
+        JsonField('members', 'members', list_of(Member)),
+        JsonField('participantType', 'participant_type', ParticipantType),
+        JsonField('teamId', 'team_id', int, required=False),
+        JsonField('teamName', 'team_name', str, required=False),
+        JsonField('ghost', 'ghost', bool),
+        JsonField('room', 'room', int, required=False),
+        JsonField('startTimeSeconds', 'start_time', int, required=False)
+    )
 
     def __repr__(self):
         return '<Party: {}>'.format(self.members)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.contest_id = values['contestId']
-        self.members = values['members']
-        self.participant_type = values['participantType']
-        self.ghost = values['ghost']
-
-    def load_optional_fields_from_dict(self, values):
-        super().load_optional_fields_from_dict(values)
+    def _get_key(self):
+        if self._members is None:
+            return None
 
-        self.team_id = values.get('teamId')
-        self.team_name = values.get('teamName')
-        self.room = values.get('room')
-        self.start_time = values.get('startTimeSeconds')
+        return (self._contest_id, self._participant_type, self._team_id, self._team_name,
+                tuple(member.handle for member in self._members))
 
     @property
     def contest_id(self):
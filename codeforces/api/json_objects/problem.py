@@ -5,7 +5,7 @@ For further information visit http://codeforces.com/api/help/objects#Problem
 """
 
 from enum import Enum
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 
 
 __all__ = ['Problem', 'ProblemType']
@@ -23,32 +23,23 @@ class Problem(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#Problem
     """
 
-    def __init__(self, data=None):
-        self._contest_id = None
-        self._index = None
-        self._name = None
-        self._type = None
-        self._points = None
-        self._tags = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('contestId', 'contest_id', int),
+        JsonField('index', 'index', str),
+        JsonField('name', 'name', str),
+        JsonField('type', 'type', ProblemType),
+        JsonField('points', 'points', types=(float, str), required=False),
+        JsonField('tags', 'tags', types=list)
+    )
 
     def __repr__(self):
         return '<Problem: {}/{}>'.format(self.contest_id, self.index)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.contest_id = values['contestId']
-        self.index = values['index']
-        self.name = values['name']
-        self.type = values['type']
-        self.tags = values['tags']
-
-    def load_optional_fields_from_dict(self, values):
-        super().load_optional_fields_from_dict(values)
+    def _get_key(self):
+        if self._contest_id is None or self._index is None:
+            return None
 
-        self.points = values.get('points')
+        return self._contest_id, self._index
 
     @property
     def contest_id(self):
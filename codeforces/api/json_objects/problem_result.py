@@ -4,7 +4,7 @@ This module contains classes for representing ProblemResults object
 For further information visit http://codeforces.com/api/help/objects#ProblemResults
 """
 
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 from enum import Enum
 
 
@@ -28,31 +28,17 @@ class ProblemResult(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#ProblemResults
     """
 
-    def __init__(self, data=None):
-        self._points = None
-        self._penalty = None
-        self._rejected_attempt_count = None
-        self._type = None
-        self._best_submission_time = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('points', 'points', float),
+        JsonField('penalty', 'penalty', int, required=False),
+        JsonField('rejectedAttemptCount', 'rejected_attempt_count', int),
+        JsonField('type', 'type', ScoringSystemType),
+        JsonField('bestSubmissionTimeSeconds', 'best_submission_time', int, required=False)
+    )
 
     def __repr__(self):
         return '<ProblemResult: {}>'.format(self.points)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.points = values['points']
-        self.rejected_attempt_count = values['rejectedAttemptCount']
-        self.type = values['type']
-
-    def load_optional_fields_from_dict(self, values):
-        super().load_optional_fields_from_dict(values)
-
-        self.penalty = values.get('penalty')
-        self.best_submission_time = values.get('bestSubmissionTimeSeconds')
-
     @property
     def points(self):
         """
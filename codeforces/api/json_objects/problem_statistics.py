@@ -4,7 +4,7 @@ This module contains classes for representing ProblemStatistics object
 For further information visit http://codeforces.com/api/help/objects#ProblemStatistics
 """
 
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 
 
 __all__ = ['ProblemStatistics']
@@ -17,22 +17,20 @@ class ProblemStatistics(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#ProblemStatistics
     """
 
-    def __init__(self, data=None):
-        self._contest_id = None
-        self._index = None
-        self._solved_count = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('contestId', 'contest_id', int),
+        JsonField('index', 'index', str),
+        JsonField('solvedCount', 'solved_count', int)
+    )
 
     def __repr__(self):
         return '<ProblemStatistics: {}/{}: {}>'.format(self.contest_id, self.index, self.solved_count)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
+    def _get_key(self):
+        if self._contest_id is None or self._index is None:
+            return None
 
-        self.contest_id = values['contestId']
-        self.index = values['index']
-        self.solved_count = values['solvedCount']
+        return self._contest_id, self._index
 
     @property
     def contest_id(self):
@@ -4,7 +4,7 @@ This module contains classes for representing RanklistRow object
 For further information visit http://codeforces.com/api/help/objects#RanklistRow
 """
 
-from . import BaseJsonObject, Party, ProblemResult
+from . import BaseJsonObject, JsonField, list_of, Party, ProblemResult
 from codeforces.utils import lazy_property
 
 
@@ -18,37 +18,20 @@ class RanklistRow(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#RanklistRow
     """
 
-    def __init__(self, data=None):
-        self._party = None
-        self._rank = None
-        self._points = None
-        self._penalty = None
-        self._successful_hack_count = None
-        self._unsuccessful_hack_count = None
-        self._problem_results = None
-        self._last_submission_time = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('party', 'party', Party, lazy=True),
+        JsonField('rank', 'rank', int),
+        JsonField('points', 'points', float),
+        JsonField('penalty', 'penalty', int),
+        JsonField('successfulHackCount', 'successful_hack_count', int),
+        JsonField('unsuccessfulHackCount', 'unsuccessful_hack_count'),
+        JsonField('problemResults', 'problem_results', list_of(ProblemResult), lazy=True),
+        JsonField('lastSubmissionTimeSeconds', 'last_submission_time', int, required=False)
+    )
 
     def __repr__(self):
         return '<RanklistRow: {}>'.format(self.party)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.party = values['party']
-        self.rank = values['rank']
-        self.points = values['points']
-        self.penalty = values['penalty']
-        self.successful_hack_count = values['successfulHackCount']
-        self.unsuccessful_hack_count = values['unsuccessfulHackCount']
-        self.problem_results = values['problemResults']
-
-    def load_optional_fields_from_dict(self, values):
-        super().load_optional_fields_from_dict(values)
-
-        self.last_submission_time = values.get('lastSubmissionTimeSeconds')
-
     @lazy_property
     def party(self):
         """
@@ -4,7 +4,7 @@ This module contains classes for representing RatingChange object
 For further information visit http://codeforces.com/api/help/objects#RatingChange
 """
 
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 
 
 __all__ = ['RatingChange']
@@ -17,30 +17,24 @@ class RatingChange(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#RatingChange
     """
 
-    def __init__(self, data=None):
-        self._contest_id = None
-        self._contest_name = None
-        self._handle = None
-        self._rank = None
-        self._rating_update_time = None
-        self._old_rating = None
-        self._new_rating = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('contestId', 'contest_id', int),
+        JsonField('contestName', 'contest_name', str),
+        JsonField('handle', 'handle', str),
+        JsonField('rank', 'rank', int),
+        JsonField('ratingUpdateTimeSeconds', 'rating_update_time', int),
+        JsonField('oldRating', 'old_rating', int),
+        JsonField('newRating', 'new_rating', int)
+    )
 
     def __repr__(self):
         return '<RatingChange: {}, {}->{}>'.format(self.contest_id, self.old_rating, self.new_rating)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
+    def _get_key(self):
+        if self._contest_id is None or self._handle is None:
+            return None
 
-        self.contest_id = values['contestId']
-        self.contest_name = values['contestName']
-        self.handle = values['handle']
-        self.rank = values['rank']
-        self.rating_update_time = values['ratingUpdateTimeSeconds']
-        self.old_rating = values['oldRating']
-        self.new_rating = values['newRating']
+        return self._contest_id, self._handle
 
     @property
     def contest_id(self):
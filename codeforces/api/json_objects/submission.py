@@ -6,7 +6,7 @@ For further information visit http://codeforces.com/api/help/objects#Submission
 
 from enum import Enum
 
-from . import BaseJsonObject, Problem
+from . import BaseJsonObject, JsonField, Problem
 from . import Party
 from codeforces.utils import lazy_property
 
@@ -66,44 +66,26 @@ class Submission(BaseJsonObject):
     For further information visit http://codeforces.com/api/help/objects#Submission
     """
 
-    def __init__(self, data=None):
-        self._id = None
-        self._contest_id = None
-        self._creation_time = None
-        self._relative_time = None
-        self._problem = None
-        self._author = None
-        self._programming_language = None
-        self._verdict = None
-        self._testset = None
-        self._passed_test_count = None
-        self._time_consumed = None
-        self._memory_consumed = None
-
-        super().__init__(data)
+    _fields = (
+        JsonField('id', 'id', int),
+        JsonField('contestId', 'contest_id', int),
+        JsonField('creationTimeSeconds', 'creation_time', int),
+        JsonField('relativeTimeSeconds', 'relative_time', int),
+        JsonField('problem', 'problem', Problem, lazy=True),
+        JsonField('author', 'author', Party, lazy=True),
+        JsonField('programmingLanguage', 'programming_language', str),
+        JsonField('verdict', 'verdict', VerdictType, required=False),
+        JsonField('testset', 'testset', TestsetType),
+        JsonField('passedTestCount', 'passed_test_count', int),
+        JsonField('timeConsumedMillis', 'time_consumed', int),
+        JsonField('memoryConsumedBytes', 'memory_consumed', int)
+    )
 
     def __repr__(self):
         return '<Submission: {}>'.format(self.id)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.id = values['id']
-        self.contest_id = values['contestId']
-        self.creation_time = values['creationTimeSeconds']
-        self.relative_time = values['relativeTimeSeconds']
-        self.problem = values['problem']
-        self.author = values['author']
-        self.programming_language = values['programmingLanguage']
-        self.testset = values['testset']
-        self.passed_test_count = values['passedTestCount']
-        self.time_consumed = values['timeConsumedMillis']
-        self.memory_consumed = values['memoryConsumedBytes']
-
-    def load_optional_fields_from_dict(self, values):
-        super().load_optional_fields_from_dict(values)
-
-        self.verdict = values.get('verdict')
+    def _get_key(self):
+        return self._id
 
     @property
     def id(self):
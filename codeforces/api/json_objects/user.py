@@ -4,7 +4,7 @@ This file provides class for representing User object
 For further information visit http://codeforces.com/api/help/objects#User
 """
 
-from . import BaseJsonObject
+from . import BaseJsonObject, JsonField
 
 
 __all__ = ['User']
@@ -23,58 +23,33 @@ class User(BaseJsonObject):
         registrationTimeSeconds
     """
 
-    def __init__(self, data=None):
-        self._handle = None
-        self._email = None
-        self._vk_id = None
-        self._open_id = None
-        self._first_name = None
-        self._last_name = None
-        self._country = None
-        self._city = None
-        self._organization = None
-        self._contribution = None
-        self._rank = None
-        self._rating = None
-        self._max_rank = None
-        self._max_rating = None
-        self._last_online_time = None
-        self._registration_time = None
-        self._friend_of_count = None
-        self._avatar = None
-        self._title_photo = None
-        super().__init__(data)
+    _fields = (
+        JsonField('handle', 'handle', str),
+        JsonField('email', 'email', str, required=False),
+        JsonField('vkId', 'vk_id', str, required=False),
+        JsonField('openId', 'open_id', str, required=False),
+        JsonField('firstName', 'first_name', str, required=False),
+        JsonField('lastName', 'last_name', str, required=False),
+        JsonField('country', 'country', str, required=False),
+        JsonField('city', 'city', str, required=False),
+        JsonField('organization', 'organization', str, required=False),
+        JsonField('contribution', 'contribution', int),
+        JsonField('rank', 'rank', str, required=False),
+        JsonField('rating', 'rating', int, required=False, default=0),
+        JsonField('maxRank', 'max_rank', str, required=False),
+        JsonField('maxRating', 'max_rating', int, required=False, default=0),
+        JsonField('lastOnlineTimeSeconds', 'last_online_time', int),
+        JsonField('registrationTimeSeconds', 'registration_time', int),
+        JsonField('friendOfCount', 'friend_of_count', types=int, required=False),
+        JsonField('avatar', 'avatar', str, required=False),
+        JsonField('titlePhoto', 'title_photo', str, required=False)
+    )
 
     def __repr__(self):
         return '<User: {}>'.format(self.handle)
 
-    def load_required_fields_from_dict(self, values):
-        super().load_required_fields_from_dict(values)
-
-        self.handle = values['handle']
-        self.contribution = values['contribution']
-        self.last_online_time = values['lastOnlineTimeSeconds']
-        self.registration_time = values['registrationTimeSeconds']
-
-    def load_optional_fields_from_dict(self, values):
-        super().load_optional_fields_from_dict(values)
-
-        self.rank = values.get('rank')
-        self.max_rank = values.get('maxRank')
-        self.rating = values.get('rating')
-        self.max_rating = values.get('maxRating')
-
-        self.email = values.get('email')
-        self.vk_id = values.get('vkId')
-        self.open_id = values.get('openId')
-        self.first_name = values.get('firstName')
-        self.last_name = values.get('lastName')
-        self.country = values.get('country')
-        self.city = values.get('city')
-        self.organization = values.get('organization')
-        self.friend_of_count = values.get('friendOfCount')
-        self.avatar = values.get('avatar')
-        self.title_photo = values.get('titlePhoto')
+    def _get_key(self):
+        return self._handle
 
     @property
     def handle(self):
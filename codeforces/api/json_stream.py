@@ -0,0 +1,176 @@
+"""
+This module provides incremental parsing of arrays from JSON responses
+"""
+
+import codecs
+import json
+
+
+__all__ = ['iter_json_array']
+
+
+_WHITESPACE = ' \t\n\r'
+
+_NUMBER_CHARS = '0123456789.eE+-'
+
+
+class _StreamReader:
+    """
+    This class reads JSON text from a binary file-like object by chunks, keeping only the unparsed part in memory
+    """
+
+    def __init__(self, stream, chunk_size):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def _fill(self):
+        """
+        Reads the next chunk. Returns False if the stream is exhausted
+        """
+        if self._eof:
+            return False
+
+        chunk = self._stream.read(self._chunk_size)
+
+        if not chunk:
+            self._eof = True
+            self._buffer = self._buffer[self._position:] + self._decoder.decode(b'', final=True)
+        else:
+            self._buffer = self._buffer[self._position:] + self._decoder.decode(chunk)
+
+        self._position = 0
+
+        return True
+
+    def peek(self):
+        """
+        Skips whitespaces and returns the next character or None at the end of the stream
+        """
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _WHITESPACE:
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+
+            if not self._fill():
+                return None
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError('Invalid JSON: expected {}'.format(char), self.peek())
+
+        self._position += 1
+
+    def skip(self, char):
+        """
+        Skips the next character if it is equal to the given one
+        """
+        if self.peek() == char:
+            self._position += 1
+            return True
+
+        return False
+
+    def read_value(self):
+        """
+        Parses the next JSON value, reading more chunks until it is complete
+        """
+        self.peek()
+
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+
+            # A number at the end of the buffer can be continued in the next chunk
+            if self._is_number(value) and not self._eof and not self._buffer[end:].strip(_NUMBER_CHARS):
+                self._fill()
+                continue
+
+            self._position = end
+
+            return value
+
+    @staticmethod
+    def _is_number(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _iter_object(reader, path, fields):
+    """
+    Parses JSON object, storing its fields into the given dict and yielding elements of the array at the given path
+    """
+    reader.expect('{')
+
+    if reader.skip('}'):
+        return
+
+    while True:
+        key = reader.read_value()
+        reader.expect(':')
+
+        if path and key == path[0]:
+            if len(path) == 1:
+                yield from _iter_array(reader)
+            else:
+                yield from _iter_object(reader, path[1:], {})
+        else:
+            fields[key] = reader.read_value()
+
+        if reader.skip('}'):
+            return
+
+        reader.expect(',')
+
+
+def _iter_array(reader):
+    reader.expect('[')
+
+    if reader.skip(']'):
+        return
+
+    while True:
+        yield reader.read_value()
+
+        if reader.skip(']'):
+            return
+
+        reader.expect(',')
+
+
+def iter_json_array(stream, path=('result',), chunk_size=64 * 1024):
+    """
+    Parses Codeforces API response from the binary stream and yields elements of the array at the given path
+    one by one, so that only one element is held in memory.
+
+    :param stream: Binary file-like object, e.g. HTTP response
+    :param path: Keys of nested objects, which lead to the array, e.g. ('result', 'rows') for contest.standings
+    :type path: tuple of str
+    :param chunk_size: Number of bytes read at once
+    :type chunk_size: int
+    :return: Generator of decoded elements
+    :exception ValueError: raised if the response status is not OK or JSON is invalid
+    """
+    reader = _StreamReader(stream, chunk_size)
+    fields = {}
+
+    for element in _iter_object(reader, path, fields):
+        if fields.get('status', 'OK') != 'OK':
+            raise ValueError(fields.get('comment'))
+
+        yield element
+
+    try:
+        if fields['status'] != 'OK':
+            raise ValueError(fields.get('comment'))
+    except KeyError as e:
+        raise ValueError('Missed required field', e.args[0])
@@ -0,0 +1,284 @@
+"""
+This module provides tailing of recent submissions on Codeforces
+"""
+
+import asyncio
+import time
+from collections import deque
+
+from .async_codeforces_api import AsyncCodeforcesAPI
+from .codeforces_api import CodeforcesAPI
+from .json_objects import VerdictType
+
+
+__all__ = ['AsyncRecentStatusTailer', 'BaseRecentStatusTailer', 'RecentStatusTailer']
+
+
+class BaseRecentStatusTailer:
+    """
+    This class keeps state of tailing problemset.recentStatus: which submissions were already seen
+    and how often the method should be polled.
+
+    Every poll returns a window of the latest submissions, which overlaps the previous one.
+    Ids of returned submissions are remembered, at most seen_limit of them. Submissions older than
+    the forgotten ones are considered seen, so memory does not grow while tailing. Ids newer than submissions,
+    which are still judged, are not forgotten until they are judged or leave the window.
+
+    The poll interval is chosen so that about target_fill of the window is filled with new submissions
+    at the observed rate. If a whole window consists of new submissions, some of them could be missed,
+    so the next poll is made after min_interval.
+    """
+
+    def __init__(self, count=1000, min_interval=1.0, max_interval=60.0, target_fill=0.5, seen_limit=10000,
+                 since_id=None, final_only=False):
+        """
+        :param count: Number of submissions retrieved by one poll. Can be up to 1000
+        :type count: int
+
+        :param min_interval: Minimum delay between polls in seconds
+        :type min_interval: float
+
+        :param max_interval: Maximum delay between polls in seconds
+        :type max_interval: float
+
+        :param target_fill: Share of the window, which should be filled with new submissions between polls
+        :type target_fill: float
+
+        :param seen_limit: Maximum number of remembered submission ids. Should be greater than count
+        :type seen_limit: int
+
+        :param since_id: Id of the latest known submission. If None, the whole first window is returned
+        :type since_id: int or None
+
+        :param final_only: If true, submissions are returned only after they are judged
+        :type final_only: bool
+        """
+        assert isinstance(count, int) and 0 < count <= 1000
+        assert isinstance(min_interval, (int, float)) and min_interval >= 0
+        assert isinstance(max_interval, (int, float)) and max_interval >= min_interval
+        assert isinstance(target_fill, (int, float)) and 0 < target_fill <= 1
+        assert isinstance(seen_limit, int) and seen_limit > count, 'seen_limit should be greater than count'
+        assert isinstance(since_id, int) or since_id is None
+        assert isinstance(final_only, bool)
+
+        self._count = count
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._target_fill = target_fill
+        self._seen_limit = seen_limit
+        self._final_only = final_only
+
+        self._seen = set()
+        self._seen_order = deque()
+        self._floor = since_id if since_id is not None else 0
+        self._min_pending = None
+        self._high_water_mark = since_id
+        self._interval = min_interval
+        self._rate = None
+        self._last_poll = None
+        self._overflow_count = 0
+
+    @property
+    def interval(self):
+        """
+        :return: Delay before the next poll in seconds
+        :rtype: float
+        """
+        return self._interval
+
+    @property
+    def rate(self):
+        """
+        :return: Smoothed number of new submissions per second or None if it is not measured yet
+        :rtype: float or None
+        """
+        return self._rate
+
+    @property
+    def high_water_mark(self):
+        """
+        :return: Id of the latest submission returned by the server or None if nothing was returned yet
+        :rtype: int or None
+        """
+        return self._high_water_mark
+
+    @property
+    def overflow_count(self):
+        """
+        :return: Number of polls, which returned only new submissions, so some submissions could be missed
+        :rtype: int
+        """
+        return self._overflow_count
+
+    def _accept(self, submissions, now):
+        """
+        Takes unseen submissions from the window and adapts the poll interval
+
+        :param submissions: Window of submissions sorted in decreasing order of id
+        :type submissions: list of Submission
+
+        :param now: Monotonic time of the poll
+        :type now: float
+
+        :return: Unseen submissions sorted in increasing order of id
+        :rtype: list of Submission
+        """
+        previous_mark = self._high_water_mark
+        arrived = 0
+        result = []
+        pending = []
+
+        for submission in submissions:
+            if previous_mark is not None and submission.id > previous_mark:
+                arrived += 1
+
+            if submission.id <= self._floor or submission.id in self._seen:
+                continue
+
+            if self._final_only and submission.verdict in (None, VerdictType.testing):
+                pending.append(submission.id)
+                continue
+
+            result.append(submission)
+
+        self._min_pending = min(pending) if pending else None
+
+        for submission in reversed(result):
+            self._remember(submission.id)
+
+        if submissions:
+            latest = max(submission.id for submission in submissions)
+            self._high_water_mark = latest if previous_mark is None else max(previous_mark, latest)
+
+        overflow = (previous_mark is not None and len(submissions) >= self._count and
+                    min(submission.id for submission in submissions) > previous_mark)
+
+        if overflow:
+            self._overflow_count += 1
+
+        self._update_interval(arrived if previous_mark is not None else None, now, overflow)
+
+        result.reverse()
+
+        return result
+
+    def _remember(self, submission_id):
+        self._seen.add(submission_id)
+        self._seen_order.append(submission_id)
+
+        while len(self._seen_order) > self._seen_limit:
+            # The floor should stay below submissions, which are still judged, so newer ids are kept until then
+            if self._min_pending is not None and self._seen_order[0] > self._min_pending:
+                break
+
+            forgotten = self._seen_order.popleft()
+            self._seen.discard(forgotten)
+            self._floor = max(self._floor, forgotten)
+
+    def _update_interval(self, arrived, now, overflow):
+        """
+        :param arrived: Number of submissions newer than the previous window or None if there was no previous one
+        """
+        if arrived is not None and self._last_poll is not None and now > self._last_poll:
+            rate = arrived / (now - self._last_poll)
+            self._rate = rate if self._rate is None else (self._rate + rate) / 2
+
+        self._last_poll = now
+
+        if overflow:
+            self._interval = self._min_interval
+        elif self._rate:
+            self._interval = self._target_fill * self._count / self._rate
+        elif self._rate is not None:
+            # Nothing is submitted, so back off
+            self._interval = self._interval * 2
+
+        self._interval = min(max(self._interval, self._min_interval), self._max_interval)
+
+
+class RecentStatusTailer(BaseRecentStatusTailer):
+    """
+    This class polls recent submissions in a loop and yields only unseen ones in increasing order of id:
+
+        for submission in RecentStatusTailer(api):
+            process(submission)
+    """
+
+    def __init__(self, api, count=1000, min_interval=1.0, max_interval=60.0, target_fill=0.5, seen_limit=10000,
+                 since_id=None, final_only=False):
+        """
+        :param api: Api, which retrieves recent submissions
+        :type api: CodeforcesAPI
+
+        Other parameters are described in BaseRecentStatusTailer
+        """
+        assert isinstance(api, CodeforcesAPI)
+
+        super().__init__(count, min_interval, max_interval, target_fill, seen_limit, since_id, final_only)
+
+        self._api = api
+
+    def __iter__(self):
+        while True:
+            yield from self.poll()
+            time.sleep(self.interval)
+
+    def poll(self):
+        """
+        Retrieves recent submissions once
+
+        :return: Unseen submissions sorted in increasing order of id
+        :rtype: list of Submission
+        """
+        submissions = list(self._api.problemset_recent_status(self._count))
+
+        return self._accept(submissions, time.monotonic())
+
+
+class AsyncRecentStatusTailer(BaseRecentStatusTailer):
+    """
+    This class polls recent submissions in a loop using asyncio and is an async iterator of unseen submissions:
+
+        async for submission in AsyncRecentStatusTailer(api):
+            process(submission)
+    """
+
+    def __init__(self, api, count=1000, min_interval=1.0, max_interval=60.0, target_fill=0.5, seen_limit=10000,
+                 since_id=None, final_only=False):
+        """
+        :param api: Api, which retrieves recent submissions
+        :type api: AsyncCodeforcesAPI
+
+        Other parameters are described in BaseRecentStatusTailer
+        """
+        assert isinstance(api, AsyncCodeforcesAPI)
+
+        super().__init__(count, min_interval, max_interval, target_fill, seen_limit, since_id, final_only)
+
+        self._api = api
+        self._pending = deque()
+        self._polled = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._pending:
+            if self._polled:
+                await asyncio.sleep(self.interval)
+
+            self._pending.extend(await self.poll())
+            self._polled = True
+
+        return self._pending.popleft()
+
+    async def poll(self):
+        """
+        Retrieves recent submissions once
+
+        :return: Unseen submissions sorted in increasing order of id
+        :rtype: list of Submission
+        """
+        submissions = list(await self._api.problemset_recent_status(self._count))
+
+        return self._accept(submissions, time.monotonic())
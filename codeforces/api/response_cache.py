@@ -0,0 +1,139 @@
+"""
+This module provides in-process cache of API responses
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+
+__all__ = ['ResponseCache', 'CacheStatistics']
+
+
+CacheStatistics = namedtuple('CacheStatistics', ['hits', 'misses', 'evictions', 'entries', 'size'])
+
+
+class ResponseCache:
+    """
+    This class caches decoded results of API methods for a limited time.
+
+    Only methods with known time to live are cached. When total size of cached responses
+    exceeds max_size bytes, the least recently used responses are evicted.
+    """
+
+    DEFAULT_TTLS = {
+        'contest.list': 300,
+        'problemset.problems': 3600,
+        'user.ratedList': 3600
+    }
+
+    def __init__(self, max_size=64 * 1024 * 1024, ttls=None, default_ttl=None):
+        """
+        :param max_size: Maximum total size of cached responses in bytes
+        :type max_size: int
+
+        :param ttls: Time to live in seconds for every cached method. By default, DEFAULT_TTLS is used
+        :type ttls: dict of [str, float] or None
+
+        :param default_ttl: Time to live in seconds for methods, which are not presented in ttls.
+                            If None, such methods are not cached
+        :type default_ttl: float or None
+        """
+        assert isinstance(max_size, int) and max_size > 0, 'max_size should be positive int, not {}'.format(max_size)
+        assert isinstance(ttls, dict) or ttls is None
+        assert isinstance(default_ttl, (int, float)) or default_ttl is None
+
+        self._max_size = max_size
+        self._ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self._default_ttl = default_ttl
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get_ttl(self, method):
+        """
+        :param method: Request method
+        :type method: str
+
+        :return: Time to live in seconds for the given method or None if the method is not cached
+        :rtype: float or None
+        """
+        return self._ttls.get(method, self._default_ttl)
+
+    def get(self, key):
+        """
+        :param key: Key of the response
+        :type key: tuple
+
+        :return: Pair of flag, which is True if not expired response was found, and the cached response
+        :rtype: (bool, object)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires, size, value = entry
+
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+
+                del self._entries[key]
+                self._size -= size
+
+            self._misses += 1
+            return False, None
+
+    def put(self, key, value, size, ttl):
+        """
+        Caches the response
+
+        :param key: Key of the response
+        :type key: tuple
+
+        :param value: Decoded response
+        :type value: object
+
+        :param size: Size of the raw response in bytes
+        :type size: int
+
+        :param ttl: Time to live in seconds
+        :type ttl: float
+        """
+        if size > self._max_size:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+
+            if old is not None:
+                self._size -= old[1]
+
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._size += size
+
+            while self._size > self._max_size:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self):
+        """
+        Removes all cached responses
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def statistics(self):
+        """
+        :return: Number of hits, misses and evictions, number of cached responses and their total size in bytes
+        :rtype: CacheStatistics
+        """
+        with self._lock:
+            return CacheStatistics(self._hits, self._misses, self._evictions, len(self._entries), self._size)
@@ -0,0 +1,100 @@
+"""
+This module provides policy for retrying failed requests
+"""
+
+import asyncio
+import http.client
+import random
+import re
+from urllib.error import HTTPError
+
+
+__all__ = ['RetryPolicy']
+
+
+class RetryPolicy:
+    """
+    This class decides which failed requests should be retried and how long to wait before the next attempt.
+
+    Request is retried if the server responded with one of retryable status codes,
+    if the comment of failed request matches one of retryable patterns, or if a network error or timeout occurred.
+    The delay before n-th retry is backoff_base * 2 ** (n - 1) seconds, but no more than backoff_max seconds.
+    Jitter randomly shortens the delay by up to the given fraction, so that parallel clients do not retry at once.
+    """
+
+    def __init__(self, max_attempts=3, backoff_base=1.0, backoff_max=60.0, jitter=0.5,
+                 retryable_status_codes=(429, 500, 502, 503, 504),
+                 retryable_comment_patterns=('Call limit exceeded',)):
+        """
+        :param max_attempts: Maximum number of attempts, including the first one
+        :type max_attempts: int
+
+        :param backoff_base: Delay before the first retry in seconds
+        :type backoff_base: float
+
+        :param backoff_max: Maximum delay between attempts in seconds
+        :type backoff_max: float
+
+        :param jitter: Fraction of the delay, which can be randomly cut off. Should be in [0, 1]
+        :type jitter: float
+
+        :param retryable_status_codes: HTTP status codes of failed requests, which should be retried
+        :type retryable_status_codes: iterable of int
+
+        :param retryable_comment_patterns: Regular expressions. Failed requests with comment, matching any of them,
+                                           should be retried
+        :type retryable_comment_patterns: iterable of str
+        """
+        assert isinstance(max_attempts, int) and max_attempts > 0, \
+            'max_attempts should be positive int, not {}'.format(max_attempts)
+        assert isinstance(backoff_base, (int, float)) and backoff_base >= 0
+        assert isinstance(backoff_max, (int, float)) and backoff_max >= 0
+        assert isinstance(jitter, (int, float)) and 0 <= jitter <= 1, 'jitter should be in [0, 1], not {}'.format(jitter)
+
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._jitter = jitter
+        self._retryable_status_codes = frozenset(retryable_status_codes)
+        self._retryable_comment_patterns = [re.compile(p) for p in retryable_comment_patterns]
+
+    @property
+    def max_attempts(self):
+        """
+        :return: Maximum number of attempts, including the first one
+        :rtype: int
+        """
+        return self._max_attempts
+
+    def is_retryable(self, error):
+        """
+        :param error: Exception raised by the failed request
+        :type error: Exception
+
+        :return: True if request failed with given exception should be retried
+        :rtype: bool
+        """
+        http_error = error if isinstance(error, HTTPError) else error.__cause__
+
+        if isinstance(http_error, HTTPError) and http_error.code in self._retryable_status_codes:
+            return True
+
+        if isinstance(error, ValueError) and error.args and isinstance(error.args[0], str):
+            return any(p.search(error.args[0]) for p in self._retryable_comment_patterns)
+
+        # asyncio.TimeoutError is not OSError before Python 3.11, and IncompleteReadError is EOFError
+        network_errors = (OSError, http.client.HTTPException, asyncio.IncompleteReadError, asyncio.TimeoutError)
+
+        return isinstance(error, network_errors) and not isinstance(error, HTTPError)
+
+    def get_delay(self, attempt):
+        """
+        :param attempt: Number of failed attempts
+        :type attempt: int
+
+        :return: Delay in seconds before the next attempt
+        :rtype: float
+        """
+        delay = min(self._backoff_max, self._backoff_base * 2 ** (attempt - 1))
+
+        return delay * (1 - self._jitter * random.random())
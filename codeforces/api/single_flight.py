@@ -0,0 +1,134 @@
+"""
+This module provides deduplication of identical concurrent calls
+"""
+
+import asyncio
+import threading
+
+
+__all__ = ['SingleFlight', 'AsyncSingleFlight']
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    This class makes concurrent calls with the same key share one execution.
+
+    The first caller executes the function, and the others wait for its result or exception.
+    Calls made after the execution is finished execute the function again.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._shared_count = 0
+
+    @property
+    def shared_count(self):
+        """
+        :return: Number of calls, which received result of another call
+        :rtype: int
+        """
+        return self._shared_count
+
+    def do(self, key, function):
+        """
+        Executes the function, unless another call with the same key is in progress
+
+        :param key: Key of the call
+        :type key: hashable
+
+        :param function: Function without arguments
+        :type function: callable
+
+        :return: Result of the function
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if is_leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._shared_count += 1
+
+        if is_leader:
+            try:
+                call.result = function()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    This class makes concurrent coroutine calls with the same key share one execution.
+
+    The first caller awaits the coroutine, and the others await its result or exception.
+    If the first caller is cancelled, the others are cancelled too.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._shared_count = 0
+
+    @property
+    def shared_count(self):
+        """
+        :return: Number of calls, which received result of another call
+        :rtype: int
+        """
+        return self._shared_count
+
+    async def do(self, key, coroutine_function):
+        """
+        Awaits the coroutine, unless another call with the same key is in progress
+
+        :param key: Key of the call
+        :type key: hashable
+
+        :param coroutine_function: Coroutine function without arguments
+        :type coroutine_function: callable
+
+        :return: Result of the coroutine
+        """
+        future = self._calls.get(key)
+
+        if future is not None:
+            self._shared_count += 1
+            return await asyncio.shield(future)
+
+        future = self._calls[key] = asyncio.get_event_loop().create_future()
+
+        try:
+            result = await coroutine_function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # The exception is raised to the first caller, so it should not be reported as never retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -0,0 +1,218 @@
+"""
+This module provides watching of contest standings during a live round
+"""
+
+import time
+from collections import namedtuple
+
+from .codeforces_api import CodeforcesAPI
+from .json_objects import Contest
+from .json_objects import ContestPhase
+from .json_objects import RanklistRow
+
+
+__all__ = ['RowChange', 'StandingsUpdate', 'StandingsWatcher']
+
+
+class RowChange(namedtuple('RowChange', ['row', 'previous'])):
+    """
+    Changed ranklist row and its previous version, which is None if the party has just appeared in the standings
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_new(self):
+        """
+        :return: True if the party has just appeared in the standings
+        :rtype: bool
+        """
+        return self.previous is None
+
+    @property
+    def rank_delta(self):
+        """
+        :return: Number of places the party has moved up (negative if down) or None if the row is new
+        :rtype: int or None
+        """
+        return None if self.previous is None else self.previous.rank - self.row.rank
+
+    @property
+    def points_delta(self):
+        """
+        :return: Change of total points or None if the row is new
+        :rtype: float or None
+        """
+        return None if self.previous is None else self.row.points - self.previous.points
+
+    @property
+    def changed_problems(self):
+        """
+        :return: Indices of problems, which results have changed. For a new row, indices of problems with points
+        :rtype: list of int
+        """
+        if self.previous is None:
+            return [i for i, result in enumerate(self.row.problem_results) if result.points]
+
+        previous_results = self.previous.problem_results
+
+        return [i for i, result in enumerate(self.row.problem_results)
+                if i >= len(previous_results) or
+                (result.points, result.rejected_attempt_count) !=
+                (previous_results[i].points, previous_results[i].rejected_attempt_count)]
+
+    @property
+    def hacks_changed(self):
+        """
+        :return: True if successful or unsuccessful hack count has changed
+        :rtype: bool
+        """
+        return self.previous is not None and (
+            (self.row.successful_hack_count, self.row.unsuccessful_hack_count) !=
+            (self.previous.successful_hack_count, self.previous.unsuccessful_hack_count))
+
+
+StandingsUpdate = namedtuple('StandingsUpdate', ['contest', 'changes', 'removed'])
+
+
+class StandingsWatcher:
+    """
+    This class polls standings of the contest and reports only rows, which have changed since the previous poll.
+
+    The previous standings are kept as decoded rows indexed by party, and only changed rows are made into
+    RanklistRow objects. The polling interval depends on the contest phase, and watching stops
+    when the contest is finished. Use CodeforcesAPI with ChangeDetector, so that unchanged standings
+    are not decoded and compared at all.
+    """
+
+    DEFAULT_INTERVALS = {
+        ContestPhase.before: 60.0,
+        ContestPhase.coding: 5.0,
+        ContestPhase.pending_system_test: 30.0,
+        ContestPhase.system_test: 10.0,
+        ContestPhase.finished: None
+    }
+
+    def __init__(self, api, contest_id, from_=1, count=None, handles=None, show_unofficial=False, intervals=None):
+        """
+        :param api: Api, which retrieves the standings
+        :type api: CodeforcesAPI
+
+        :param contest_id: Id of the contest
+        :type contest_id: int
+
+        :param from_: 1-based index of the standings row to start the ranklist
+        :type from_: int
+
+        :param count: Number of standing rows to watch. If None, all rows are watched
+        :type count: int or None
+
+        :param handles: Handles of watched parties. If None, all parties are watched
+        :type handles: list of str or None
+
+        :param show_unofficial: If true, unofficial participants are watched too
+        :type show_unofficial: bool
+
+        :param intervals: Polling interval in seconds for every contest phase. None stops watching.
+                          By default, DEFAULT_INTERVALS is used
+        :type intervals: dict of [ContestPhase, float] or None
+        """
+        assert isinstance(api, CodeforcesAPI)
+        assert isinstance(contest_id, int), 'contest_id should be of type int, not {}'.format(type(contest_id))
+        assert isinstance(from_, int), 'from_ should be of type int, not {}'.format(type(from_))
+        assert isinstance(count, int) or count is None, 'count should be of type int, not {}'.format(type(count))
+        assert isinstance(handles, list) or handles is None
+        assert isinstance(show_unofficial, bool)
+        assert isinstance(intervals, dict) or intervals is None
+
+        self._api = api
+        self._params = {'contest_id': contest_id, 'from_': from_, 'count': count, 'handles': handles,
+                        'show_unofficial': show_unofficial}
+        self._intervals = dict(self.DEFAULT_INTERVALS)
+        self._intervals.update(intervals or {})
+        self._data = None
+        self._rows = {}
+        self._contest = None
+
+    @property
+    def contest(self):
+        """
+        :return: Contest from the last poll or None if the standings were not polled yet
+        :rtype: Contest or None
+        """
+        return self._contest
+
+    @property
+    def interval(self):
+        """
+        :return: Delay before the next poll in seconds according to the contest phase, or None if watching should stop
+        :rtype: float or None
+        """
+        if self._contest is None:
+            return 0.0
+
+        return self._intervals.get(self._contest.phase)
+
+    def poll(self):
+        """
+        Retrieves the standings and compares them with the previous ones
+
+        :return: Contest, changed rows ordered by rank and rows of parties, which have left the standings.
+                 At the first poll every row is reported as new
+        :rtype: StandingsUpdate
+        """
+        data = self._api.contest_standings_data(**self._params)
+
+        if data is self._data:
+            return StandingsUpdate(self._contest, [], [])
+
+        load = self._api.get_loader(RanklistRow)
+        rows = {}
+        changes = []
+
+        for values in data['rows']:
+            key = self._get_party_key(values['party'])
+            previous = self._rows.pop(key, None)
+            rows[key] = values
+
+            if previous != values:
+                changes.append(RowChange(load(values), load(previous) if previous is not None else None))
+
+        removed = [load(values) for values in self._rows.values()]
+
+        self._data = data
+        self._rows = rows
+        self._contest = self._api.get_loader(Contest)(data['contest'])
+
+        changes.sort(key=lambda change: change.row.rank)
+
+        return StandingsUpdate(self._contest, changes, removed)
+
+    def watch(self):
+        """
+        Polls the standings until the contest is finished, sleeping according to the contest phase between polls
+
+        :return: Generator of updates, which have changed or removed rows
+        :rtype: iterator of StandingsUpdate
+        """
+        while True:
+            update = self.poll()
+
+            if update.changes or update.removed:
+                yield update
+
+            interval = self.interval
+
+            if interval is None:
+                return
+
+            time.sleep(interval)
+
+    @staticmethod
+    def _get_party_key(party):
+        """
+        :return: Key, which identifies the party in the standings
+        :rtype: tuple
+        """
+        return (party['participantType'], party.get('teamId'), party.get('teamName'),
+                tuple(member['handle'] for member in party['members']))
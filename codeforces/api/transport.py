@@ -0,0 +1,235 @@
+"""
+This module provides transports, which send HTTP requests for CodeforcesDataRetriever
+"""
+
+import base64
+import http.client
+import io
+import json
+import threading
+import time
+import urllib.request
+from urllib.error import HTTPError
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+__all__ = ['Transport', 'UrllibTransport', 'RecordingTransport', 'ReplayTransport', 'TransportResponse']
+
+
+class Transport:
+    """
+    Base class of transports.
+
+    Transport sends GET requests and returns file-like responses. Like urllib.request.urlopen, transport
+    raises HTTPError if server responded with error status, and the error can be read to get the response body.
+    """
+
+    def urlopen(self, url, headers=None):
+        """
+        Sends GET request to the given url
+
+        :param url: Url
+        :type url: str
+
+        :param headers: Additional request headers
+        :type headers: dict of [str, str] or None
+
+        :return: File-like response object, which can be used as a context manager
+                 and has status, reason and headers attributes
+        """
+        raise NotImplementedError
+
+
+class UrllibTransport(Transport):
+    """
+    This class sends every request with urllib.request.urlopen, opening a new connection
+    """
+
+    def urlopen(self, url, headers=None):
+        if headers:
+            return urllib.request.urlopen(urllib.request.Request(url, headers=headers))
+        else:
+            return urllib.request.urlopen(url)
+
+
+class TransportResponse(io.BytesIO):
+    """
+    File-like response, which is completely held in memory
+    """
+
+    def __init__(self, status, reason, headers, body):
+        """
+        :param status: Status code
+        :type status: int
+
+        :param reason: Reason phrase
+        :type reason: str
+
+        :param headers: Response headers
+        :type headers: dict of [str, str]
+
+        :param body: Response body
+        :type body: bytes
+        """
+        super().__init__(body)
+
+        self.status = status
+        self.reason = reason
+        self.headers = http.client.HTTPMessage()
+
+        for name, value in headers.items():
+            self.headers[name] = value
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+def _normalize_url(url):
+    """
+    Removes parameters, which are different for every signed request, and sorts the others
+    """
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k not in ('apiKey', 'time', 'apiSig'))
+
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+class RecordingTransport(Transport):
+    """
+    This class sends requests through another transport and records responses into a cassette file,
+    which can be served back by ReplayTransport.
+
+    Parameters apiKey, time and apiSig are not recorded.
+    The cassette is written by save method or on exit from the with statement.
+    """
+
+    def __init__(self, cassette_path, transport=None):
+        """
+        :param cassette_path: Path to the cassette file
+        :type cassette_path: str
+
+        :param transport: Transport, which sends requests. By default, UrllibTransport is used
+        :type transport: Transport or None
+        """
+        assert isinstance(cassette_path, str)
+        assert isinstance(transport, Transport) or transport is None
+
+        self._cassette_path = cassette_path
+        self._transport = transport if transport is not None else UrllibTransport()
+        self._interactions = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.save()
+
+    def urlopen(self, url, headers=None):
+        try:
+            with self._transport.urlopen(url, headers) as response:
+                body = response.read()
+                recorded = TransportResponse(response.status, response.reason, dict(response.headers), body)
+        except HTTPError as http_e:
+            try:
+                body = http_e.read()
+                recorded = TransportResponse(http_e.code, http_e.reason, dict(http_e.headers or {}), body)
+            finally:
+                http_e.close()
+
+        self._record(url, recorded, body)
+
+        if recorded.status >= 400:
+            raise HTTPError(url, recorded.status, recorded.reason, recorded.headers, recorded)
+
+        return recorded
+
+    def save(self):
+        """
+        Writes recorded responses to the cassette file
+        """
+        with self._lock:
+            cassette = {'version': 1, 'interactions': list(self._interactions)}
+
+        with open(self._cassette_path, 'w', encoding='utf-8') as f:
+            json.dump(cassette, f, ensure_ascii=False, indent=1)
+
+    def _record(self, url, response, body):
+        interaction = {
+            'url': _normalize_url(url),
+            'status': response.status,
+            'reason': response.reason,
+            'headers': dict(response.headers)
+        }
+
+        try:
+            interaction['body'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            interaction['body_base64'] = base64.b64encode(body).decode('ascii')
+
+        with self._lock:
+            self._interactions.append(interaction)
+
+
+class ReplayTransport(Transport):
+    """
+    This class serves responses recorded by RecordingTransport without network access.
+
+    If the same url was recorded several times, the responses are served in the recorded order,
+    and the last one is repeated. Optional latency simulates network delay for every request.
+    """
+
+    def __init__(self, cassette_path, latency=0.0):
+        """
+        :param cassette_path: Path to the cassette file
+        :type cassette_path: str
+
+        :param latency: Delay of every request in seconds
+        :type latency: float
+        """
+        assert isinstance(cassette_path, str)
+        assert isinstance(latency, (int, float)) and latency >= 0
+
+        with open(cassette_path, 'r', encoding='utf-8') as f:
+            cassette = json.load(f)
+
+        self._latency = latency
+        self._responses = {}
+        self._served = {}
+        self._lock = threading.Lock()
+
+        for interaction in cassette['interactions']:
+            if 'body_base64' in interaction:
+                body = base64.b64decode(interaction['body_base64'])
+            else:
+                body = interaction['body'].encode('utf-8')
+
+            response = (interaction['status'], interaction['reason'], interaction['headers'], body)
+            self._responses.setdefault(interaction['url'], []).append(response)
+
+    def urlopen(self, url, headers=None):
+        """
+        :exception ValueError: raised when the url was not recorded
+        """
+        key = _normalize_url(url)
+
+        try:
+            responses = self._responses[key]
+        except KeyError:
+            raise ValueError('Request was not recorded', key)
+
+        with self._lock:
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+
+        if self._latency:
+            time.sleep(self._latency)
+
+        status, reason, response_headers, body = responses[min(index, len(responses) - 1)]
+        response = TransportResponse(status, reason, response_headers, body)
+
+        if status >= 400:
+            raise HTTPError(url, status, reason, response.headers, response)
+
+        return response
@@ -0,0 +1 @@
+from ..testing.local_server import *
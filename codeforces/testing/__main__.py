@@ -0,0 +1,4 @@
+from ..testing.local_server import main
+
+
+main()
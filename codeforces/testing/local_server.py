@@ -0,0 +1,594 @@
+"""
+This module provides local HTTP server, which imitates Codeforces API for load testing
+
+It serves methods used by CodeforcesAPI from synthetic or recorded data, can check apiSig of signed requests,
+and can inject latency and "Call limit exceeded" errors. Run it as a script to serve synthetic data:
+
+    $ python -m codeforces.testing --port 8000
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import unquote, urlsplit
+
+
+__all__ = ['LocalCodeforcesServer', 'make_synthetic_data']
+
+
+_PROBLEM_TAGS = ['implementation', 'math', 'greedy', 'dp', 'graphs', 'strings', 'data structures', 'brute force']
+
+_VERDICTS = ['OK', 'OK', 'WRONG_ANSWER', 'TIME_LIMIT_EXCEEDED', 'RUNTIME_ERROR', 'COMPILATION_ERROR']
+
+
+def make_synthetic_data(contests=3, users=100, submissions_per_contest=1000, seed=0):
+    """
+    Makes data in the format accepted by LocalCodeforcesServer.
+
+    Every contest has five problems. Every user participates in every contest and has rating history.
+
+    :param contests: Number of contests
+    :type contests: int
+
+    :param users: Number of users
+    :type users: int
+
+    :param submissions_per_contest: Number of submissions in every contest
+    :type submissions_per_contest: int
+
+    :param seed: Seed of the random generator
+    :type seed: int
+
+    :return: Dictionary with lists of contests, problems, problemStatistics, users, submissions,
+             ranklistRows, ratingChanges and hacks in the Codeforces API JSON format
+    :rtype: dict
+    """
+    rnd = random.Random(seed)
+    start = 1406480400
+    handles = ['user{}'.format(i) for i in range(users)]
+    ratings = {handle: 1500 for handle in handles}
+
+    data = {key: [] for key in ('contests', 'problems', 'problemStatistics', 'users', 'submissions',
+                                'ranklistRows', 'ratingChanges', 'hacks')}
+
+    def make_party(contest_id, handle):
+        return {'contestId': contest_id, 'members': [{'handle': handle}], 'participantType': 'CONTESTANT',
+                'ghost': False, 'room': zlib.crc32(handle.encode()) % 100 + 1, 'startTimeSeconds': contest_start}
+
+    for c in range(contests):
+        contest_id = 500 + c
+        contest_start = start + c * 7 * 24 * 3600
+        contest_name = 'Codeforces Round #{} (Div. 2)'.format(300 + c)
+
+        data['contests'].append({'id': contest_id, 'name': contest_name, 'type': 'CF', 'phase': 'FINISHED',
+                                 'frozen': False, 'durationSeconds': 7200, 'startTimeSeconds': contest_start,
+                                 'relativeTimeSeconds': 1000000})
+
+        problems = [{'contestId': contest_id, 'index': index, 'name': 'Problem {}{}'.format(contest_id, index),
+                     'type': 'PROGRAMMING', 'points': 500.0 * (i + 1), 'tags': rnd.sample(_PROBLEM_TAGS, 2)}
+                    for i, index in enumerate('ABCDE')]
+        solved = {index: 0 for index in 'ABCDE'}
+        results = {handle: {} for handle in handles}
+
+        for s in range(submissions_per_contest):
+            submission_id = (c * submissions_per_contest + s) * 10 + rnd.randrange(10)
+            handle = rnd.choice(handles)
+            problem = rnd.choice(problems)
+            verdict = rnd.choice(_VERDICTS)
+            relative_time = rnd.randrange(7200)
+
+            if verdict == 'OK' and problem['index'] not in results[handle]:
+                solved[problem['index']] += 1
+                results[handle][problem['index']] = relative_time
+
+            data['submissions'].append({
+                'id': submission_id, 'contestId': contest_id, 'creationTimeSeconds': contest_start + relative_time,
+                'relativeTimeSeconds': relative_time, 'problem': problem, 'author': make_party(contest_id, handle),
+                'programmingLanguage': 'GNU C++11', 'verdict': verdict, 'testset': 'TESTS',
+                'passedTestCount': rnd.randrange(50), 'timeConsumedMillis': rnd.randrange(2000),
+                'memoryConsumedBytes': rnd.randrange(256) * 1024 * 1024})
+
+        data['problems'].extend(problems)
+        data['problemStatistics'].extend({'contestId': contest_id, 'index': p['index'],
+                                          'solvedCount': solved[p['index']]} for p in problems)
+
+        rows = []
+
+        for handle in handles:
+            problem_results = [{'points': p['points'] if p['index'] in results[handle] else 0.0,
+                                'rejectedAttemptCount': rnd.randrange(3), 'type': 'FINAL',
+                                'bestSubmissionTimeSeconds': results[handle].get(p['index'])}
+                               for p in problems]
+            hacks = rnd.randrange(3), rnd.randrange(3)
+            points = sum(r['points'] for r in problem_results) + 100 * hacks[0] - 50 * hacks[1]
+
+            rows.append({'party': make_party(contest_id, handle), 'points': points, 'penalty': 0,
+                         'successfulHackCount': hacks[0], 'unsuccessfulHackCount': hacks[1],
+                         'problemResults': problem_results})
+
+        rows.sort(key=lambda r: -r['points'])
+
+        for rank, row in enumerate(rows, 1):
+            row['rank'] = rank
+            handle = row['party']['members'][0]['handle']
+            old_rating = ratings[handle]
+            ratings[handle] = old_rating + (len(rows) // 2 - rank) * 200 // max(1, len(rows))
+
+            data['ratingChanges'].append({'contestId': contest_id, 'contestName': contest_name, 'handle': handle,
+                                          'rank': rank, 'ratingUpdateTimeSeconds': contest_start + 9000,
+                                          'oldRating': old_rating, 'newRating': ratings[handle]})
+
+        data['ranklistRows'].extend(rows)
+
+        for h in range(min(users // 2, 10)):
+            hacker, defender = rnd.sample(handles, 2)
+
+            data['hacks'].append({'id': contest_id * 1000 + h, 'creationTimeSeconds': contest_start + 3600 + h,
+                                  'hacker': make_party(contest_id, hacker),
+                                  'defender': make_party(contest_id, defender),
+                                  'verdict': rnd.choice(['HACK_SUCCESSFUL', 'HACK_UNSUCCESSFUL']),
+                                  'problem': rnd.choice(problems)})
+
+    for handle in handles:
+        data['users'].append({'handle': handle, 'contribution': 0, 'rating': ratings[handle],
+                              'maxRating': max(ratings[handle], 1500), 'rank': 'specialist',
+                              'maxRank': 'specialist', 'country': rnd.choice(['Russia', 'Mexico', 'China']),
+                              'organization': rnd.choice(['Ural FU', 'ITMO', '']),
+                              'lastOnlineTimeSeconds': start + contests * 7 * 24 * 3600,
+                              'registrationTimeSeconds': start - 3600, 'friendOfCount': rnd.randrange(100)})
+
+    return data
+
+
+class _APIError(Exception):
+    def __init__(self, comment, status=400):
+        super().__init__(comment)
+        self.comment = comment
+        self.status = status
+
+
+class _LocalCodeforcesHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.codeforces.handle_request(self)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class LocalCodeforcesServer:
+    """
+    This class runs HTTP server, which imitates Codeforces API, in a background thread.
+
+    Requests with apiKey are accepted only if the key is known and apiSig is correct.
+    Requests exceeding rate_limit, and a random share of error_rate requests, fail with "Call limit exceeded".
+    If etags is true, successful responses have ETag, and requests with the matching If-None-Match
+    are answered with 304 Not Modified.
+    """
+
+    def __init__(self, data=None, keys=None, latency=0.0, rate_limit=None, error_rate=0.0, compression=True,
+                 etags=False, host='127.0.0.1', port=0):
+        """
+        :param data: Data returned by make_synthetic_data or loaded from recorded responses in the same format.
+                     If None, synthetic data with default parameters is used
+        :type data: dict or None
+
+        :param keys: Known API keys with their secrets
+        :type keys: dict of [str, str] or None
+
+        :param latency: Delay of every response in seconds
+        :type latency: float
+
+        :param rate_limit: Maximum number of accepted requests within the last second.
+                           If None, requests are not limited
+        :type rate_limit: float or None
+
+        :param error_rate: Share of requests, which randomly fail with "Call limit exceeded"
+        :type error_rate: float
+
+        :param compression: If true, responses are compressed with gzip or deflate if the client accepts it
+        :type compression: bool
+
+        :param etags: If true, responses have ETag, and conditional requests are supported.
+                      Like the real Codeforces API, by default ETag is not sent
+        :type etags: bool
+
+        :param host: Host to listen on
+        :type host: str
+
+        :param port: Port to listen on. By default, a free port is chosen
+        :type port: int
+        """
+        assert isinstance(data, dict) or data is None
+        assert isinstance(keys, dict) or keys is None
+        assert isinstance(latency, (int, float)) and latency >= 0
+        assert isinstance(rate_limit, (int, float)) or rate_limit is None
+        assert isinstance(error_rate, (int, float)) and 0 <= error_rate <= 1
+
+        self._keys = dict(keys or {})
+        self._latency = latency
+        self._rate_limit = rate_limit
+        self._recent = deque()
+        self._error_rate = error_rate
+        self._compression = compression
+        self._etags = etags
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._rejected_count = 0
+        self._not_modified_count = 0
+
+        self._data = make_synthetic_data() if data is None else data
+        self._data['submissions'] = sorted(self._data.get('submissions', []), key=lambda s: -s['id'])
+
+        self._handlers = {
+            'contest.hacks': self._contest_hacks,
+            'contest.list': self._contest_list,
+            'contest.ratingChanges': self._contest_rating_changes,
+            'contest.standings': self._contest_standings,
+            'contest.status': self._contest_status,
+            'problemset.problems': self._problemset_problems,
+            'problemset.recentStatus': self._problemset_recent_status,
+            'user.info': self._user_info,
+            'user.ratedList': self._user_rated_list,
+            'user.rating': self._user_rating,
+            'user.status': self._user_status
+        }
+
+        self._server = _ThreadingHTTPServer((host, port), _LocalCodeforcesHandler)
+        self._server.codeforces = self
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def base_url(self):
+        """
+        :return: Base of API url, which should be given to CodeforcesAPI
+        :rtype: str
+        """
+        host, port = self._server.server_address[:2]
+        return 'http://{}:{}/api/'.format(host, port)
+
+    @property
+    def request_count(self):
+        """
+        :return: Number of received requests
+        :rtype: int
+        """
+        return self._request_count
+
+    @property
+    def rejected_count(self):
+        """
+        :return: Number of requests failed with "Call limit exceeded"
+        :rtype: int
+        """
+        return self._rejected_count
+
+    @property
+    def not_modified_count(self):
+        """
+        :return: Number of requests answered with 304 Not Modified
+        :rtype: int
+        """
+        return self._not_modified_count
+
+    def start(self):
+        """
+        Starts serving requests in a background thread
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server and closes the socket
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        """
+        Serves requests in the current thread
+        """
+        self._server.serve_forever()
+
+    def add_submissions(self, submissions):
+        """
+        Adds new submissions, e.g. to imitate a running contest
+
+        :param submissions: Submissions in the Codeforces API JSON format
+        :type submissions: list of dict
+        """
+        with self._lock:
+            self._data['submissions'] = sorted(self._data['submissions'] + list(submissions), key=lambda s: -s['id'])
+
+    def handle_request(self, handler):
+        with self._lock:
+            self._request_count += 1
+
+        if self._latency:
+            time.sleep(self._latency)
+
+        try:
+            method, params = self._parse_request(handler.path)
+            self._check_call_limit()
+            result = self._handlers[method](params)
+            status, body = 200, {'status': 'OK', 'result': result}
+        except _APIError as e:
+            status, body = e.status, {'status': 'FAILED', 'comment': e.comment}
+
+        data = json.dumps(body).encode('utf-8')
+        etag = '"{}"'.format(hashlib.sha1(data).hexdigest()) if self._etags and status == 200 else None
+
+        if etag is not None and handler.headers.get('If-None-Match') == etag:
+            with self._lock:
+                self._not_modified_count += 1
+
+            handler.send_response(304)
+            handler.send_header('ETag', etag)
+            handler.end_headers()
+            return
+
+        encoding = self._choose_encoding(handler.headers.get('Accept-Encoding', ''))
+
+        if encoding == 'gzip':
+            data = gzip.compress(data)
+        elif encoding == 'deflate':
+            data = zlib.compress(data)
+
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json;charset=UTF-8')
+
+        if encoding is not None:
+            handler.send_header('Content-Encoding', encoding)
+
+        if etag is not None:
+            handler.send_header('ETag', etag)
+
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _choose_encoding(self, accept_encoding):
+        if not self._compression:
+            return None
+
+        accepted = {value.split(';')[0].strip().lower() for value in accept_encoding.split(',')}
+
+        for encoding in ('gzip', 'deflate'):
+            if encoding in accepted:
+                return encoding
+
+        return None
+
+    def _parse_request(self, path):
+        parts = urlsplit(path)
+
+        if not parts.path.startswith('/api/') or parts.path[len('/api/'):] not in self._handlers:
+            raise _APIError('Method is not supported', 404)
+
+        method = parts.path[len('/api/'):]
+        raw_params = [p.partition('=')[::2] for p in parts.query.split('&') if p]
+        params = {k: unquote(v) for k, v in raw_params}
+
+        if 'apiKey' in params:
+            self._check_signature(method, raw_params, params)
+
+        return method, params
+
+    def _check_signature(self, method, raw_params, params):
+        secret = self._keys.get(params['apiKey'])
+
+        if secret is None:
+            raise _APIError('apiKey: Incorrect API key')
+
+        if abs(self._get_int(params, 'time', 0) - time.time()) > 300:
+            raise _APIError('time: Request time is too old')
+
+        signature = params.get('apiSig', '')
+        signed = '&'.join('{}={}'.format(k, v) for k, v in sorted(raw_params) if k != 'apiSig')
+        expected = hashlib.sha512('{}/{}?{}#{}'.format(signature[:6], method, signed, secret).encode()).hexdigest()
+
+        if signature[6:] != expected:
+            raise _APIError('apiSig: Incorrect signature')
+
+    def _check_call_limit(self):
+        limited = False
+
+        if self._rate_limit is not None:
+            now = time.monotonic()
+
+            with self._lock:
+                while self._recent and self._recent[0] <= now - 1:
+                    self._recent.popleft()
+
+                limited = len(self._recent) >= self._rate_limit
+
+                if not limited:
+                    self._recent.append(now)
+
+        if limited or (self._error_rate and self._random.random() < self._error_rate):
+            with self._lock:
+                self._rejected_count += 1
+
+            raise _APIError('Call limit exceeded', 503)
+
+    @staticmethod
+    def _get_int(params, name, default=None):
+        value = params.get(name)
+
+        if value is None:
+            if default is None:
+                raise _APIError('{}: Field should not be empty'.format(name))
+
+            return default
+
+        try:
+            return int(value)
+        except ValueError:
+            raise _APIError('{}: Field should contain long integer value'.format(name))
+
+    def _get_contest(self, params):
+        contest_id = self._get_int(params, 'contestId')
+
+        for contest in self._data['contests']:
+            if contest['id'] == contest_id:
+                return contest
+
+        raise _APIError('contestId: Contest with id {} not found'.format(contest_id))
+
+    def _get_handle(self, params):
+        handle = params.get('handle')
+
+        if not handle:
+            raise _APIError('handle: Field should not be empty')
+
+        if not any(u['handle'].lower() == handle.lower() for u in self._data['users']):
+            raise _APIError('handle: User with handle {} not found'.format(handle))
+
+        return handle.lower()
+
+    def _slice(self, items, params):
+        start = self._get_int(params, 'from', 1)
+        count = self._get_int(params, 'count', len(items))
+
+        return items[start - 1:start - 1 + count]
+
+    @staticmethod
+    def _has_member(party, handle):
+        return any(m['handle'].lower() == handle for m in party['members'])
+
+    def _contest_hacks(self, params):
+        contest = self._get_contest(params)
+        return [h for h in self._data['hacks'] if h['problem']['contestId'] == contest['id']]
+
+    def _contest_list(self, params):
+        gym = params.get('gym', 'false').lower() == 'true'
+        return [c for c in self._data['contests'] if (c['id'] >= 100000) == gym]
+
+    def _contest_rating_changes(self, params):
+        contest = self._get_contest(params)
+        return [r for r in self._data['ratingChanges'] if r['contestId'] == contest['id']]
+
+    def _contest_standings(self, params):
+        contest = self._get_contest(params)
+        rows = [r for r in self._data['ranklistRows'] if r['party']['contestId'] == contest['id']]
+
+        if params.get('showUnofficial', 'false').lower() != 'true':
+            rows = [r for r in rows if r['party']['participantType'] == 'CONTESTANT']
+
+        if params.get('handles'):
+            handles = {h.lower() for h in params['handles'].split(';')}
+            rows = [r for r in rows if any(m['handle'].lower() in handles for m in r['party']['members'])]
+
+        return {'contest': contest,
+                'problems': [p for p in self._data['problems'] if p['contestId'] == contest['id']],
+                'rows': self._slice(rows, params)}
+
+    def _contest_status(self, params):
+        contest = self._get_contest(params)
+        handle = params.get('handle')
+        submissions = [s for s in self._data['submissions'] if s['contestId'] == contest['id'] and
+                       (handle is None or self._has_member(s['author'], handle.lower()))]
+
+        return self._slice(submissions, params)
+
+    def _problemset_problems(self, params):
+        tags = set(params['tags'].split(';')) if params.get('tags') else set()
+        problems = [p for p in self._data['problems'] if tags.issubset(p['tags'])]
+        keys = {(p['contestId'], p['index']) for p in problems}
+
+        return {'problems': problems,
+                'problemStatistics': [s for s in self._data['problemStatistics']
+                                      if (s['contestId'], s['index']) in keys]}
+
+    def _problemset_recent_status(self, params):
+        count = self._get_int(params, 'count')
+
+        if not 0 < count <= 1000:
+            raise _APIError('count: Field should be between 1 and 1000')
+
+        return self._data['submissions'][:count]
+
+    def _user_info(self, params):
+        if not params.get('handles'):
+            raise _APIError('handles: Field should not be empty')
+
+        users = {u['handle'].lower(): u for u in self._data['users']}
+        handles = params['handles'].split(';')
+
+        if len(handles) > 10000:
+            raise _APIError('handles: Field should contain no more than 10000 items')
+
+        for handle in handles:
+            if handle.lower() not in users:
+                raise _APIError('handles: User with handle {} not found'.format(handle))
+
+        return [users[h.lower()] for h in handles]
+
+    def _user_rated_list(self, params):
+        return sorted((u for u in self._data['users'] if 'rating' in u), key=lambda u: -u['rating'])
+
+    def _user_rating(self, params):
+        handle = self._get_handle(params)
+        return [r for r in self._data['ratingChanges'] if r['handle'].lower() == handle]
+
+    def _user_status(self, params):
+        handle = self._get_handle(params)
+        submissions = [s for s in self._data['submissions'] if self._has_member(s['author'], handle)]
+
+        return self._slice(submissions, params)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local server, which imitates Codeforces API')
+    parser.add_argument('--host', default='127.0.0.1', help='Host to listen on')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on')
+    parser.add_argument('--data', help='JSON file with data in the format of make_synthetic_data')
+    parser.add_argument('--contests', type=int, default=3, help='Number of synthetic contests')
+    parser.add_argument('--users', type=int, default=100, help='Number of synthetic users')
+    parser.add_argument('--submissions', type=int, default=1000, help='Number of synthetic submissions per contest')
+    parser.add_argument('--latency', type=float, default=0.0, help='Delay of every response in seconds')
+    parser.add_argument('--rate-limit', type=float, help='Maximum number of requests per second')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of randomly failed requests')
+    parser.add_argument('--no-compression', action='store_true', help='Do not compress responses')
+    parser.add_argument('--etags', action='store_true', help='Send ETag and support conditional requests')
+    args = parser.parse_args()
+
+    if args.data is not None:
+        with open(args.data, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    else:
+        data = make_synthetic_data(args.contests, args.users, args.submissions)
+
+    server = LocalCodeforcesServer(data, latency=args.latency, rate_limit=args.rate_limit,
+                                   error_rate=args.error_rate, compression=not args.no_compression,
+                                   etags=args.etags, host=args.host, port=args.port)
+
+    print('Serving Codeforces API at {}'.format(server.base_url))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,3 @@
-from ..utils.lazy_property import *
\ No newline at end of file
+from ..utils.json_decoder import *
+from ..utils.lazy_property import *
+from ..utils.rate_limiter import *
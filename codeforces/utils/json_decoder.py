@@ -0,0 +1,117 @@
+"""
+This module contains decoder of JSON documents with pluggable backends
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+__all__ = ['JsonDecoder', 'get_default_json_decoder', 'set_default_json_decoder']
+
+
+class JsonDecoder:
+    """
+    This class decodes JSON documents with one of the backends: orjson, ujson or json from the standard library.
+
+    orjson and ujson decode bytes directly, without making a decoded copy of the document.
+    By default, the fastest installed backend is used.
+    """
+
+    BACKENDS = ('orjson', 'ujson', 'json')
+
+    def __init__(self, backend=None):
+        """
+        :param backend: Name of the backend. If None, the fastest installed backend is used
+        :type backend: str or None
+
+        :exception ValueError: raised when the backend is unknown or not installed
+        """
+        if backend is None:
+            backend = next(name for name in self.BACKENDS if self.is_available(name))
+
+        if not self.is_available(backend):
+            raise ValueError('JSON backend is not available', backend)
+
+        self._backend = backend
+
+        if backend == 'orjson':
+            self._loads = orjson.loads
+        elif backend == 'ujson':
+            self._loads = ujson.loads
+        else:
+            self._loads = self._json_loads
+
+    def __repr__(self):
+        return '<JsonDecoder: {}>'.format(self._backend)
+
+    @property
+    def backend(self):
+        """
+        :return: Name of the backend
+        :rtype: str
+        """
+        return self._backend
+
+    @classmethod
+    def is_available(cls, backend):
+        """
+        :param backend: Name of the backend
+        :type backend: str
+
+        :return: True if the backend is installed
+        :rtype: bool
+        """
+        return {'orjson': orjson, 'ujson': ujson, 'json': json}.get(backend) is not None
+
+    def loads(self, data):
+        """
+        Decodes JSON document
+
+        :param data: JSON document. Bytes should be encoded in UTF-8
+        :type data: bytes or str
+
+        :return: Decoded value
+        :exception ValueError: raised when the document is not valid JSON
+        """
+        return self._loads(data)
+
+    @staticmethod
+    def _json_loads(data):
+        # json.loads accepts bytes only since Python 3.6
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+
+        return json.loads(data)
+
+
+_default_json_decoder = JsonDecoder()
+
+
+def get_default_json_decoder():
+    """
+    :return: Decoder, which is used when no decoder is given explicitly
+    :rtype: JsonDecoder
+    """
+    return _default_json_decoder
+
+
+def set_default_json_decoder(decoder):
+    """
+    Changes decoder, which is used when no decoder is given explicitly
+
+    :param decoder: Decoder
+    :type decoder: JsonDecoder
+    """
+    assert isinstance(decoder, JsonDecoder)
+
+    global _default_json_decoder
+    _default_json_decoder = decoder
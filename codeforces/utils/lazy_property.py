@@ -2,7 +2,25 @@
 This module contains classes for representing lazy property
 """
 
-__all__ = ['lazy_property']
+__all__ = ['TRUSTED', 'lazy_property']
+
+
+class _Trusted:
+    """
+    Marker of lazy property value, which is trusted and converted without checks on the first access
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'TRUSTED'
+
+    def __reduce__(self):
+        return 'TRUSTED'
+
+
+TRUSTED = _Trusted()
+
 
 class lazy_property(property):
     """
@@ -11,13 +29,24 @@ class lazy_property(property):
     Calling __set__ does not actually change property value.
     The first call of __get__ makes all required actions and returns value
     The other calls returns the evaluated result, unless __set__ will be called again
+
+    The value given to __set__ is stored in '_lazy_<name>' attribute,
+    which should be listed in __slots__ of classes with slots.
+    If the getter returns TRUSTED and the unchecked attribute is set, the stored value is converted
+    by unchecked function before it is passed to the setter. Such properties should keep their value
+    in '_<name>' attribute, which is reset by __set__, so that assigned values are checked
     """
     def __init__(self, fget=None, fset=None, fdel=None, doc=None):
         super().__init__(fget, fset, fdel, doc)
 
-        self._prop_name = '__impl_lazy_' + fget.__name__
+        # The name is not mangled, so that it can be listed in __slots__ as is
+        self._prop_name = '_lazy_' + fget.__name__
+        self.unchecked = None
 
     def __set__(self, obj, value):
+        if self.unchecked is not None and super().__get__(obj) is TRUSTED:
+            setattr(obj, '_' + self.fget.__name__, None)
+
         setattr(obj, self._prop_name, value)
 
     def __get__(self, obj, type=None):
@@ -25,7 +54,10 @@ class lazy_property(property):
             prop = getattr(obj, self._prop_name)
 
             if prop is not None:
+                if self.unchecked is not None and super().__get__(obj, type) is TRUSTED:
+                    prop = self.unchecked(prop)
+
                 super().__set__(obj, prop)
                 setattr(obj, self._prop_name, None)
 
-        return super().__get__(obj, type)
\ No newline at end of file
+        return super().__get__(obj, type)
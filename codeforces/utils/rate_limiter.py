@@ -0,0 +1,143 @@
+"""
+This module contains classes for limiting rate of requests
+"""
+
+import threading
+import time
+import warnings
+
+
+__all__ = ['TokenBucket']
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    The bucket is refilled with rate tokens per second and holds at most burst tokens.
+    Every request takes one token. If the bucket is empty, the request waits until a token is refilled.
+    Waiting requests reserve tokens in order of arrival, so the rate is never exceeded,
+    but the bucket is never idle while there are waiting requests.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate, burst=1):
+        """
+        :param rate: Number of tokens refilled per second
+        :type rate: float
+
+        :param burst: Maximum number of tokens in the bucket
+        :type burst: int
+        """
+        self._lock = threading.Lock()
+        self._rate = None
+        self._burst = None
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+        self.configure(rate, burst)
+
+    def __repr__(self):
+        return '<TokenBucket: {}/s, burst {}>'.format(self.rate, self.burst)
+
+    @classmethod
+    def shared(cls, name, rate, burst=1):
+        """
+        Returns bucket shared by all callers within the process with the same name.
+
+        If the bucket already exists with other rate or burst, the strictest of both configurations is kept,
+        so that one caller can not exceed the limit of another one, and RuntimeWarning is issued.
+
+        :param name: Name of the bucket, e.g. API key
+        :type name: str or None
+
+        :param rate: Number of tokens refilled per second
+        :type rate: float
+
+        :param burst: Maximum number of tokens in the bucket
+        :type burst: int
+
+        :rtype: TokenBucket
+        """
+        with cls._shared_lock:
+            bucket = cls._shared.get(name)
+
+            if bucket is None:
+                bucket = cls._shared[name] = cls(rate, burst)
+
+            if bucket.rate != rate or bucket.burst != burst:
+                warnings.warn('Token bucket {!r} is shared with rate {} and burst {}, but rate {} and burst {} '
+                              'are requested. The strictest ones are used'.format(name, bucket.rate, bucket.burst,
+                                                                                  rate, burst),
+                              RuntimeWarning, stacklevel=2)
+
+                bucket.configure(min(bucket.rate, rate), min(bucket.burst, burst))
+
+        return bucket
+
+    @property
+    def rate(self):
+        """
+        :return: Number of tokens refilled per second
+        :rtype: float
+        """
+        return self._rate
+
+    @property
+    def burst(self):
+        """
+        :return: Maximum number of tokens in the bucket
+        :rtype: int
+        """
+        return self._burst
+
+    def configure(self, rate, burst=1):
+        """
+        Changes rate and burst of the bucket
+
+        :param rate: Number of tokens refilled per second
+        :type rate: float
+
+        :param burst: Maximum number of tokens in the bucket
+        :type burst: int
+        """
+        assert isinstance(rate, (int, float)) and rate > 0, 'rate should be positive number, not {}'.format(rate)
+        assert isinstance(burst, int) and burst > 0, 'burst should be positive int, not {}'.format(burst)
+
+        with self._lock:
+            self._refill()
+            self._rate = float(rate)
+            self._burst = burst
+            self._tokens = min(self._tokens, burst)
+
+    def reserve(self):
+        """
+        Takes one token from the bucket without waiting
+
+        :return: Number of seconds the caller should wait before the request
+        :rtype: float
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+    def acquire(self):
+        """
+        Takes one token from the bucket, waiting until it is refilled if needed
+        """
+        delay = self.reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def _refill(self):
+        now = time.monotonic()
+
+        if self._rate is not None:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+
+        self._updated = now
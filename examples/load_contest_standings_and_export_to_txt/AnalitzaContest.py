@@ -3,7 +3,7 @@
 
 """
 In this code I try to obtain all the statistics (regarding rating) of every participant in a list of contests
-WARNING: a little bit inefficient
+Rating histories are loaded concurrently, and every participant is loaded only once for all contests
 """
 
 import os
@@ -12,6 +12,14 @@ import sys
 from codeforces import CodeforcesAPI
 
 
+def print_progress(progress):
+    print('{}/{} ({:.1f}/s)'.format(progress.completed, progress.total, progress.throughput))
+
+
+def print_error(handle, error):
+    print('{}: {}'.format(handle, error))
+
+
 def main(argv):
     #llistat = [341,343,346,348,351,354,356,360,364,367,372,375,377,380,383,388,403,406,407,414,418,420,425,429,434,438,442]; #Div1contests
     #llistat = [379, 436, 325, 316, 241] #Div1&2contests
@@ -19,13 +27,15 @@ def main(argv):
     llistat = [447,448,450,451,454,456,459,460,462,463,465,466,467]; #Div2contests.
     f = open('Div2sft.txt', 'w')
     api = CodeforcesAPI()
+    historial = {}
     for id in llistat:
         llista = list(api.contest_standings(id)['rows'])
         participa = str(len(llista))
-        for p in llista:
-            tio = p.party.members[0].handle
-            print(str(id)+' '+str(p.rank))
-            concursos = api.user_rating(tio)
+        tios = [p.party.members[0].handle for p in llista]
+        # Histories are retrieved in completion order, so rows are written in the order of the standings
+        historials = dict(api.bulk_user_rating(tios, cache=historial, progress=print_progress, errors=print_error))
+        for tio in tios:
+            concursos = historials.get(tio, [])
             cont = 0
             for c in concursos:
                 cont = cont+1
@@ -0,0 +1,108 @@
+"""
+This module provides classes for testing AsyncCodeforcesAPI
+"""
+
+import asyncio
+import os
+import unittest
+
+from codeforces import AsyncCodeforcesAPI
+from codeforces import AsyncHTTPConnectionPool
+from codeforces import AsyncResponse
+from codeforces import RatingChange
+from codeforces import RetryPolicy
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
+
+
+class FixtureConnectionPool(AsyncHTTPConnectionPool):
+    def __init__(self, status, body):
+        super().__init__()
+        self.response = AsyncResponse(status, '', {}, body)
+        self.urls = []
+
+    async def request(self, url, headers=None):
+        self.urls.append(url)
+        return self.response
+
+
+class FailingConnectionPool(FixtureConnectionPool):
+    def __init__(self, errors, body):
+        super().__init__(200, body)
+        self.errors = list(errors)
+
+    async def request(self, url, headers=None):
+        self.urls.append(url)
+
+        if self.errors:
+            raise self.errors.pop(0)
+
+        return self.response
+
+
+class AsyncCodeforcesAPITests(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def load_fixture(self, fixture_name):
+        path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures', fixture_name)
+
+        with open(path, 'r') as fixture:
+            return fixture.read().encode('utf-8')
+
+    def test_contest_rating_changes(self):
+        pool = FixtureConnectionPool(200, self.load_fixture('contest.ratingChanges.json'))
+        api = AsyncCodeforcesAPI(connection_pool=pool, rate_limit=None)
+
+        rating_changes = list(self.loop.run_until_complete(api.contest_rating_changes(42)))
+
+        self.assertEqual(9, len(rating_changes))
+        self.assertIsInstance(rating_changes[0], RatingChange)
+        self.assertEqual(['http://codeforces.com/api/contest.ratingChanges?contestId=42'], pool.urls)
+
+    def test_failed_request_raises_value_error(self):
+        pool = FixtureConnectionPool(400, b'{"status": "FAILED", "comment": "contestId: Contest with id 0 not found"}')
+        api = AsyncCodeforcesAPI(connection_pool=pool, rate_limit=None)
+
+        with self.assertRaises(ValueError) as cm:
+            self.loop.run_until_complete(api.contest_hacks(0))
+
+        self.assertEqual('contestId: Contest with id 0 not found', cm.exception.args[0])
+
+    def test_interrupted_and_timed_out_requests_are_retried(self):
+        errors = [asyncio.IncompleteReadError(b'{"status"', 100), asyncio.TimeoutError()]
+        pool = FailingConnectionPool(errors, b'{"status": "OK", "result": []}')
+        api = AsyncCodeforcesAPI(connection_pool=pool, rate_limit=None,
+                                 retry_policy=RetryPolicy(backoff_base=0, jitter=0))
+
+        self.assertEqual([], list(self.loop.run_until_complete(api.user_rating('tourist'))))
+        self.assertEqual(3, len(pool.urls))
+
+    def test_signed_request(self):
+        pool = FixtureConnectionPool(200, b'{"status": "OK", "result": []}')
+        api = AsyncCodeforcesAPI(key='key', secret='secret', connection_pool=pool, rate_limit=None)
+
+        self.loop.run_until_complete(api.user_rating('tourist'))
+
+        self.assertRegex(pool.urls[0], r'^http://codeforces.com/api/user.rating\?'
+                                       r'(?=.*handle=tourist)(?=.*apiKey=key)(?=.*time=\d+).*&apiSig=\d{6}[0-9a-f]{128}$')
+
+    def test_user_info_is_chunked(self):
+        with LocalCodeforcesServer(make_synthetic_data(contests=1, users=300, submissions_per_contest=1),
+                                   keys={'key': 'secret'}) as server:
+            async def run():
+                async with AsyncCodeforcesAPI(key='key', secret='secret', base_url=server.base_url,
+                                              rate_limit=None) as api:
+                    return list(await api.user_info(handles + ['USER5'], max_url_length=500))
+
+            handles = ['user{}'.format(i) for i in range(299, -1, -1)]
+            users = self.loop.run_until_complete(run())
+
+            self.assertEqual(handles, [u.handle for u in users])
+            self.assertGreater(server.request_count, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+This module provides classes for testing AsyncHTTPConnectionPool
+"""
+
+import asyncio
+import json
+import unittest
+
+from codeforces import AsyncHTTPConnectionPool
+from tests.api.stub_server import StubServer
+
+
+def respond(path):
+    if path.startswith('/missing'):
+        return 400, {'status': 'FAILED', 'comment': 'missing'}
+    else:
+        return 200, {'status': 'OK', 'result': path}
+
+
+class AsyncHTTPConnectionPoolTests(unittest.TestCase):
+    chunked = False
+
+    def setUp(self):
+        self.server = StubServer(respond, chunked=self.chunked).start()
+        self.loop = asyncio.new_event_loop()
+        self.pool = AsyncHTTPConnectionPool(pool_size=4, max_connections=4)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.pool.close())
+        self.loop.close()
+        self.server.stop()
+
+    def read(self, path):
+        response = self.loop.run_until_complete(self.pool.request(self.server.base + path))
+        return response.status, json.loads(response.body.decode('utf-8'))
+
+    def test_reuses_connection(self):
+        for i in range(10):
+            status, body = self.read('api/user.rating?handle={}'.format(i))
+
+            self.assertEqual(200, status)
+            self.assertEqual('/api/user.rating?handle={}'.format(i), body['result'])
+
+        self.assertEqual(1, len(self.server.client_ports))
+
+    def test_error_status_is_returned(self):
+        status, body = self.read('missing')
+
+        self.assertEqual(400, status)
+        self.assertEqual('missing', body['comment'])
+
+    def test_concurrent_requests_are_limited_by_max_connections(self):
+        async def fetch_all():
+            requests = [self.pool.request(self.server.base + 'api/user.info?handles={}'.format(i)) for i in range(50)]
+            return await asyncio.gather(*requests)
+
+        responses = self.loop.run_until_complete(fetch_all())
+
+        self.assertEqual(['/api/user.info?handles={}'.format(i) for i in range(50)],
+                         [json.loads(r.body.decode('utf-8'))['result'] for r in responses])
+        self.assertLessEqual(len(self.server.client_ports), 4)
+
+
+class AsyncHTTPConnectionPoolChunkedTests(AsyncHTTPConnectionPoolTests):
+    chunked = True
+
+
+if __name__ == '__main__':
+    unittest.main()
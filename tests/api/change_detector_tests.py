@@ -0,0 +1,200 @@
+"""
+This module provides classes for testing ChangeDetector
+"""
+
+import asyncio
+import unittest
+
+from codeforces import AsyncCodeforcesAPI
+from codeforces import ChangeDetector
+from codeforces import ChangeStatistics
+from codeforces import CodeforcesAPI
+from codeforces import HTTPConnectionPool
+from codeforces import RanklistRow
+from codeforces.api.codeforces_api import CodeforcesDataRetriever
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
+
+
+class ChangeDetectorTests(unittest.TestCase):
+    def setUp(self):
+        self.decoded = []
+
+    def decode(self, answer):
+        self.decoded.append(answer)
+        return {'answer': answer.decode()}
+
+    def test_unchanged_answer_is_not_decoded(self):
+        detector = ChangeDetector()
+
+        first = detector.update(('key',), None, b'1', self.decode)
+        second = detector.update(('key',), None, b'1', self.decode)
+
+        self.assertIs(first, second)
+        self.assertEqual([b'1'], self.decoded)
+        self.assertEqual(ChangeStatistics(0, 1, 1), detector.statistics)
+
+    def test_changed_answer_is_decoded(self):
+        detector = ChangeDetector()
+
+        detector.update(('key',), None, b'1', self.decode)
+
+        self.assertEqual({'answer': '2'}, detector.update(('key',), None, b'2', self.decode))
+        self.assertEqual(ChangeStatistics(0, 0, 2), detector.statistics)
+
+    def test_conditional_headers(self):
+        detector = ChangeDetector()
+
+        detector.update(('key',), {'ETag': '"abc"', 'Last-Modified': 'Sat, 01 Jan 2000 00:00:00 GMT'}, b'1',
+                        self.decode)
+
+        self.assertEqual({'If-None-Match': '"abc"', 'If-Modified-Since': 'Sat, 01 Jan 2000 00:00:00 GMT'},
+                         ChangeDetector.get_conditional_headers(detector.get(('key',))))
+        self.assertEqual({}, ChangeDetector.get_conditional_headers(None))
+
+    def test_failed_decoding_is_not_remembered(self):
+        detector = ChangeDetector()
+
+        def fail(answer):
+            raise ValueError('failed')
+
+        self.assertRaises(ValueError, detector.update, ('key',), None, b'1', fail)
+        self.assertIsNone(detector.get(('key',)))
+
+    def test_least_recently_used_is_forgotten(self):
+        detector = ChangeDetector(max_entries=2)
+
+        detector.update(('a',), None, b'1', self.decode)
+        detector.update(('b',), None, b'2', self.decode)
+        detector.get(('a',))
+        detector.update(('c',), None, b'3', self.decode)
+
+        self.assertIsNotNone(detector.get(('a',)))
+        self.assertIsNone(detector.get(('b',)))
+
+    def test_result_of_unchanged_data_is_reused(self):
+        detector = ChangeDetector()
+        transformed = []
+
+        def transform(data):
+            transformed.append(data)
+            return {'items': iter([data['answer']]), 'answer': data['answer']}
+
+        data = detector.update(('key',), None, b'1', self.decode)
+        first = detector.transform(('method',), data, transform)
+        second = detector.transform(('method',), detector.update(('key',), None, b'1', self.decode), transform)
+
+        self.assertEqual(['1'], list(first['items']))
+        self.assertEqual(['1'], list(second['items']))
+        self.assertEqual([data], transformed)
+
+        third = detector.transform(('method',), detector.update(('key',), None, b'2', self.decode), transform)
+
+        self.assertEqual(['2'], list(third['items']))
+        self.assertEqual(2, len(transformed))
+
+class ChangeDetectionTests(unittest.TestCase):
+    def setUp(self):
+        self.data = make_synthetic_data(contests=1, users=5, submissions_per_contest=10)
+
+    def test_unchanged_response_by_hash(self):
+        with LocalCodeforcesServer(self.data) as server:
+            retriever = CodeforcesDataRetriever(base_url=server.base_url, change_detector=ChangeDetector())
+
+            first = retriever.get_data('contest.standings', contestId=500)
+            second = retriever.get_data('contest.standings', contestId=500)
+
+            self.assertIs(first, second)
+            self.assertEqual(ChangeStatistics(0, 1, 1), retriever._change_detector.statistics)
+
+    def test_changed_response_by_hash(self):
+        with LocalCodeforcesServer(self.data) as server:
+            retriever = CodeforcesDataRetriever(base_url=server.base_url, change_detector=ChangeDetector())
+
+            first = retriever.get_data('contest.status', contestId=500)
+            server.add_submissions([dict(self.data['submissions'][0], id=10 ** 6)])
+            second = retriever.get_data('contest.status', contestId=500)
+
+            self.assertEqual(len(first) + 1, len(second))
+
+    def test_not_modified_response(self):
+        with LocalCodeforcesServer(self.data, etags=True) as server:
+            detector = ChangeDetector()
+            api = CodeforcesAPI(base_url=server.base_url, rate_limit=None, change_detector=detector)
+
+            first = list(api.contest_standings(500)['rows'])
+            second = list(api.contest_standings(500)['rows'])
+
+            self.assertEqual([r.party.members[0].handle for r in first],
+                             [r.party.members[0].handle for r in second])
+            self.assertEqual(1, server.not_modified_count)
+            self.assertEqual(ChangeStatistics(1, 0, 1), detector.statistics)
+            self.assertEqual(2, api.statistics.requests)
+
+    def test_standings_data(self):
+        with LocalCodeforcesServer(self.data, etags=True) as server:
+            api = CodeforcesAPI(base_url=server.base_url, rate_limit=None, change_detector=ChangeDetector())
+
+            first = api.contest_standings_data(500, count=5)
+            second = api.contest_standings_data(500, count=5)
+
+            self.assertIs(first, second)
+            self.assertEqual(5, len(first['rows']))
+            self.assertEqual(list(api.contest_standings(500, count=5)['rows']),
+                             list(map(api.get_loader(RanklistRow), first['rows'])))
+
+    def test_unchanged_objects_are_reused(self):
+        with LocalCodeforcesServer(self.data, etags=True) as server:
+            api = CodeforcesAPI(base_url=server.base_url, rate_limit=None, change_detector=ChangeDetector())
+
+            first = api.contest_standings(500)
+            second = api.contest_standings(500)
+            rows = list(first['rows'])
+
+            self.assertIs(first['contest'], second['contest'])
+            self.assertEqual(list(map(id, rows)), list(map(id, second['rows'])))
+
+            api.validate = False
+
+            self.assertIsNot(first['contest'], api.contest_standings(500)['contest'])
+            self.assertEqual(rows, list(api.contest_standings(500)['rows']))
+
+    def test_not_modified_response_with_connection_pool(self):
+        with LocalCodeforcesServer(self.data, etags=True) as server:
+            pool = HTTPConnectionPool()
+            retriever = CodeforcesDataRetriever(transport=pool, base_url=server.base_url,
+                                                change_detector=ChangeDetector())
+
+            try:
+                first = retriever.get_data('contest.list')
+                second = retriever.get_data('contest.list')
+                third = retriever.get_data('contest.list')
+            finally:
+                pool.clear()
+
+            self.assertIs(first, second)
+            self.assertIs(first, third)
+            self.assertEqual(2, server.not_modified_count)
+
+    def test_async_not_modified_response(self):
+        loop = asyncio.new_event_loop()
+
+        with LocalCodeforcesServer(self.data, etags=True) as server:
+            async def run():
+                async with AsyncCodeforcesAPI(base_url=server.base_url, rate_limit=None,
+                                              change_detector=ChangeDetector()) as api:
+                    first = [c.id for c in await api.contest_list()]
+                    second = [c.id for c in await api.contest_list()]
+                    return first, second
+
+            try:
+                first, second = loop.run_until_complete(run())
+            finally:
+                loop.close()
+
+            self.assertEqual(first, second)
+            self.assertEqual(1, server.not_modified_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
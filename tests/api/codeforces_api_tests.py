@@ -1,11 +1,21 @@
 """
 This module provides classes for testing User object
 """
+import io
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import unittest
 from unittest import mock
+from urllib.error import HTTPError
 
 from codeforces.api.codeforces_api import CodeforcesAPI
+from codeforces.api.connection_pool import HTTPConnectionPool
+from codeforces.api.retry_policy import RetryPolicy
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
 
 
 class CodeforcesAPITests(unittest.TestCase):
@@ -29,8 +39,424 @@ class CodeforcesAPITests(unittest.TestCase):
         rating_changes = api.contest_rating_changes(42)
 
         self.assertEqual(9, len(list(rating_changes)))
+
+        request = urlopen.call_args[0][0]
+        self.assertEqual('http://codeforces.com/api/contest.ratingChanges?contestId=42', request.full_url)
+        self.assertEqual('gzip, deflate', request.get_header('Accept-encoding'))
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_uncompressed_transfer(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'contest.ratingChanges.json')
+        api = CodeforcesAPI(compressed_transfer=False, rate_limit=None)
+
+        self.assertEqual(9, len(list(api.contest_rating_changes(42))))
         urlopen.assert_called_with('http://codeforces.com/api/contest.ratingChanges?contestId=42')
 
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_requests_are_rate_limited(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'contest.ratingChanges.json')
+        api = CodeforcesAPI(key='rate_limit_test', secret='secret', rate_limit=20)
+
+        start = time.monotonic()
+
+        for _ in range(3):
+            api.contest_rating_changes(42)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_clients_with_same_key_share_strictest_rate_limit(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'contest.ratingChanges.json')
+        slow_api = CodeforcesAPI(key='shared_rate_limit_test', secret='secret', rate_limit=5)
+        fast_api = CodeforcesAPI(key='shared_rate_limit_test', secret='secret', rate_limit=100, burst=5)
+
+        slow_api.contest_rating_changes(42)
+        start = time.monotonic()
+
+        with self.assertWarns(RuntimeWarning):
+            fast_api.contest_rating_changes(42)
+
+        fast_api.contest_rating_changes(42)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.35)
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_failed_requests_are_retried_with_fresh_signature(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, 'contest.ratingChanges.json')
+        response = urlopen.return_value
+
+        urlopen.side_effect = [HTTPError('url', 503, '', {}, io.BytesIO(b'<html></html>')),
+                               HTTPError('url', 400, '', {}, io.BytesIO(b'{"status": "FAILED", '
+                                                                        b'"comment": "Call limit exceeded"}')),
+                               response]
+
+        api = CodeforcesAPI(key='key', secret='secret', rate_limit=None,
+                            retry_policy=RetryPolicy(max_attempts=3, backoff_base=0))
+
+        self.assertEqual(9, len(list(api.contest_rating_changes(42))))
+        self.assertEqual({'contest.ratingChanges': 2}, api.retry_counts)
+
+        signatures = [call[0][0].full_url.rsplit('apiSig=', 1)[1] for call in urlopen.call_args_list]
+        self.assertEqual(3, len(set(signatures)))
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_retries_are_limited_by_max_attempts(self, urlopen):
+        urlopen.side_effect = HTTPError('url', 503, '', {}, io.BytesIO(b'<html></html>'))
+
+        api = CodeforcesAPI(rate_limit=None, retry_policy=RetryPolicy(max_attempts=2, backoff_base=0))
+
+        with self.assertRaises(ValueError):
+            api.contest_rating_changes(42)
+
+        self.assertEqual(2, urlopen.call_count)
+        self.assertEqual({'contest.ratingChanges': 1}, api.retry_counts)
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_not_retryable_errors_are_raised_immediately(self, urlopen):
+        urlopen.side_effect = HTTPError('url', 400, '', {}, io.BytesIO(b'{"status": "FAILED", '
+                                                                       b'"comment": "contestId: not found"}'))
+
+        api = CodeforcesAPI(rate_limit=None, retry_policy=RetryPolicy(backoff_base=0))
+
+        with self.assertRaises(ValueError) as cm:
+            api.contest_rating_changes(42)
+
+        self.assertEqual('contestId: not found', cm.exception.args[0])
+        self.assertEqual(1, urlopen.call_count)
+        self.assertEqual({}, api.retry_counts)
+
+
+class PaginationTests(unittest.TestCase):
+    def setUp(self):
+        self.data = make_synthetic_data(contests=2, users=5, submissions_per_contest=50)
+        self.server = LocalCodeforcesServer(self.data).start()
+        self.api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def get_expected_ids(self, contest_id):
+        return sorted((s['id'] for s in self.data['submissions'] if s['contestId'] == contest_id), reverse=True)
+
+    def test_contest_status_pages(self):
+        for prefetch in (True, False):
+            requests = self.server.request_count
+            submissions = list(self.api.iter_contest_status(500, page_size=20, prefetch=prefetch))
+
+            self.assertEqual(self.get_expected_ids(500), [s.id for s in submissions])
+            self.assertEqual(3, self.server.request_count - requests)
+
+    def test_user_status_pages(self):
+        submissions = list(self.api.iter_user_status('user1', page_size=7))
+        expected = [s.id for s in self.api.user_status('user1')]
+
+        self.assertEqual(expected, [s.id for s in submissions])
+
+    def test_shifted_pages_are_deduplicated(self):
+        expected = self.get_expected_ids(500)
+        submissions = self.api.iter_contest_status(500, page_size=20, prefetch=False)
+        ids = [next(submissions).id]
+
+        new_submissions = [dict(self.data['submissions'][0], contestId=500, id=10 ** 6 + i) for i in range(5)]
+        self.server.add_submissions(new_submissions)
+
+        ids.extend(s.id for s in submissions)
+
+        self.assertEqual(expected, ids)
+
+    def test_closed_generator_stops_prefetch(self):
+        submissions = self.api.iter_contest_status(500, page_size=10)
+        next(submissions)
+        submissions.close()
+
+        self.assertLessEqual(self.server.request_count, 2)
+
+    def test_contest_status_since(self):
+        expected = self.get_expected_ids(500)
+        requests = self.server.request_count
+        submissions = self.api.contest_status_since(500, expected[5], page_size=3)
+
+        self.assertEqual(expected[:5], [s.id for s in submissions])
+        self.assertEqual(2, self.server.request_count - requests)
+
+    def test_user_status_since(self):
+        expected = [s.id for s in self.api.user_status('user2')]
+
+        self.assertEqual(expected, [s.id for s in self.api.user_status_since('user2', None)])
+        self.assertEqual([], self.api.user_status_since('user2', expected[0]))
+
+
+class UserInfoTests(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalCodeforcesServer(make_synthetic_data(contests=1, users=300, submissions_per_contest=1),
+                                            keys={'key': 'secret'})
+        self.server.start()
+        self.api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_handles_are_chunked_and_ordered(self):
+        handles = ['user{}'.format(i) for i in range(299, -1, -1)]
+        users = list(self.api.user_info(handles + ['USER5', 'user7'], max_url_length=500))
+
+        self.assertEqual(handles, [u.handle for u in users])
+        self.assertGreater(self.server.request_count, 3)
+
+    def test_signed_urls_are_not_too_long(self):
+        api = CodeforcesAPI(key='key', secret='secret', base_url=self.server.base_url, rate_limit=None)
+        generate_url = api._data_retriever._generate_url
+        urls = []
+
+        def record_url(*args, **kwargs):
+            url = generate_url(*args, **kwargs)
+            urls.append(url)
+            return url
+
+        handles = ['user{}'.format(i) for i in range(300)]
+
+        with mock.patch.object(api._data_retriever, '_generate_url', side_effect=record_url):
+            users = list(api.user_info(handles, max_url_length=500))
+
+        self.assertEqual(handles, [u.handle for u in users])
+        self.assertGreater(len(urls), 3)
+        self.assertTrue(all(len(url) <= 500 for url in urls))
+
+    def test_renamed_handles_are_merged_by_position(self):
+        get_data = self.api._data_retriever.get_data
+
+        def rename(method, handles):
+            return [dict(user, handle=user['handle'] + '_renamed') for user in get_data(method, handles=handles)]
+
+        handles = ['user{}'.format(i) for i in range(100)]
+
+        with mock.patch.object(self.api._data_retriever, 'get_data', side_effect=rename):
+            users = list(self.api.user_info(handles, max_url_length=400))
+
+        self.assertEqual([handle + '_renamed' for handle in handles], [u.handle for u in users])
+
+    def test_small_list_is_requested_once(self):
+        users = list(self.api.user_info(['user2', 'user1', 'user2']))
+
+        self.assertEqual(['user2', 'user1'], [u.handle for u in users])
+        self.assertEqual(1, self.server.request_count)
+
+    def test_chunk_error_is_raised(self):
+        handles = ['user{}'.format(i) for i in range(100)] + ['missing']
+
+        with self.assertRaisesRegex(ValueError, 'User with handle missing not found'):
+            self.api.user_info(handles, max_url_length=400)
+
+
+class BulkUserRatingTests(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalCodeforcesServer(make_synthetic_data(contests=2, users=20, submissions_per_contest=1))
+        self.server.start()
+        self.api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_ratings_are_retrieved(self):
+        handles = ['user{}'.format(i) for i in range(20)]
+        progress = []
+
+        ratings = dict(self.api.bulk_user_rating(handles + handles[:5] + ['USER7'], progress=progress.append))
+
+        self.assertEqual(set(handles), set(ratings))
+        self.assertTrue(all(len(r) == 2 and r[0].handle == h for h, r in ratings.items()))
+        self.assertEqual(20, self.server.request_count)
+        self.assertEqual(list(range(1, 21)), [p.completed for p in progress])
+        self.assertEqual(20, progress[-1].total)
+
+    def test_cached_handles_are_skipped(self):
+        cache = {'user1': []}
+
+        ratings = dict(self.api.bulk_user_rating(['user1', 'user2', 'user3'], cache=cache))
+
+        self.assertEqual([], ratings['user1'])
+        self.assertEqual({'user1', 'user2', 'user3'}, set(cache))
+        self.assertEqual(2, self.server.request_count)
+
+    def test_errors_are_raised(self):
+        with self.assertRaisesRegex(ValueError, 'User with handle missing not found'):
+            list(self.api.bulk_user_rating(['user1', 'missing']))
+
+    def test_errors_are_reported_per_handle(self):
+        errors = []
+        progress = []
+
+        ratings = dict(self.api.bulk_user_rating(['user1', 'missing', 'user2'], max_workers=1,
+                                                 progress=progress.append,
+                                                 errors=lambda handle, error: errors.append((handle, str(error)))))
+
+        self.assertEqual({'user1', 'user2'}, set(ratings))
+        self.assertEqual([('missing', 'handle: User with handle missing not found')], errors)
+        self.assertEqual(3, progress[-1].completed)
+
+
+class ThreadSafetyTests(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalCodeforcesServer(make_synthetic_data(contests=2, users=50, submissions_per_contest=1),
+                                            keys={'key1': 'secret1', 'key2': 'secret2'})
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_concurrent_signed_requests(self):
+        pool = HTTPConnectionPool(pool_size=8)
+        api = CodeforcesAPI(key='key1', secret='secret1', base_url=self.server.base_url, transport=pool,
+                            rate_limit=None, retry_policy=None, coalesce_requests=False)
+        handles = ['user{}'.format(i % 50) for i in range(2000)]
+        stop = threading.Event()
+
+        def switch_credentials():
+            while not stop.is_set():
+                for i in (1, 2):
+                    api.set_credentials('key{}'.format(i), 'secret{}'.format(i))
+
+        def get_rating(handle):
+            return handle, list(api.user_rating(handle))
+
+        switcher = threading.Thread(target=switch_credentials)
+        switcher.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                results = list(executor.map(get_rating, handles))
+        finally:
+            stop.set()
+            switcher.join()
+            pool.clear()
+
+        for handle, rating_changes in results:
+            self.assertEqual([handle, handle], [r.handle for r in rating_changes])
+
+        self.assertEqual(2000, self.server.request_count)
+        self.assertEqual((2000, 0, 0), api.statistics[:3])
+        self.assertEqual(0, api.thread_statistics.requests)
+
+    def test_statistics_of_finished_threads(self):
+        api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+
+        for i in range(10):
+            thread = threading.Thread(target=lambda: list(api.user_rating('user{}'.format(i))))
+            thread.start()
+            thread.join()
+
+        self.assertEqual((10, 0, 0), api.statistics[:3])
+        self.assertEqual(0, len(api._data_retriever._all_statistics))
+
+        list(api.user_rating('user1'))
+
+        self.assertEqual((11, 0, 0), api.statistics[:3])
+        self.assertEqual(1, len(api._data_retriever._all_statistics))
+
+
+class StreamingTests(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalCodeforcesServer(make_synthetic_data(contests=1, users=30, submissions_per_contest=200))
+        self.server.start()
+        self.api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_stream_contest_status(self):
+        expected = [s.id for s in self.api.contest_status(500, from_=2, count=150)]
+
+        self.assertEqual(expected, [s.id for s in self.api.stream_contest_status(500, from_=2, count=150)])
+
+    def test_stream_user_status(self):
+        expected = [s.id for s in self.api.user_status('user3')]
+
+        self.assertEqual(expected, [s.id for s in self.api.stream_user_status('user3')])
+
+    def test_stream_contest_standings(self):
+        rows = list(self.api.stream_contest_standings(500, count=10))
+
+        self.assertEqual(list(range(1, 11)), [row.rank for row in rows])
+
+    def test_stream_user_rated_list(self):
+        self.assertEqual(30, len(list(self.api.stream_user_rated_list())))
+
+    def test_lazy_objects(self):
+        api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None, lazy_objects=True)
+        submissions = list(api.contest_status(500, count=50))
+
+        self.assertEqual(list(self.api.contest_status(500, count=50)), submissions)
+        self.assertEqual([s.verdict for s in self.api.contest_status(500, count=50)],
+                         [s.verdict for s in submissions])
+
+    def test_failed_request(self):
+        with self.assertRaisesRegex(ValueError, 'User with handle missing not found'):
+            list(self.api.stream_user_status('missing'))
+
+    def test_statistics(self):
+        list(self.api.stream_contest_status(500))
+
+        statistics = self.api.statistics
+        self.assertEqual(1, statistics.requests)
+        self.assertGreater(statistics.bytes_received + statistics.bytes_saved, 200 * 100)
+
+
+@mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+class ValidationTests(unittest.TestCase):
+    def patch_rating_changes(self, urlopen, drifted):
+        """
+        Makes the server return rating changes, which have contestName of wrong type at given indices
+        """
+        with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures',
+                               'contest.ratingChanges.json'), 'r') as fixture:
+            answer = json.load(fixture)
+
+        for i in drifted:
+            answer['result'][i]['contestName'] = 42
+
+        urlopen.return_value.__enter__.return_value.read.return_value = json.dumps(answer).encode('utf-8')
+
+    def test_validated(self, urlopen):
+        self.patch_rating_changes(urlopen, [3])
+
+        with self.assertRaisesRegex(AssertionError, 'contestName'):
+            list(CodeforcesAPI(rate_limit=None).contest_rating_changes(1))
+
+    def test_not_validated(self, urlopen):
+        self.patch_rating_changes(urlopen, [0, 3])
+
+        rating_changes = list(CodeforcesAPI(rate_limit=None, validate=False).contest_rating_changes(1))
+
+        self.assertEqual(9, len(rating_changes))
+        self.assertEqual(42, rating_changes[3].contest_name)
+        self.assertEqual(1600, rating_changes[0].new_rating)
+
+    def test_sampled(self, urlopen):
+        api = CodeforcesAPI(rate_limit=None, validate=0.25)
+
+        self.patch_rating_changes(urlopen, [1, 2, 3, 5, 6, 7])
+        self.assertEqual(9, len(list(api.contest_rating_changes(1))))
+
+        # The first object of every response is checked
+        self.patch_rating_changes(urlopen, [0])
+        with self.assertRaisesRegex(AssertionError, 'contestName'):
+            list(api.contest_rating_changes(2))
+
+        self.patch_rating_changes(urlopen, [4])
+        with self.assertRaisesRegex(AssertionError, 'contestName'):
+            list(api.contest_rating_changes(3))
+
+    def test_validate_option(self, urlopen):
+        api = CodeforcesAPI()
+
+        self.assertIs(True, api.validate)
+
+        api.validate = 0.5
+        self.assertEqual(0.5, api.validate)
+
+        with self.assertRaises(AssertionError):
+            api.validate = 2.0
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,78 @@
+"""
+This module provides classes for testing HTTPConnectionPool
+"""
+
+import json
+import unittest
+from urllib.error import HTTPError
+
+from codeforces import HTTPConnectionPool
+from tests.api.stub_server import StubServer
+
+
+def respond(path):
+    if path.startswith('/missing'):
+        return 400, {'status': 'FAILED', 'comment': 'missing'}
+    else:
+        return 200, {'status': 'OK', 'result': path}
+
+
+class HTTPConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(respond).start()
+        self.base = self.server.base
+        self.pool = HTTPConnectionPool(pool_size=2)
+
+    def tearDown(self):
+        self.pool.clear()
+        self.server.stop()
+
+    def read(self, url):
+        with self.pool.urlopen(url) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def test_reuses_connection(self):
+        for i in range(10):
+            self.assertEqual('/api/user.rating?handle={}'.format(i),
+                             self.read(self.base + 'api/user.rating?handle={}'.format(i))['result'])
+
+        self.assertEqual(1, len(self.server.client_ports))
+
+    def test_error_status_raises_http_error(self):
+        with self.assertRaises(HTTPError) as cm:
+            self.pool.urlopen(self.base + 'missing')
+
+        self.assertEqual(400, cm.exception.code)
+        self.assertEqual('missing', json.loads(cm.exception.read().decode('utf-8'))['comment'])
+        cm.exception.close()
+
+        self.read(self.base + 'api/contest.list')
+        self.assertEqual(1, len(self.server.client_ports))
+
+    def test_unread_response_is_not_reused(self):
+        self.pool.urlopen(self.base + 'api/contest.list').close()
+        self.read(self.base + 'api/contest.list')
+
+        self.assertEqual(2, len(self.server.client_ports))
+
+    def test_reconnects_after_server_closed_connection(self):
+        self.read(self.base + 'api/contest.list')
+
+        for connections in self.pool._idle.values():
+            for connection in connections:
+                connection.sock.close()
+
+        self.assertEqual('/api/contest.list', self.read(self.base + 'api/contest.list')['result'])
+
+    def test_keeps_at_most_pool_size_idle_connections(self):
+        responses = [self.pool.urlopen(self.base + 'api/contest.list') for _ in range(4)]
+
+        for response in responses:
+            response.read()
+            response.close()
+
+        self.assertEqual(2, sum(map(len, self.pool._idle.values())))
+
+
+if __name__ == '__main__':
+    unittest.main()
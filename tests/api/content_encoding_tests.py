@@ -0,0 +1,133 @@
+"""
+This module provides classes for testing decompression of responses
+"""
+
+import asyncio
+import gzip
+import io
+import unittest
+import zlib
+
+from codeforces import AsyncCodeforcesAPI
+from codeforces import CodeforcesAPI
+from codeforces import DecompressingReader
+from codeforces import HTTPConnectionPool
+from codeforces import decompress
+from codeforces import get_content_encoding
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
+
+
+class DecompressingReaderTests(unittest.TestCase):
+    data = b'{"status": "OK", "result": [' + b', '.join(b'{"id": %d}' % i for i in range(5000)) + b']}'
+
+    def get_encoded_data(self):
+        raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+
+        return {
+            'gzip': gzip.compress(self.data),
+            'deflate': zlib.compress(self.data),
+            'raw deflate': raw_deflate.compress(self.data) + raw_deflate.flush()
+        }
+
+    def test_whole_stream_is_decompressed(self):
+        for name, encoded in self.get_encoded_data().items():
+            reader = DecompressingReader(io.BytesIO(encoded), name.split()[-1], chunk_size=100)
+
+            self.assertEqual(self.data, reader.read(), name)
+            self.assertEqual(len(encoded), reader.compressed_size)
+            self.assertEqual(len(self.data), reader.size)
+
+    def test_stream_is_decompressed_by_parts(self):
+        for name, encoded in self.get_encoded_data().items():
+            reader = DecompressingReader(io.BytesIO(encoded), name.split()[-1], chunk_size=50)
+            parts = []
+
+            while True:
+                part = reader.read(7)
+
+                if not part:
+                    break
+
+                self.assertLessEqual(len(part), 7)
+                parts.append(part)
+
+            self.assertEqual(self.data, b''.join(parts), name)
+
+    def test_not_encoded_stream_is_passed_through(self):
+        reader = DecompressingReader(io.BytesIO(self.data), None)
+
+        self.assertEqual(self.data[:10], reader.read(10))
+        self.assertEqual(self.data[10:], reader.read())
+        self.assertEqual(len(self.data), reader.compressed_size)
+
+    def test_decompress(self):
+        for name, encoded in self.get_encoded_data().items():
+            self.assertEqual(self.data, decompress(encoded, name.split()[-1]), name)
+
+        self.assertEqual(self.data, decompress(self.data, 'identity'))
+
+    def test_get_content_encoding(self):
+        self.assertEqual('gzip', get_content_encoding({'Content-Encoding': ' GZIP '}))
+        self.assertEqual('deflate', get_content_encoding({'content-encoding': 'deflate'}))
+        self.assertIsNone(get_content_encoding({}))
+        self.assertIsNone(get_content_encoding(None))
+
+
+class CompressedTransferTests(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalCodeforcesServer(make_synthetic_data(contests=1, users=50, submissions_per_contest=300))
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_bytes_saved_are_counted(self):
+        compressed_api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+        plain_api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None, compressed_transfer=False)
+
+        compressed = [s.id for s in compressed_api.contest_status(500)]
+        plain = [s.id for s in plain_api.contest_status(500)]
+
+        self.assertEqual(plain, compressed)
+        self.assertEqual(0, plain_api.statistics.bytes_saved)
+        self.assertGreater(compressed_api.statistics.bytes_saved, compressed_api.statistics.bytes_received)
+        self.assertEqual(plain_api.statistics.bytes_received,
+                         compressed_api.statistics.bytes_received + compressed_api.statistics.bytes_saved)
+
+    def test_streaming_with_pool(self):
+        pool = HTTPConnectionPool(pool_size=2)
+        api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None, transport=pool)
+
+        try:
+            for _ in range(2):
+                self.assertEqual(300, len(list(api.stream_contest_status(500))))
+        finally:
+            pool.clear()
+
+        self.assertGreater(api.statistics.bytes_saved, 0)
+
+    def test_failed_request_is_decompressed(self):
+        api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+
+        with self.assertRaisesRegex(ValueError, 'User with handle missing not found'):
+            api.user_rating('missing')
+
+    def test_async_api(self):
+        loop = asyncio.new_event_loop()
+
+        async def run():
+            async with AsyncCodeforcesAPI(base_url=self.server.base_url, rate_limit=None) as api:
+                return list(await api.contest_status(500)), api.statistics
+
+        try:
+            submissions, statistics = loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+        self.assertEqual(300, len(submissions))
+        self.assertGreater(statistics.bytes_saved, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+This module provides classes for testing DiskCache
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from codeforces import CodeforcesAPI
+from codeforces import DiskCache
+
+
+class DiskCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_stored_response_is_reused_by_other_instance(self):
+        DiskCache(self.directory).put(('contest.list', 'gym=False'), b'{"status": "OK", "result": []}')
+
+        self.assertEqual(b'{"status": "OK", "result": []}',
+                         DiskCache(self.directory).get(('contest.list', 'gym=False')))
+        self.assertIsNone(DiskCache(self.directory).get(('contest.list', 'gym=True')))
+
+    def test_responses_are_compressed(self):
+        cache = DiskCache(self.directory)
+        cache.put(('user.ratedList',), b'{"handle": "tourist"}' * 1000)
+
+        size = sum(os.path.getsize(os.path.join(self.directory, name)) for name in os.listdir(self.directory))
+
+        self.assertLess(size, 1000)
+
+    def test_expired_responses_are_not_returned(self):
+        cache = DiskCache(self.directory, ttl=60)
+        cache.put(('contest.list',), b'[]')
+
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.assertIsNone(cache.get(('contest.list',)))
+            self.assertEqual(b'[]', cache.get(('contest.list',), ignore_ttl=True))
+
+        self.assertEqual(b'[]', DiskCache(self.directory, ttl=None).get(('contest.list',)))
+
+    def test_expired_response_does_not_hide_fresh_one_with_other_compression(self):
+        zstandard = mock.Mock()
+        zstandard.ZstdCompressor.return_value.compress.side_effect = lambda data: data
+        zstandard.ZstdDecompressor.return_value.decompress.side_effect = lambda data: data
+        now = time.time()
+
+        with mock.patch('codeforces.api.disk_cache.zstandard', zstandard):
+            DiskCache(self.directory).put(('contest.list',), b'"old"')
+            os.utime(os.path.join(self.directory, DiskCache._digest(('contest.list',)) + '.json.gz'),
+                     (now - 120, now - 120))
+
+            cache = DiskCache(self.directory, ttl=60, compression='zstd')
+            cache.put(('contest.list',), b'"new"')
+
+            self.assertEqual(b'"new"', cache.get(('contest.list',)))
+
+    def test_ttls_are_set_per_method(self):
+        cache = DiskCache(self.directory, ttl=60, ttls={'contest.ratingChanges': None, 'user.info': 10})
+        cache.put(('contest.ratingChanges', 'contestId=1'), b'[]')
+        cache.put(('contest.list',), b'[]')
+        cache.put(('user.info', 'handles=tourist'), b'[]')
+
+        with mock.patch('time.time', return_value=time.time() + 30):
+            self.assertEqual(b'[]', cache.get(('contest.ratingChanges', 'contestId=1'), method='contest.ratingChanges'))
+            self.assertEqual(b'[]', cache.get(('contest.list',), method='contest.list'))
+            self.assertIsNone(cache.get(('user.info', 'handles=tourist'), method='user.info'))
+
+    def test_live_methods_are_excluded_by_default(self):
+        self.assertFalse(DiskCache(self.directory).is_cached('contest.standings'))
+        self.assertFalse(DiskCache(self.directory).is_cached('problemset.recentStatus'))
+        self.assertTrue(DiskCache(self.directory).is_cached('contest.list'))
+        self.assertTrue(DiskCache(self.directory, excluded_methods=set()).is_cached('contest.standings'))
+        self.assertFalse(DiskCache(self.directory, excluded_methods={'contest.list'}).is_cached('contest.list'))
+
+    def test_oldest_responses_are_evicted(self):
+        cache = DiskCache(self.directory, max_size=100)
+        now = time.time()
+
+        for i in range(10):
+            cache.put((i,), os.urandom(30))
+            os.utime(os.path.join(self.directory, cache._digest((i,)) + '.json.gz'), (now - 10 + i, now - 10 + i))
+
+        self.assertIsNone(cache.get((0,)))
+        self.assertIsNotNone(cache.get((9,)))
+        self.assertLessEqual(sum(os.path.getsize(os.path.join(self.directory, name))
+                                 for name in os.listdir(self.directory)), 100)
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            DiskCache(self.directory, compression='lzma')
+
+
+class CodeforcesAPIDiskCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load_fixture(self, fixture_name):
+        path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures', fixture_name)
+
+        with open(path, 'r') as fixture:
+            return fixture.read().encode('utf-8')
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_offline_mode_serves_stored_responses(self, urlopen):
+        urlopen.return_value.__enter__.return_value.read.return_value = \
+            self.load_fixture('contest.ratingChanges.json')
+
+        api = CodeforcesAPI(rate_limit=None, disk_cache=DiskCache(self.directory))
+        online = list(api.contest_rating_changes(42))
+
+        offline_api = CodeforcesAPI(rate_limit=None, disk_cache=DiskCache(self.directory), offline=True)
+
+        self.assertEqual(online, list(offline_api.contest_rating_changes(42)))
+        self.assertEqual(1, urlopen.call_count)
+
+        with self.assertRaises(ValueError):
+            offline_api.contest_rating_changes(43)
+
+        self.assertEqual(1, urlopen.call_count)
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_offline_mode_serves_expired_responses(self, urlopen):
+        urlopen.return_value.__enter__.return_value.read.return_value = \
+            self.load_fixture('contest.ratingChanges.json')
+
+        api = CodeforcesAPI(rate_limit=None, disk_cache=DiskCache(self.directory, ttl=60))
+        online = list(api.contest_rating_changes(42))
+
+        offline_api = CodeforcesAPI(rate_limit=None, disk_cache=DiskCache(self.directory, ttl=60), offline=True)
+
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.assertEqual(online, list(offline_api.contest_rating_changes(42)))
+
+        self.assertEqual(1, urlopen.call_count)
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_excluded_methods_are_not_stored(self, urlopen):
+        urlopen.return_value.__enter__.return_value.read.return_value = \
+            self.load_fixture('contest.ratingChanges.json')
+
+        api = CodeforcesAPI(rate_limit=None, disk_cache=DiskCache(self.directory,
+                                                                  excluded_methods={'contest.ratingChanges'}))
+        list(api.contest_rating_changes(42))
+        list(api.contest_rating_changes(42))
+
+        self.assertEqual(2, urlopen.call_count)
+        self.assertEqual([], os.listdir(self.directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
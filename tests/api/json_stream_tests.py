@@ -0,0 +1,68 @@
+"""
+This module provides classes for testing iter_json_array
+"""
+
+import io
+import json
+import unittest
+
+from codeforces import iter_json_array
+
+
+class RecordingStream(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.read_size = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.read_size += len(data)
+        return data
+
+
+class IterJsonArrayTests(unittest.TestCase):
+    def test_elements_are_parsed_with_any_chunk_size(self):
+        result = [{'id': 1, 'name': 'Ы'}, 12345, -1.5e10, 'text', None, True, [1, [2]], {}]
+        data = json.dumps({'status': 'OK', 'result': result}, ensure_ascii=False).encode('utf-8')
+
+        for chunk_size in range(1, 20):
+            self.assertEqual(result, list(iter_json_array(io.BytesIO(data), chunk_size=chunk_size)))
+
+    def test_nested_array(self):
+        data = b'{"status": "OK", "result": {"contest": {"id": 1}, "problems": [], "rows": [{"rank": 1}, {"rank": 2}]}}'
+
+        self.assertEqual([{'rank': 1}, {'rank': 2}], list(iter_json_array(io.BytesIO(data), ('result', 'rows'), 4)))
+
+    def test_empty_array(self):
+        self.assertEqual([], list(iter_json_array(io.BytesIO(b'{"status":"OK","result":[]}'))))
+
+    def test_failed_status(self):
+        data = b'{"status": "FAILED", "comment": "handle: User with handle x not found"}'
+
+        with self.assertRaises(ValueError) as cm:
+            list(iter_json_array(io.BytesIO(data)))
+
+        self.assertEqual('handle: User with handle x not found', cm.exception.args[0])
+
+    def test_missed_status(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.BytesIO(b'{"result": []}')))
+
+    def test_truncated_response(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.BytesIO(b'{"status": "OK", "result": [{"id": 1}, {"id"')))
+
+    def test_stream_is_read_incrementally(self):
+        result = [{'id': i, 'verdict': 'OK'} for i in range(10000)]
+        stream = RecordingStream(json.dumps({'status': 'OK', 'result': result}).encode('utf-8'))
+
+        elements = iter_json_array(stream, chunk_size=1024)
+        first = next(elements)
+
+        self.assertEqual({'id': 0, 'verdict': 'OK'}, first)
+        self.assertLessEqual(stream.read_size, 2048)
+        self.assertEqual(result[1:], list(elements))
+
+
+if __name__ == '__main__':
+    unittest.main()
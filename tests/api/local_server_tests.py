@@ -0,0 +1,128 @@
+"""
+This module provides classes for testing LocalCodeforcesServer
+"""
+
+import json
+import time
+import unittest
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from codeforces import CodeforcesAPI
+from codeforces import RetryPolicy
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
+
+
+class LocalCodeforcesServerTests(unittest.TestCase):
+    def setUp(self):
+        self.data = make_synthetic_data(contests=2, users=20, submissions_per_contest=50)
+        self.server = LocalCodeforcesServer(self.data, keys={'key': 'secret'}).start()
+        self.api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_contest_status_from_count(self):
+        submissions = list(self.api.contest_status(500, from_=3, count=5))
+        expected = sorted((s['id'] for s in self.data['submissions'] if s['contestId'] == 500), reverse=True)
+
+        self.assertEqual(expected[2:7], [s.id for s in submissions])
+
+    def test_user_info_keeps_order(self):
+        with urlopen(self.server.base_url + 'user.info?handles=user5;USER1') as response:
+            users = json.loads(response.read().decode('utf-8'))['result']
+
+        self.assertEqual(['user5', 'user1'], [u['handle'] for u in users])
+
+    def test_user_info_unknown_handle(self):
+        with self.assertRaisesRegex(ValueError, 'User with handle missing not found'):
+            list(self.api.user_info(['user1', 'missing']))
+
+    def test_standings(self):
+        standings = self.api.contest_standings(501, from_=1, count=3)
+
+        self.assertEqual(501, standings['contest'].id)
+        self.assertEqual(5, len(list(standings['problems'])))
+        self.assertEqual([1, 2, 3], [row.rank for row in standings['rows']])
+
+    def test_signed_request(self):
+        api = CodeforcesAPI(key='key', secret='secret', base_url=self.server.base_url, rate_limit=None)
+
+        self.assertEqual(2, len(list(api.user_rating('user3'))))
+
+    def test_wrong_secret(self):
+        api = CodeforcesAPI(key='key', secret='wrong', base_url=self.server.base_url, rate_limit=None,
+                            retry_policy=RetryPolicy(max_attempts=1))
+
+        with self.assertRaisesRegex(ValueError, 'Incorrect signature'):
+            list(api.user_rating('user3'))
+
+    def test_wrong_time(self):
+        with self.assertRaises(HTTPError) as context:
+            urlopen(self.server.base_url + 'user.rating?handle=user3&apiKey=key&time=abc&apiSig=123456')
+
+        self.assertEqual(400, context.exception.code)
+        self.assertEqual({'status': 'FAILED', 'comment': 'time: Field should contain long integer value'},
+                         json.loads(context.exception.read().decode('utf-8')))
+        context.exception.close()
+
+    def test_synthetic_data_is_deterministic(self):
+        data = make_synthetic_data(contests=1, users=5, submissions_per_contest=10)
+        rooms = {row['party']['members'][0]['handle']: row['party']['room'] for row in data['ranklistRows']}
+
+        self.assertEqual(data, make_synthetic_data(contests=1, users=5, submissions_per_contest=10))
+        # Rooms do not depend on the hash seed of the process
+        self.assertEqual([44, 90, 16], [rooms['user0'], rooms['user1'], rooms['user2']])
+
+    def test_unknown_method(self):
+        with self.assertRaises(HTTPError) as context:
+            urlopen(self.server.base_url + 'blog.entry')
+
+        self.assertEqual(404, context.exception.code)
+        context.exception.close()
+
+
+class LocalCodeforcesServerFaultTests(unittest.TestCase):
+    def setUp(self):
+        self.data = make_synthetic_data(contests=1, users=5, submissions_per_contest=10)
+
+    def test_rate_limit_is_recovered_by_retry(self):
+        with LocalCodeforcesServer(self.data, rate_limit=1) as server:
+            api = CodeforcesAPI(base_url=server.base_url, rate_limit=None,
+                                retry_policy=RetryPolicy(backoff_base=1.1, jitter=0))
+
+            for _ in range(2):
+                self.assertEqual(1, len(list(api.contest_list())))
+
+            self.assertEqual(1, server.rejected_count)
+            self.assertEqual({'contest.list': 1}, api.retry_counts)
+
+    def test_error_rate(self):
+        with LocalCodeforcesServer(self.data, error_rate=1) as server:
+            api = CodeforcesAPI(base_url=server.base_url, rate_limit=None, retry_policy=RetryPolicy(max_attempts=1))
+
+            with self.assertRaisesRegex(ValueError, 'Call limit exceeded'):
+                api.contest_list()
+
+    def test_latency(self):
+        with LocalCodeforcesServer(self.data, latency=0.2) as server:
+            api = CodeforcesAPI(base_url=server.base_url, rate_limit=None)
+
+            start = time.monotonic()
+            api.contest_list()
+
+            self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_add_submissions(self):
+        with LocalCodeforcesServer(self.data) as server:
+            api = CodeforcesAPI(base_url=server.base_url, rate_limit=None)
+            submission = dict(self.data['submissions'][0], id=10 ** 6)
+
+            server.add_submissions([submission])
+
+            self.assertEqual(10 ** 6, next(iter(api.problemset_recent_status(1))).id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -40,6 +40,22 @@ class PartyTests(unittest.TestCase):
         self.assertEqual(24, self.party.room)
         self.assertEqual(1387380600, self.party.start_time)
 
+    def test_from_dict_not_validated(self):
+        d = {
+            "contestId": 374,
+            "members": [{"handle": "ocozalp"}, {"handle": 42}],
+            "participantType": "CONTESTANT",
+            "ghost": False
+        }
+
+        self.assertRaises(AssertionError, Party.from_dict, d, True)
+
+        party = Party.from_dict(d, False)
+
+        self.assertEqual(["ocozalp", 42], [member.handle for member in party.members])
+        self.assertEqual(ParticipantType.contestant, party.participant_type)
+        self.assertIsNone(party.team_id)
+
     def test_load_only_required_from_dict(self):
         """
         Required fields are:
@@ -95,6 +95,15 @@ class ProblemResultTests(unittest.TestCase):
         self.assertIsNone(self.result.penalty)
         self.assertIsNone(self.result.best_submission_time)
 
+    def test_equality_by_fields(self):
+        d = {"points": 312.0, "rejectedAttemptCount": 1, "type": "FINAL", "bestSubmissionTimeSeconds": 4174}
+
+        self.result.load_from_dict(d)
+
+        self.assertEqual(ProblemResult(d), self.result)
+        self.assertEqual(hash(ProblemResult(d)), hash(self.result))
+        self.assertNotEqual(ProblemResult(dict(d, rejectedAttemptCount=2)), self.result)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -89,6 +89,33 @@ class ProblemTests(unittest.TestCase):
 
         self.assertIsNone(self.problem.points)
 
+    def test_natural_key(self):
+        d = {"contestId": 374, "index": "A", "name": "Inna and Pink Pony", "type": "PROGRAMMING", "points": 500.0,
+             "tags": ["greedy"]}
+
+        self.problem.load_from_dict(d)
+        same = Problem(dict(d, points=1000.0, tags=[]))
+
+        self.assertEqual(same, self.problem)
+        self.assertEqual(hash(same), hash(self.problem))
+        self.assertEqual(1, len({same, self.problem}))
+        self.assertNotEqual(Problem(dict(d, index="B")), self.problem)
+
+    def test_cached_hash(self):
+        self.problem.load_from_dict({"contestId": 374, "index": "A", "name": "Inna and Pink Pony",
+                                     "type": "PROGRAMMING", "tags": []})
+        Problem.cache_hash = True
+
+        try:
+            value = hash(self.problem)
+            self.problem.index = 'B'
+
+            self.assertEqual(value, hash(self.problem))
+        finally:
+            Problem.cache_hash = False
+
+        self.assertNotEqual(value, hash(self.problem))
+
 
 if __name__ == '__main__':
     unittest.main()
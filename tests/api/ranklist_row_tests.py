@@ -262,6 +262,55 @@ class RanklistRowTests(unittest.TestCase):
 
         self.assertIsNone(self.row.last_submission_time)
 
+    def test_slots(self):
+        d = {
+            "party": {"contestId": 374, "members": [{"handle": "Deception"}], "participantType": "CONTESTANT",
+                      "ghost": False},
+            "rank": 1,
+            "points": 4902.0,
+            "penalty": 0,
+            "successfulHackCount": 11,
+            "unsuccessfulHackCount": 1,
+            "problemResults": [{"points": 312.0, "rejectedAttemptCount": 1, "type": "FINAL"}]
+        }
+
+        self.row.load_from_dict(d)
+        other = RanklistRow(d)
+
+        self.assertFalse(hasattr(self.row, '__dict__'))
+        self.assertRaises(AttributeError, setattr, self.row, 'unknown', 1)
+
+        self.assertEqual(other, self.row)
+        self.assertEqual(hash(other), hash(self.row))
+        self.assertEqual(Party(d['party']), self.row.party)
+        self.assertEqual(other.party, self.row.party)
+        self.assertEqual(other, self.row)
+        self.assertNotEqual(RanklistRow(dict(d, rank=2)), self.row)
+
+    def test_lazy_equality(self):
+        d = {
+            "party": {"contestId": 374, "members": [{"handle": "Deception"}], "participantType": "CONTESTANT",
+                      "ghost": False},
+            "rank": 1,
+            "points": 4902.0,
+            "penalty": 0,
+            "successfulHackCount": 11,
+            "unsuccessfulHackCount": 1,
+            "problemResults": [{"points": 312.0, "rejectedAttemptCount": 1, "type": "FINAL"}]
+        }
+
+        eager = RanklistRow.from_dict(d)
+        eager.party
+        eager.problem_results
+
+        for row in (RanklistRow.from_dict(d), RanklistRow.from_dict(d, lazy=True),
+                    RanklistRow.from_dict(d, validate=False, lazy=True)):
+            self.assertEqual(eager, row)
+            self.assertEqual(row, eager)
+            self.assertEqual(hash(eager), hash(row))
+
+        other = dict(d, problemResults=[{"points": 0.0, "rejectedAttemptCount": 1, "type": "FINAL"}])
+        self.assertNotEqual(eager, RanklistRow.from_dict(other, lazy=True))
 
 if __name__ == '__main__':
     unittest.main()
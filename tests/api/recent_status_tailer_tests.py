@@ -0,0 +1,174 @@
+"""
+This module provides classes for testing RecentStatusTailer and AsyncRecentStatusTailer
+"""
+
+import asyncio
+import unittest
+
+from codeforces import AsyncCodeforcesAPI
+from codeforces import AsyncRecentStatusTailer
+from codeforces import BaseRecentStatusTailer
+from codeforces import CodeforcesAPI
+from codeforces import RecentStatusTailer
+from codeforces import Submission
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
+
+
+class RecentStatusTailerTests(unittest.TestCase):
+    def setUp(self):
+        self.data = make_synthetic_data(contests=1, users=5, submissions_per_contest=20)
+        self.template = self.data['submissions'][0]
+        self.next_id = 10 ** 6
+        self.server = LocalCodeforcesServer(self.data).start()
+        self.api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def submit(self, count, verdict='OK'):
+        submissions = []
+
+        for _ in range(count):
+            self.next_id += 1
+            submissions.append(dict(self.template, id=self.next_id, verdict=verdict))
+
+        self.server.add_submissions(submissions)
+
+        return [s['id'] for s in submissions]
+
+    def test_first_poll_returns_window_in_increasing_order(self):
+        tailer = RecentStatusTailer(self.api, count=10, seen_limit=100)
+
+        ids = [s.id for s in tailer.poll()]
+
+        self.assertEqual(sorted(s['id'] for s in self.data['submissions'])[-10:], ids)
+        self.assertEqual(ids[-1], tailer.high_water_mark)
+
+    def test_overlapping_windows_are_deduplicated(self):
+        tailer = RecentStatusTailer(self.api, count=10, seen_limit=100)
+        tailer.poll()
+
+        new_ids = self.submit(3)
+
+        self.assertEqual(new_ids, [s.id for s in tailer.poll()])
+        self.assertEqual([], tailer.poll())
+        self.assertEqual(0, tailer.overflow_count)
+
+    def test_since_id(self):
+        latest = max(s['id'] for s in self.data['submissions'])
+        tailer = RecentStatusTailer(self.api, count=10, seen_limit=100, since_id=latest)
+
+        self.assertEqual([], tailer.poll())
+        self.assertEqual(self.submit(2), [s.id for s in tailer.poll()])
+
+    def test_overflow_shortens_interval(self):
+        tailer = RecentStatusTailer(self.api, count=5, min_interval=0.5, max_interval=100.0, seen_limit=100)
+        tailer.poll()
+        self.submit(10)
+
+        self.assertEqual(5, len(tailer.poll()))
+        self.assertEqual(1, tailer.overflow_count)
+        self.assertEqual(0.5, tailer.interval)
+
+    def test_interval_backs_off_without_submissions(self):
+        tailer = RecentStatusTailer(self.api, count=5, min_interval=0.5, max_interval=1.5, seen_limit=100)
+        tailer.poll()
+
+        tailer.poll()
+        self.assertEqual(0.0, tailer.rate)
+        self.assertEqual(1.0, tailer.interval)
+
+        tailer.poll()
+        self.assertEqual(1.5, tailer.interval)
+
+    def test_interval_depends_on_rate(self):
+        tailer = RecentStatusTailer(self.api, count=10, min_interval=0.0, max_interval=100.0, seen_limit=100)
+        tailer.poll()
+        self.submit(2)
+        tailer.poll()
+
+        self.assertGreater(tailer.rate, 0)
+        self.assertAlmostEqual(0.5 * 10 / tailer.rate, tailer.interval)
+
+    def test_final_only_holds_back_testing_submissions(self):
+        tailer = RecentStatusTailer(self.api, count=10, seen_limit=100, final_only=True)
+        tailer.poll()
+
+        testing_id, = self.submit(1, verdict='TESTING')
+        judged_id, = self.submit(1)
+
+        self.assertEqual([judged_id], [s.id for s in tailer.poll()])
+
+        for submission in self.data['submissions']:
+            if submission['id'] == testing_id:
+                submission['verdict'] = 'OK'
+
+        self.assertEqual([testing_id], [s.id for s in tailer.poll()])
+
+    def test_forgotten_ids_do_not_skip_testing_submissions(self):
+        tailer = BaseRecentStatusTailer(count=1, seen_limit=2, final_only=True)
+
+        def window(verdict):
+            return [Submission(dict(self.template, id=i, verdict=verdict if i == 2 else 'OK')) for i in (5, 4, 3, 2)]
+
+        self.assertEqual([3, 4, 5], [s.id for s in tailer._accept(window('TESTING'), 1.0)])
+        self.assertEqual([2], [s.id for s in tailer._accept(window('OK'), 2.0)])
+
+    def test_seen_ids_are_bounded(self):
+        tailer = RecentStatusTailer(self.api, count=10, seen_limit=12)
+        tailer.poll()
+        self.submit(5)
+        tailer.poll()
+
+        self.assertEqual(12, len(tailer._seen))
+        self.assertEqual([], tailer.poll())
+
+    def test_iteration(self):
+        tailer = RecentStatusTailer(self.api, count=10, min_interval=0.0, seen_limit=100)
+        result = []
+
+        for submission in tailer:
+            result.append(submission.id)
+
+            if len(result) == 10:
+                expected = self.submit(2)
+            elif len(result) == 12:
+                break
+
+        self.assertEqual(expected, result[10:])
+
+
+class AsyncRecentStatusTailerTests(unittest.TestCase):
+    def test_async_iteration(self):
+        data = make_synthetic_data(contests=1, users=5, submissions_per_contest=20)
+        expected = sorted(s['id'] for s in data['submissions'])[-5:] + [10 ** 6]
+        loop = asyncio.new_event_loop()
+
+        with LocalCodeforcesServer(data) as server:
+            async def run():
+                result = []
+
+                async with AsyncCodeforcesAPI(base_url=server.base_url, rate_limit=None) as api:
+                    tailer = AsyncRecentStatusTailer(api, count=5, min_interval=0.0, seen_limit=100)
+
+                    async for submission in tailer:
+                        result.append(submission.id)
+
+                        if len(result) == 5:
+                            server.add_submissions([dict(data['submissions'][0], id=10 ** 6)])
+                        elif len(result) == 6:
+                            break
+
+                return result
+
+            try:
+                result = loop.run_until_complete(run())
+            finally:
+                loop.close()
+
+        self.assertEqual(expected, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
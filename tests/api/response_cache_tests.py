@@ -0,0 +1,90 @@
+"""
+This module provides classes for testing ResponseCache
+"""
+
+import time
+import unittest
+from unittest import mock
+
+from codeforces import CodeforcesAPI
+from codeforces import ResponseCache
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_get_returns_cached_value(self):
+        cache = ResponseCache()
+        cache.put(('key',), [1, 2, 3], 10, 60)
+
+        self.assertEqual((True, [1, 2, 3]), cache.get(('key',)))
+        self.assertEqual((False, None), cache.get(('other',)))
+        self.assertEqual((1, 1), cache.statistics[:2])
+
+    def test_expired_values_are_not_returned(self):
+        cache = ResponseCache()
+        cache.put(('key',), 'value', 10, 0.01)
+        time.sleep(0.02)
+
+        self.assertEqual((False, None), cache.get(('key',)))
+        self.assertEqual(0, cache.statistics.entries)
+
+    def test_least_recently_used_values_are_evicted_by_size(self):
+        cache = ResponseCache(max_size=100)
+        cache.put(('a',), 'a', 40, 60)
+        cache.put(('b',), 'b', 40, 60)
+        cache.get(('a',))
+        cache.put(('c',), 'c', 40, 60)
+
+        self.assertTrue(cache.get(('a',))[0])
+        self.assertFalse(cache.get(('b',))[0])
+        self.assertTrue(cache.get(('c',))[0])
+        self.assertEqual(1, cache.statistics.evictions)
+        self.assertEqual(80, cache.statistics.size)
+
+    def test_values_larger_than_cache_are_not_stored(self):
+        cache = ResponseCache(max_size=100)
+        cache.put(('a',), 'a', 101, 60)
+
+        self.assertEqual(0, cache.statistics.entries)
+
+    def test_ttl_per_method(self):
+        cache = ResponseCache(ttls={'contest.list': 10}, default_ttl=1)
+
+        self.assertEqual(10, cache.get_ttl('contest.list'))
+        self.assertEqual(1, cache.get_ttl('user.info'))
+        self.assertIsNone(ResponseCache().get_ttl('contest.standings'))
+
+
+class CodeforcesAPIResponseCacheTests(unittest.TestCase):
+    def patch_urlopen_read_method(self, urlopen, answer):
+        urlopen.return_value.__enter__.return_value.read.return_value = answer
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_cached_methods_are_requested_once_for_same_parameters(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, b'{"status": "OK", "result": []}')
+        cache = ResponseCache()
+        api = CodeforcesAPI(rate_limit=None, response_cache=cache)
+
+        api.contest_list()
+        api.contest_list()
+        api.contest_list(gym=True)
+        api.user_info(['tourist', 'Petr'])
+        api.user_info(['tourist', 'Petr'])
+
+        self.assertEqual(4, urlopen.call_count)
+        self.assertEqual((1, 2), cache.statistics[:2])
+
+    @mock.patch('codeforces.api.codeforces_api.urlopen', autospec=True)
+    def test_cache_key_ignores_order_and_signature(self, urlopen):
+        self.patch_urlopen_read_method(urlopen, b'{"status": "OK", "result": []}')
+        cache = ResponseCache(ttls={'user.info': 60})
+        api = CodeforcesAPI(key='key', secret='secret', rate_limit=None, response_cache=cache)
+
+        api.user_info(['tourist', 'Petr'])
+        api.user_info(['Petr', 'tourist'])
+
+        self.assertEqual(1, urlopen.call_count)
+        self.assertEqual(1, cache.statistics.hits)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+This module provides classes for testing RetryPolicy
+"""
+
+import asyncio
+import io
+import unittest
+from urllib.error import HTTPError, URLError
+
+from codeforces import RetryPolicy
+
+
+def http_error(code):
+    return HTTPError('http://codeforces.com/api/user.info', code, '', {}, io.BytesIO())
+
+
+def caused_by(error, cause):
+    error.__cause__ = cause
+    return error
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy()
+
+    def test_retryable_status_codes(self):
+        self.assertTrue(self.policy.is_retryable(http_error(503)))
+        self.assertTrue(self.policy.is_retryable(caused_by(ValueError('Service unavailable'), http_error(503))))
+        self.assertFalse(self.policy.is_retryable(http_error(400)))
+        self.assertFalse(self.policy.is_retryable(caused_by(ValueError('handles: User not found'), http_error(400))))
+
+    def test_retryable_comment_patterns(self):
+        self.assertTrue(self.policy.is_retryable(caused_by(ValueError('Call limit exceeded'), http_error(400))))
+        self.assertFalse(self.policy.is_retryable(ValueError('Missed required field', 'status')))
+
+        policy = RetryPolicy(retryable_comment_patterns=['^Internal'])
+
+        self.assertTrue(policy.is_retryable(ValueError('Internal error')))
+        self.assertFalse(policy.is_retryable(ValueError('Call limit exceeded')))
+
+    def test_network_errors_are_retryable(self):
+        self.assertTrue(self.policy.is_retryable(URLError('timed out')))
+        self.assertTrue(self.policy.is_retryable(ConnectionResetError()))
+        self.assertFalse(self.policy.is_retryable(KeyError('result')))
+
+    def test_async_network_errors_are_retryable(self):
+        self.assertTrue(self.policy.is_retryable(asyncio.IncompleteReadError(b'{"status"', 100)))
+        self.assertTrue(self.policy.is_retryable(asyncio.TimeoutError()))
+
+    def test_delay_grows_exponentially_up_to_maximum(self):
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=3, jitter=0)
+
+        self.assertEqual([0.5, 1, 2, 3, 3], [policy.get_delay(attempt) for attempt in range(1, 6)])
+
+    def test_jitter_shortens_delay(self):
+        policy = RetryPolicy(backoff_base=1, jitter=0.5)
+
+        for _ in range(100):
+            self.assertTrue(0.5 <= policy.get_delay(1) <= 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
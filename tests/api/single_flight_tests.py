@@ -0,0 +1,134 @@
+"""
+This module provides classes for testing SingleFlight and AsyncSingleFlight
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from codeforces import AsyncCodeforcesAPI
+from codeforces import AsyncSingleFlight
+from codeforces import CodeforcesAPI
+from codeforces import SingleFlight
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
+
+
+class SingleFlightTests(unittest.TestCase):
+    def run_concurrently(self, function, count=5):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(function())) for _ in range(count)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    def test_concurrent_calls_are_shared(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return 42
+
+        results = self.run_concurrently(lambda: single_flight.do('key', slow))
+
+        self.assertEqual([42] * 5, results)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(4, single_flight.shared_count)
+
+    def test_sequential_calls_are_not_shared(self):
+        single_flight = SingleFlight()
+
+        self.assertEqual(1, single_flight.do('key', lambda: 1))
+        self.assertEqual(2, single_flight.do('key', lambda: 2))
+        self.assertEqual(0, single_flight.shared_count)
+
+    def test_exception_is_shared(self):
+        single_flight = SingleFlight()
+        errors = []
+
+        def fail():
+            time.sleep(0.2)
+            raise ValueError('failed')
+
+        def call():
+            try:
+                single_flight.do('key', fail)
+            except ValueError as e:
+                errors.append(e)
+
+        self.run_concurrently(call, count=3)
+
+        self.assertEqual(3, len(errors))
+
+    def test_api_requests_are_coalesced(self):
+        with LocalCodeforcesServer(make_synthetic_data(contests=1, users=5, submissions_per_contest=1),
+                                   latency=0.2) as server:
+            api = CodeforcesAPI(base_url=server.base_url, rate_limit=None)
+
+            results = self.run_concurrently(lambda: list(api.contest_standings(500)['rows']))
+
+            self.assertEqual(1, server.request_count)
+            self.assertEqual([5] * 5, [len(r) for r in results])
+
+
+class AsyncSingleFlightTests(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_concurrent_calls_are_shared(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return 42
+
+        async def run():
+            return await asyncio.gather(*[single_flight.do('key', slow) for _ in range(5)])
+
+        self.assertEqual([42] * 5, self.loop.run_until_complete(run()))
+        self.assertEqual(1, len(calls))
+        self.assertEqual(4, single_flight.shared_count)
+
+    def test_exception_is_shared(self):
+        single_flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.1)
+            raise ValueError('failed')
+
+        async def run():
+            return await asyncio.gather(*[single_flight.do('key', fail) for _ in range(3)], return_exceptions=True)
+
+        errors = self.loop.run_until_complete(run())
+
+        self.assertEqual(3, len(errors))
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+
+    def test_api_requests_are_coalesced(self):
+        with LocalCodeforcesServer(make_synthetic_data(contests=1, users=5, submissions_per_contest=1),
+                                   latency=0.1) as server:
+            async def run():
+                async with AsyncCodeforcesAPI(base_url=server.base_url, rate_limit=None) as api:
+                    return await asyncio.gather(*[api.user_info(['user1', 'user2']) for _ in range(5)])
+
+            results = self.loop.run_until_complete(run())
+
+            self.assertEqual(1, server.request_count)
+            self.assertEqual([['user1', 'user2']] * 5, [[u.handle for u in r] for r in results])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+This module provides classes for testing StandingsWatcher
+"""
+
+import unittest
+
+from codeforces import ChangeDetector
+from codeforces import CodeforcesAPI
+from codeforces import ContestPhase
+from codeforces import StandingsWatcher
+from codeforces.testing import LocalCodeforcesServer
+from codeforces.testing import make_synthetic_data
+
+
+class StandingsWatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.data = make_synthetic_data(contests=1, users=10, submissions_per_contest=50)
+        self.data['contests'][0]['phase'] = 'CODING'
+        self.rows = self.data['ranklistRows']
+        self.server = LocalCodeforcesServer(self.data).start()
+        self.api = CodeforcesAPI(base_url=self.server.base_url, rate_limit=None, change_detector=ChangeDetector())
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_first_poll_reports_all_rows(self):
+        watcher = StandingsWatcher(self.api, 500)
+
+        update = watcher.poll()
+
+        self.assertEqual(500, update.contest.id)
+        self.assertEqual(10, len(update.changes))
+        self.assertTrue(all(change.is_new for change in update.changes))
+        self.assertEqual(list(range(1, 11)), [change.row.rank for change in update.changes])
+
+    def test_unchanged_standings(self):
+        watcher = StandingsWatcher(self.api, 500)
+        watcher.poll()
+
+        update = watcher.poll()
+
+        self.assertEqual([], update.changes)
+        self.assertEqual([], update.removed)
+
+    def test_changed_rows(self):
+        watcher = StandingsWatcher(self.api, 500)
+        watcher.poll()
+
+        first, second = self.rows[0], self.rows[1]
+        first['rank'], second['rank'] = 2, 1
+        second['points'] += 1000.0
+        second['problemResults'][4]['points'] = 1000.0
+        first['successfulHackCount'] += 1
+
+        update = watcher.poll()
+        changes = {change.row.party.members[0].handle: change for change in update.changes}
+
+        self.assertEqual(2, len(update.changes))
+        self.assertEqual(1, changes[second['party']['members'][0]['handle']].rank_delta)
+        self.assertEqual(1000.0, changes[second['party']['members'][0]['handle']].points_delta)
+        self.assertEqual([4], changes[second['party']['members'][0]['handle']].changed_problems)
+        self.assertEqual(-1, changes[first['party']['members'][0]['handle']].rank_delta)
+        self.assertTrue(changes[first['party']['members'][0]['handle']].hacks_changed)
+        self.assertFalse(changes[second['party']['members'][0]['handle']].hacks_changed)
+
+    def test_removed_rows(self):
+        watcher = StandingsWatcher(self.api, 500)
+        watcher.poll()
+
+        removed = self.rows.pop()
+        update = watcher.poll()
+
+        self.assertEqual([], update.changes)
+        self.assertEqual([removed['party']['members'][0]['handle']],
+                         [row.party.members[0].handle for row in update.removed])
+
+    def test_interval_depends_on_phase(self):
+        watcher = StandingsWatcher(self.api, 500, intervals={ContestPhase.coding: 1.5})
+
+        self.assertEqual(0.0, watcher.interval)
+
+        watcher.poll()
+        self.assertEqual(1.5, watcher.interval)
+
+        self.data['contests'][0]['phase'] = 'SYSTEM_TEST'
+        watcher.poll()
+        self.assertEqual(StandingsWatcher.DEFAULT_INTERVALS[ContestPhase.system_test], watcher.interval)
+
+    def test_watch_stops_when_contest_is_finished(self):
+        watcher = StandingsWatcher(self.api, 500, intervals={ContestPhase.coding: 0.01})
+        updates = []
+
+        for update in watcher.watch():
+            updates.append(update)
+
+            if len(updates) == 1:
+                self.rows[0]['points'] += 1.0
+            else:
+                self.data['contests'][0]['phase'] = 'FINISHED'
+                self.rows[0]['points'] += 1.0
+
+        self.assertEqual([10, 1, 1], [len(update.changes) for update in updates])
+        self.assertEqual(ContestPhase.finished, updates[-1].contest.phase)
+
+
+if __name__ == '__main__':
+    unittest.main()
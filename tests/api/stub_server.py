@@ -0,0 +1,66 @@
+"""
+This module provides local HTTP server for tests, which keeps connections alive
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+        self.server.requests.append((self.path, dict(self.headers)))
+
+        status, body = self.server.respond(self.path)
+        data = json.dumps(body).encode('utf-8') if not isinstance(body, bytes) else body
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+
+        if self.server.chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+
+            for i in range(0, len(data), 7):
+                chunk = data[i:i + 7]
+                self.wfile.write('{:x}\r\n'.format(len(chunk)).encode('ascii') + chunk + b'\r\n')
+
+            self.wfile.write(b'0\r\n\r\n')
+        else:
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    """
+    Serves responses made by respond function, which takes requested path and returns status and body
+    """
+    daemon_threads = True
+
+    def __init__(self, respond, chunked=False):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.respond = respond
+        self.chunked = chunked
+        self.client_ports = set()
+        self.requests = []
+
+    @property
+    def base(self):
+        return 'http://127.0.0.1:{}/'.format(self.server_address[1])
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
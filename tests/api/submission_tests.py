@@ -250,6 +250,172 @@ class SubmissionTests(unittest.TestCase):
 
         self.assertIsNone(self.submission.verdict)
 
+    def test_validation(self):
+        d = {
+            "id": 7268482,
+            "contestId": 452,
+            "creationTimeSeconds": 1406487265,
+            "relativeTimeSeconds": 6865,
+            "problem": {},
+            "author": {},
+            "programmingLanguage": 42,
+            "testset": "TESTS",
+            "passedTestCount": "67",
+            "timeConsumedMillis": 343,
+            "memoryConsumedBytes": 34816000
+        }
+
+        self.assertRaises(AssertionError, self.submission.load_from_dict, d)
+
+        Submission.validate = False
+
+        try:
+            self.submission.load_from_dict(d)
+        finally:
+            del Submission.validate
+
+        self.assertEqual(42, self.submission.programming_language)
+        self.assertEqual(67, self.submission.passed_test_count)
+        self.assertEqual(TestsetType.tests, self.submission.testset)
+
+    def test_nested_validation(self):
+        d = {
+            "id": 7268482,
+            "contestId": 452,
+            "creationTimeSeconds": 1406487265,
+            "relativeTimeSeconds": 6865,
+            "problem": {"contestId": 452, "index": "F", "name": 42, "type": "PROGRAMMING", "points": 3000.0,
+                        "tags": ["data structures"]},
+            "author": {"contestId": 452, "members": [{"handle": 5}], "participantType": "CONTESTANT",
+                       "ghost": False, "startTimeSeconds": 1406480400},
+            "programmingLanguage": "GNU C++",
+            "verdict": "OK",
+            "testset": "TESTS",
+            "passedTestCount": 67,
+            "timeConsumedMillis": 343,
+            "memoryConsumedBytes": 34816000
+        }
+
+        self.assertRaises(AssertionError, lambda: Submission.from_dict(d).problem)
+        self.assertRaises(AssertionError, lambda: Submission.from_dict(d).author)
+
+        submission = Submission.from_dict(d, validate=False)
+
+        self.assertEqual(42, submission.problem.name)
+        self.assertEqual(5, submission.author.members[0].handle)
+
+        submission = Submission.from_dict(d, validate=False)
+
+        # Trusted values are stored as is, so that loading is not slower than the validated one
+        self.assertIs(d['problem'], submission._lazy_problem)
+        self.assertIs(d['author'], submission._lazy_author)
+
+        submission.problem = d['problem']
+
+        self.assertRaises(AssertionError, lambda: submission.problem)
+
+    def test_lazy(self):
+        d = {
+            "id": 7268482,
+            "contestId": 452,
+            "creationTimeSeconds": 1406487265,
+            "relativeTimeSeconds": 6865,
+            "problem": {"contestId": 452, "index": "E", "name": "Three strings", "type": "PROGRAMMING", "tags": []},
+            "author": {"contestId": 452, "members": [{"handle": "Fefer_Ivan"}], "participantType": "CONTESTANT",
+                       "ghost": False},
+            "programmingLanguage": "GNU C++0x",
+            "verdict": "OK",
+            "testset": "TESTS",
+            "passedTestCount": 67,
+            "timeConsumedMillis": 343,
+            "memoryConsumedBytes": 34816000
+        }
+
+        submission = Submission.from_dict(d, lazy=True)
+
+        self.assertIsInstance(submission, Submission)
+        self.assertFalse(hasattr(submission, '_verdict'))
+        self.assertEqual(VerdictType.ok, submission.verdict)
+        self.assertFalse(hasattr(submission, '_testset'))
+
+        self.assertEqual("E", submission.problem.index)
+        self.assertFalse(hasattr(submission.problem, '_name'))
+        self.assertEqual("Fefer_Ivan", submission.author.members[0].handle)
+
+        submission.passed_test_count = 1
+        self.assertEqual(1, submission.passed_test_count)
+
+        self.assertEqual(Submission(d), submission)
+        self.assertEqual(hash(Submission(d)), hash(submission))
+
+    def test_lazy_missed_required_field(self):
+        submission = Submission.from_dict({"id": 7268482}, lazy=True)
+
+        self.assertEqual(7268482, submission.id)
+        self.assertRaises(ValueError, getattr, submission, 'contest_id')
+
+    def test_missed_required_field(self):
+        self.assertRaises(ValueError, self.submission.load_from_dict, {"id": 7268482})
+
+    def test_overridden_load_hooks(self):
+        class HookedSubmission(Submission):
+            def load_required_fields_from_dict(self, values):
+                super().load_required_fields_from_dict(values)
+                self.hooks = ['required']
+
+            def load_optional_fields_from_dict(self, values):
+                super().load_optional_fields_from_dict(values)
+                self.hooks.append('optional')
+
+        d = {
+            "id": 7268482,
+            "contestId": 452,
+            "creationTimeSeconds": 1406487265,
+            "relativeTimeSeconds": 6865,
+            "problem": {"contestId": 452, "index": "F", "name": "Permutation", "type": "PROGRAMMING",
+                        "tags": ["data structures"]},
+            "author": {"contestId": 452, "members": [{"handle": "Deception"}], "participantType": "CONTESTANT",
+                       "ghost": False},
+            "programmingLanguage": "GNU C++",
+            "testset": "TESTS",
+            "passedTestCount": 67,
+            "timeConsumedMillis": 343,
+            "memoryConsumedBytes": 34816000
+        }
+
+        for submission in (HookedSubmission(d), HookedSubmission.from_dict(d, validate=False),
+                           HookedSubmission.from_dict(d, lazy=True)):
+            self.assertIs(HookedSubmission, type(submission))
+            self.assertEqual(['required', 'optional'], submission.hooks)
+            self.assertEqual(Submission(d)._get_fields(), submission._get_fields())
+
+        self.assertRaises(ValueError, HookedSubmission, {"id": 7268482})
+
+    def test_load_fields_by_setters(self):
+        d = {
+            "id": 7268482,
+            "contestId": 452,
+            "creationTimeSeconds": 1406487265,
+            "relativeTimeSeconds": 6865,
+            "problem": {"contestId": 452, "index": "F", "name": "Permutation", "type": "PROGRAMMING",
+                        "tags": ["data structures"]},
+            "author": {"contestId": 452, "members": [{"handle": "Deception"}], "participantType": "CONTESTANT",
+                       "ghost": False},
+            "programmingLanguage": "GNU C++",
+            "testset": "TESTS",
+            "passedTestCount": 67,
+            "timeConsumedMillis": 343,
+            "memoryConsumedBytes": 34816000
+        }
+
+        self.submission.load_required_fields_from_dict(d)
+        self.submission.load_optional_fields_from_dict(d)
+
+        self.assertEqual(Submission(d)._get_fields(), self.submission._get_fields())
+        self.assertIsNone(self.submission.verdict)
+        self.assertRaises(KeyError, Submission().load_required_fields_from_dict, {"id": 7268482})
+        self.assertRaises(AssertionError, Submission().load_required_fields_from_dict, dict(d, testset=42))
+
 
 if __name__ == '__main__':
     unittest.main()
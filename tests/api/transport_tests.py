@@ -0,0 +1,118 @@
+"""
+This module provides classes for testing RecordingTransport and ReplayTransport
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from urllib.error import HTTPError
+
+from codeforces import CodeforcesAPI
+from codeforces import RecordingTransport
+from codeforces import ReplayTransport
+from codeforces import Transport
+from codeforces import TransportResponse
+
+
+class FakeTransport(Transport):
+    def __init__(self, responses):
+        self.responses = responses
+        self.urls = []
+
+    def urlopen(self, url, headers=None):
+        self.urls.append(url)
+        status, body = self.responses[url.split('?')[0].rsplit('/', 1)[1]]
+        response = TransportResponse(status, 'OK' if status == 200 else 'Bad Request', {}, body)
+
+        if status >= 400:
+            raise HTTPError(url, status, response.reason, response.headers, response)
+
+        return response
+
+
+class RecordReplayTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cassette = os.path.join(self.directory, 'cassette.json')
+
+        fixture = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures', 'contest.ratingChanges.json')
+
+        with open(fixture, 'rb') as f:
+            self.rating_changes = f.read()
+
+        self.fake = FakeTransport({
+            'contest.ratingChanges': (200, self.rating_changes),
+            'contest.hacks': (400, b'{"status": "FAILED", "comment": "contestId: Contest with id 0 not found"}')
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def record(self):
+        with RecordingTransport(self.cassette, self.fake) as transport:
+            api = CodeforcesAPI(key='key', secret='secret', rate_limit=None, retry_policy=None, transport=transport)
+            recorded = list(api.contest_rating_changes(42))
+
+            with self.assertRaises(ValueError):
+                api.contest_hacks(0)
+
+        return recorded
+
+    def test_replay_serves_recorded_responses(self):
+        recorded = self.record()
+
+        api = CodeforcesAPI(key='other', secret='secret', rate_limit=None, retry_policy=None,
+                            transport=ReplayTransport(self.cassette))
+
+        self.assertEqual(recorded, list(api.contest_rating_changes(42)))
+
+        with self.assertRaises(ValueError) as cm:
+            api.contest_hacks(0)
+
+        self.assertEqual('contestId: Contest with id 0 not found', cm.exception.args[0])
+        self.assertIsInstance(cm.exception.__cause__, HTTPError)
+        self.assertEqual(2, len(self.fake.urls))
+
+    def test_signature_is_not_recorded(self):
+        self.record()
+
+        with open(self.cassette, 'r', encoding='utf-8') as f:
+            cassette = f.read()
+
+        self.assertNotIn('apiSig', cassette)
+        self.assertNotIn('apiKey', cassette)
+
+    def test_not_recorded_request_raises_value_error(self):
+        self.record()
+        transport = ReplayTransport(self.cassette)
+
+        with self.assertRaises(ValueError):
+            transport.urlopen('http://codeforces.com/api/contest.ratingChanges?contestId=43')
+
+    def test_replay_simulates_latency(self):
+        self.record()
+        transport = ReplayTransport(self.cassette, latency=0.05)
+
+        start = time.monotonic()
+        transport.urlopen('http://codeforces.com/api/contest.ratingChanges?contestId=42').close()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_repeated_requests_are_served_in_recorded_order(self):
+        fake = FakeTransport({'user.status': (200, b'1')})
+
+        with RecordingTransport(self.cassette, fake) as transport:
+            transport.urlopen('http://codeforces.com/api/user.status?handle=tourist').read()
+            fake.responses['user.status'] = (200, b'2')
+            transport.urlopen('http://codeforces.com/api/user.status?handle=tourist').read()
+
+        transport = ReplayTransport(self.cassette)
+        url = 'http://codeforces.com/api/user.status?handle=tourist'
+
+        self.assertEqual([b'1', b'2', b'2'], [transport.urlopen(url).read() for _ in range(3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
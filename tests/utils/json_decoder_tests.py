@@ -0,0 +1,56 @@
+"""
+This module provides classes for testing JsonDecoder
+"""
+
+import unittest
+
+from codeforces.utils import JsonDecoder
+from codeforces.utils import get_default_json_decoder
+from codeforces.utils import set_default_json_decoder
+from codeforces.api.json_objects import User
+
+
+class JsonDecoderTests(unittest.TestCase):
+    document = '{"status": "OK", "result": [{"handle": "Ы", "rating": 1500, "score": 1.5, "friend": null}]}'
+
+    def get_available_backends(self):
+        return [backend for backend in JsonDecoder.BACKENDS if JsonDecoder.is_available(backend)]
+
+    def test_backends_decode_bytes_and_str(self):
+        expected = {'status': 'OK', 'result': [{'handle': 'Ы', 'rating': 1500, 'score': 1.5, 'friend': None}]}
+
+        for backend in self.get_available_backends():
+            decoder = JsonDecoder(backend)
+
+            self.assertEqual(backend, decoder.backend)
+            self.assertEqual(expected, decoder.loads(self.document))
+            self.assertEqual(expected, decoder.loads(self.document.encode('utf-8')))
+
+    def test_invalid_document_raises_value_error(self):
+        for backend in self.get_available_backends():
+            with self.assertRaises(ValueError):
+                JsonDecoder(backend).loads(b'<html></html>')
+
+    def test_fastest_backend_is_default(self):
+        self.assertEqual(self.get_available_backends()[0], JsonDecoder().backend)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            JsonDecoder('yaml')
+
+    def test_default_decoder_is_used_by_json_objects(self):
+        default = get_default_json_decoder()
+        set_default_json_decoder(JsonDecoder('json'))
+
+        try:
+            user = User(b'{"handle": "tourist", "contribution": 0, "rank": "legendary grandmaster", "rating": 3500, '
+                        b'"maxRank": "legendary grandmaster", "maxRating": 3500, "lastOnlineTimeSeconds": 0, '
+                        b'"registrationTimeSeconds": 0}')
+        finally:
+            set_default_json_decoder(default)
+
+        self.assertEqual('tourist', user.handle)
+
+
+if __name__ == '__main__':
+    unittest.main()
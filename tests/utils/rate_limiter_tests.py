@@ -0,0 +1,65 @@
+"""
+This module provides classes for testing TokenBucket
+"""
+
+import threading
+import time
+import unittest
+
+from codeforces.utils import TokenBucket
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_is_available_immediately(self):
+        bucket = TokenBucket(rate=1, burst=3)
+
+        self.assertEqual([0.0, 0.0, 0.0], [bucket.reserve() for _ in range(3)])
+
+    def test_waiting_requests_are_spaced_by_rate(self):
+        bucket = TokenBucket(rate=10, burst=1)
+        bucket.reserve()
+
+        delays = [bucket.reserve() for _ in range(3)]
+
+        for expected, actual in zip([0.1, 0.2, 0.3], delays):
+            self.assertAlmostEqual(expected, actual, delta=0.01)
+
+    def test_acquire_limits_rate_across_threads(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        times = []
+
+        def worker():
+            for _ in range(5):
+                bucket.acquire()
+                times.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        start = time.monotonic()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(20, len(times))
+        self.assertGreaterEqual(max(times) - start, 19 / 50 - 0.01)
+
+    def test_shared_bucket_is_reused(self):
+        bucket = TokenBucket.shared('rate_limiter_tests', 2, 1)
+
+        self.assertIs(bucket, TokenBucket.shared('rate_limiter_tests', 2, 1))
+        self.assertIsNot(bucket, TokenBucket.shared('rate_limiter_tests_other', 2, 1))
+
+    def test_shared_bucket_keeps_strictest_configuration(self):
+        bucket = TokenBucket.shared('rate_limiter_tests_strictest', 2, 3)
+
+        with self.assertWarns(RuntimeWarning):
+            self.assertIs(bucket, TokenBucket.shared('rate_limiter_tests_strictest', 5, 1))
+
+        self.assertEqual(2, bucket.rate)
+        self.assertEqual(1, bucket.burst)
+
+
+if __name__ == '__main__':
+    unittest.main()